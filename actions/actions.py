@@ -5,13 +5,12 @@ import os
 import json
 import csv
 import sys
-import pandas as pd
+import asyncio
 import logging
 from typing import Any, Text, Dict, List
 from rasa_sdk import Action, Tracker, FormValidationAction
 from rasa_sdk.executor import CollectingDispatcher
 from rasa_sdk.events import SlotSet, FollowupAction, AllSlotsReset
-from difflib import get_close_matches
 from rasa_sdk.events import UserUtteranceReverted
 
 # Set up logging
@@ -28,15 +27,221 @@ except ImportError:
     herkey_search_available = False
     logger.error("Failed to import HerkeyJobSearch - job search will use fallback methods")
 
+from utils.job_index import JobIndex
+from utils.faq_matcher import FAQMatcher
+from utils.event_catalog import EventCatalog, resolve_date_range
+from utils.tiered_search import TieredJobSearch
+from utils.cache_warmer import CacheWarmer, JOB_PREWARM_ENABLED
+from utils.metrics import instrument_action
+from utils.gazetteer import Gazetteer
+from utils.location_service import LocationService
+from utils.job_cursors import JobCursorStore
+
+# Shared search engine so every turn reuses the same pooled HTTP client
+_herkey_search_engine = None
+
+def get_herkey_search_engine():
+    """Return the process-wide HerkeyJobSearch instance, creating it on first use."""
+    global _herkey_search_engine
+    if _herkey_search_engine is None:
+        _herkey_search_engine = HerkeyJobSearch()
+    return _herkey_search_engine
+
+# Directory holding the job, FAQ and event data; point it elsewhere to run against generated datasets
+DATA_DIR = os.getenv("ASHA_DATA_DIR", os.path.join(os.getcwd(), "data"))
+
+# Indian cities, states and their aliases; resolves typed locations to the ids the job index filters on
+location_service = LocationService.from_file(
+    os.getenv("LOCATIONS_PATH", os.path.join(os.getcwd(), "data", "locations.json"))
+)
+
+# Job listings are indexed once at startup and reloaded when the CSV changes
+job_index = JobIndex(os.path.join(DATA_DIR, "job_listing_data.csv"), location_service=location_service)
+try:
+    job_index.load()
+except Exception as e:
+    logger.error(f"Error loading job index: {str(e)}")
+
+# Role and seniority synonyms plus the location service's places, compiled once into a single matcher shared by all actions
+gazetteer = Gazetteer.from_file(
+    os.getenv("GAZETTEER_PATH", os.path.join(os.getcwd(), "data", "gazetteer.json")),
+    location_service=location_service
+)
+
+# Events and sessions are parsed and sorted once, then refreshed when the file changes
+event_catalog = EventCatalog(os.path.join(DATA_DIR, "Session Details.json"))
+
+# Number of jobs shown per search
+JOB_RESULTS_PAGE_SIZE = 5
+
+# Each sender's last ranked results, so "show more" pages through them without searching again
+job_cursors = JobCursorStore()
+
+# Job fields sent to the web widget, which renders them as cards; empty fields are left out
+JOB_CARD_FIELDS = ("title", "company", "location", "type", "posted_date", "url")
+
+def job_from_row(job):
+    """Convert a job index row into the job dictionary used by every tier."""
+    # Create a job URL slug
+    job_slug = str(job['title']).lower().replace(' ', '-')
+    return {
+        # Row id in the index snapshot; stable until the listing file changes
+        "id": int(job.name),
+        "title": job['title'],
+        "company": job['company'],
+        "location": job['location'],
+        "type": job.get('job_type', ''),
+        "url": f"https://herkey.com/jobs/apply/{job_slug}"
+    }
+
+async def search_local_jobs(job_role=None, location=None, experience=None, job_type=None, skill=None):
+    """Search the in-memory job index built from the listing CSV."""
+    # Picks up edits to the CSV without re-reading it on every request
+    snapshot = await job_index.refresh()
+    if snapshot is None:
+        logger.warning(f"Job listing CSV file not found at {job_index.data_path}")
+        return [], 0, None
+    
+    loop = asyncio.get_running_loop()
+    ranked = await loop.run_in_executor(
+        None, job_index.search_ids, job_role, location, experience, job_type, skill
+    )
+    if not len(ranked.ids):
+        logger.warning(f"No jobs found in CSV matching criteria: role={job_role}, location={location}")
+    # Only the first page is rendered; the ranked ids are kept for the next ones
+    rows = job_index.rows(ranked, 0, JOB_RESULTS_PAGE_SIZE)
+    jobs = [job_from_row(job) for _, job in rows.iterrows()] if rows is not None else []
+    return jobs, len(ranked.ids), ranked
+
+async def jobs_for_page(sender_id, page):
+    """Render the jobs of a page taken from a cursor; None if the index changed since the search."""
+    cursor = page.cursor
+    if cursor.ranked is None:
+        return cursor.jobs[page.start:page.stop]
+
+    ids = JobCursorStore.page_ids(cursor, page.start, page.stop)
+    if ids is None:
+        # Past the ids kept with the cursor: rank the stored query again and keep the next window
+        if cursor.query is None:
+            return None
+        loop = asyncio.get_running_loop()
+        ranked = await loop.run_in_executor(None, job_index.search_ids, *cursor.query)
+        if ranked.digest != cursor.ranked.digest:
+            return None
+        cursor = job_cursors.refill(sender_id, ranked, page.start) or cursor._replace(
+            ranked=ranked, first=0
+        )
+        ids = JobCursorStore.page_ids(cursor, page.start, page.stop)
+
+    rows = job_index.rows(cursor.ranked._replace(ids=ids))
+    if rows is None:
+        return None
+    return [job_from_row(job) for _, job in rows.iterrows()]
+
+def get_mock_jobs(job_role=None, location=None):
+    """Build mock job listings as the final fallback."""
+    job_role_slug = job_role.lower().replace(' ', '-') if job_role else "job"
+    job_title = job_role.title() if job_role else "Software Developer"
+    job_location = location.title() if location else "Bangalore"
+    
+    return [
+        {
+            "title": f"Senior {job_title}",
+            "company": "TechCorp",
+            "location": job_location,
+            "type": "Full-time",
+            "posted_date": "1 week ago",
+            "url": f"https://herkey.com/jobs/apply/{job_role_slug}-senior"
+        },
+        {
+            "title": f"{job_title} - Machine Learning",
+            "company": "Amazon",
+            "location": job_location,
+            "type": "Full-time",
+            "posted_date": "3 days ago",
+            "url": f"https://herkey.com/jobs/apply/{job_role_slug}-machine-learning-amazon"
+        },
+        {
+            "title": f"{job_title} (Retail Analytics)",
+            "company": "Flipkart",
+            "location": job_location,
+            "type": "Full-time",
+            "posted_date": "2 days ago",
+            "url": f"https://herkey.com/jobs/apply/{job_role_slug}-retail-analytics-flipkart"
+        },
+        {
+            "title": f"Applied Scientist",
+            "company": "Microsoft",
+            "location": job_location,
+            "type": "Full-time",
+            "posted_date": "5 days ago",
+            "url": f"https://herkey.com/jobs/apply/applied-scientist-microsoft"
+        },
+        {
+            "title": f"Data Analyst - Business Intelligence",
+            "company": "Accenture",
+            "location": job_location,
+            "type": "Full-time",
+            "posted_date": "1 day ago",
+            "url": f"https://herkey.com/jobs/apply/data-analyst-business-intelligence-accenture"
+        }
+    ]
+
+def job_results_payload(jobs, first, total, source=None):
+    """
+    Build the compact `custom` payload the web widget renders as job cards.
+
+    Args:
+        jobs (list): Job dictionaries of one page, from any tier
+        first (int): 1-based position of the first job in the full result
+        total (int): Number of jobs in the full result
+        source (str, optional): Identifies the listing version the ids belong
+            to; the widget only reuses cached cards when it is set
+    """
+    cards = []
+    for n, job in enumerate(jobs):
+        card = {"id": job.get("id", first + n)}
+        card.update((field, str(job[field])) for field in JOB_CARD_FIELDS if job.get(field))
+        cards.append(card)
+    return {"job_results": {"source": source, "first": first, "total": total, "jobs": cards}}
+
+def ranked_source(ranked):
+    """Short listing version for a local-tier ranking, None for other tiers."""
+    return ranked.digest[:12] if ranked is not None else None
+
+_tiered_job_search = None
+_cache_warmer = None
+
+def get_tiered_job_search():
+    """Return the process-wide tiered job search, creating it on first use."""
+    global _tiered_job_search, _cache_warmer
+    if _tiered_job_search is None:
+        remote = None
+        if herkey_search_available:
+            search_engine = get_herkey_search_engine()
+            if search_engine.api_key:
+                remote = search_engine.fetch_jobs
+                if JOB_PREWARM_ENABLED:
+                    # Keep popular role/city results cached so most searches skip Gemini
+                    _cache_warmer = CacheWarmer(search_engine)
+                    _cache_warmer.start()
+            else:
+                logger.warning("Gemini API key not set")
+        else:
+            logger.warning("HerkeyJobSearch not available")
+        _tiered_job_search = TieredJobSearch(remote, search_local_jobs, get_mock_jobs)
+    return _tiered_job_search
+
 class ActionSearchJobs(Action):
     """Action to search for jobs based on user preferences."""
 
     def name(self) -> Text:
         return "action_search_jobs"
 
-    def run(self, dispatcher: CollectingDispatcher,
-            tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+    @instrument_action
+    async def run(self, dispatcher: CollectingDispatcher,
+                  tracker: Tracker,
+                  domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         """Search for jobs matching user criteria and return results."""
 
         # Special case for API testing from frontend
@@ -45,12 +250,12 @@ class ActionSearchJobs(Action):
             # Test Gemini API connection
             if herkey_search_available:
                 try:
-                    search_engine = HerkeyJobSearch()
+                    search_engine = get_herkey_search_engine()
                     if search_engine.api_key:
                         logger.info("Gemini API key is present")
                         # Just make a small test request
                         try:
-                            test_jobs = search_engine.search_jobs("test", "test", "1")
+                            test_jobs = await search_engine.search_jobs("test", "test", "1")
                             if test_jobs and len(test_jobs) > 0:
                                 logger.info("Gemini API test successful, working with: " + search_engine.api_key[:5] + "...")
                         except Exception as e:
@@ -70,278 +275,110 @@ class ActionSearchJobs(Action):
         job_type = tracker.get_slot("job_type")
         skill = tracker.get_slot("skill")
         
-        # Check latest message to update job_role if needed
-        latest_message = tracker.latest_message.get('text', '').lower()
-        if 'data science' in latest_message or 'scientist' in latest_message:
-            job_role = 'data science'
-        elif 'software' in latest_message and ('engineer' in latest_message or 'engineering' in latest_message or 'developer' in latest_message):
-            job_role = 'software developer'
-        elif 'ai' in latest_message and 'engineer' in latest_message:
-            job_role = 'ai engineer'
+        # Fill missing criteria from the latest message; a role the user already gave is only
+        # replaced by an unambiguous one ("data scientist", not "lead a design team")
+        message = tracker.latest_message.get('text', '')
+        mentioned = gazetteer.extract(message)
+        job_role = gazetteer.explicit_role(message) or job_role or mentioned.role
+        location = location or mentioned.location
+        experience = experience or mentioned.experience
         
         logger.info(f"Searching for jobs with criteria: role={job_role}, location={location}, experience={experience}")
         
-        # First method: Try to use HerkeyJobSearch class with Gemini API
-        if herkey_search_available:
-            try:
-                # Initialize the search engine
-                search_engine = HerkeyJobSearch()
-                
-                # Check if API key is available
-                if search_engine.api_key:
-                    logger.info("Using Gemini API for job search")
-                    # Perform the search with proper error handling
-                    try:
-                        herkey_jobs = search_engine.search_jobs(job_role, location, experience)
-                        
-                        if herkey_jobs and len(herkey_jobs) > 0:
-                            # Found jobs through API
-                            job_count = len(herkey_jobs)
-                            logger.info(f"Found {job_count} jobs through Gemini API")
-                            
-                            job_results = ""
-                            for job in herkey_jobs:
-                                job_results += f"- {job['title']} at {job['company']} ({job['location']})\n"
-                                if 'type' in job and job['type']:
-                                    job_results += f"  {job['type']}"
-                                if 'posted_date' in job and job['posted_date']:
-                                    job_results += f" | Posted: {job['posted_date']}"
-                                
-                                # Add Apply Now button with proper HTML formatting
-                                job_results += f"\n  [<a href='{job['url']}' target='_blank' class='apply-btn'>Apply Now</a>]\n\n"
-                            
-                            # Log the formatted results for debugging
-                            logger.debug(f"Formatted job results: {job_results[:200]}...")
-                            
-                            # Respond with the results
-                            dispatcher.utter_message(
-                                template="utter_job_results", 
-                                count=job_count, 
-                                job_results=job_results
-                            )
-                            return []
-                        else:
-                            logger.warning("No jobs returned from Gemini API")
-                    except Exception as e:
-                        logger.error(f"Error with Gemini API job search: {str(e)}")
-                else:
-                    logger.warning("Gemini API key not set")
-            except Exception as e:
-                logger.error(f"Error initializing HerkeyJobSearch: {str(e)}")
-        else:
-            logger.warning("HerkeyJobSearch not available")
-    
-        # Second method: Try to load the job listing data if available
-        logger.info("Falling back to CSV job data search")
-        job_data = []
-        try:
-            # Path to the job listing data CSV
-            data_path = os.path.join(os.getcwd(), "data", "job_listing_data.csv")
-            
-            if os.path.exists(data_path):
-                # Read the data
-                job_data = pd.read_csv(data_path)
-                logger.info(f"CSV loaded. Found {len(job_data)} jobs.")
-                
-                # Make all string columns lowercase for case-insensitive comparison
-                for col in job_data.columns:
-                    if job_data[col].dtype == 'object':
-                        job_data[col] = job_data[col].str.lower()
-                
-                # Convert search terms to lowercase
-                if job_role:
-                    job_role = job_role.lower()
-                if location:
-                    location = location.lower()
-                if job_type:
-                    job_type = job_type.lower()
-                if skill:
-                    skill = skill.lower()
-                
-                # Use more flexible filtering with partial matches
-                filtered_data = job_data.copy()
-                
-                if job_role:
-                    filtered_data = filtered_data[
-                        filtered_data['role'].str.contains(job_role, case=False, na=False) | 
-                        filtered_data['title'].str.contains(job_role, case=False, na=False)
-                    ]
-                
-                if location:
-                    filtered_data = filtered_data[filtered_data['location'].str.contains(location, case=False, na=False)]
-                
-                if experience:
-                    # Handle experience as string that might contain numbers
-                    exp_str = str(experience).lower()
-                    exp_digits = ''.join(c for c in exp_str if c.isdigit())
-                    if exp_digits:
-                        # If we extracted digits, filter by those
-                        filtered_data = filtered_data[filtered_data['experience'].astype(str).str.contains(exp_digits, na=False)]
-                
-                if job_type:
-                    filtered_data = filtered_data[filtered_data['job_type'].str.contains(job_type, case=False, na=False)]
-                
-                if skill:
-                    filtered_data = filtered_data[filtered_data['skills'].str.contains(skill, case=False, na=False)]
-                
-                # Format the results
-                job_count = len(filtered_data)
-                
-                if job_count > 0:
-                    # Format the results with apply buttons
-                    job_results = ""
-                    for _, job in filtered_data.head(5).iterrows():
-                        # Create a job URL slug
-                        job_slug = job['title'].lower().replace(' ', '-')
-                        application_url = f"https://herkey.com/jobs/apply/{job_slug}"
-                        
-                        job_results += f"- {job['title']} at {job['company']} ({job['location']})\n"
-                        job_results += f"  [<a href='{application_url}' target='_blank' class='apply-btn'>Apply Now</a>]\n\n"
-                    
-                    # Send the response
-                    dispatcher.utter_message(
-                        template="utter_job_results", 
-                        count=job_count, 
-                        job_results=job_results
-                    )
-                    return []
-                else:
-                    logger.warning(f"No jobs found in CSV matching criteria: role={job_role}, location={location}")
-            else:
-                logger.warning(f"Job listing CSV file not found at {data_path}")
-                
-        except Exception as e:
-            # Log the exception
-            logger.error(f"Error in CSV job search: {str(e)}")
-            
-        # As a final fallback, use mock data
-        logger.info("Using mock job data as final fallback")
-        # Create mock job listings with Apply Now buttons
-        job_role_slug = job_role.lower().replace(' ', '-') if job_role else "job"
-        job_title = job_role.title() if job_role else "Software Developer"
-        job_location = location.title() if location else "Bangalore"
-        
-        mock_jobs = [
-            {
-                "title": f"Senior {job_title}",
-                "company": "TechCorp",
-                "location": job_location,
-                "type": "Full-time",
-                "posted_date": "1 week ago",
-                "url": f"https://herkey.com/jobs/apply/{job_role_slug}-senior"
-            },
-            {
-                "title": f"{job_title} - Machine Learning",
-                "company": "Amazon",
-                "location": job_location,
-                "type": "Full-time",
-                "posted_date": "3 days ago",
-                "url": f"https://herkey.com/jobs/apply/{job_role_slug}-machine-learning-amazon"
-            },
-            {
-                "title": f"{job_title} (Retail Analytics)",
-                "company": "Flipkart",
-                "location": job_location,
-                "type": "Full-time",
-                "posted_date": "2 days ago",
-                "url": f"https://herkey.com/jobs/apply/{job_role_slug}-retail-analytics-flipkart"
-            },
-            {
-                "title": f"Applied Scientist",
-                "company": "Microsoft",
-                "location": job_location,
-                "type": "Full-time",
-                "posted_date": "5 days ago",
-                "url": f"https://herkey.com/jobs/apply/applied-scientist-microsoft"
-            },
-            {
-                "title": f"Data Analyst - Business Intelligence",
-                "company": "Accenture",
-                "location": job_location,
-                "type": "Full-time",
-                "posted_date": "1 day ago",
-                "url": f"https://herkey.com/jobs/apply/data-analyst-business-intelligence-accenture"
-            }
-        ]
-        
-        job_results = ""
-        for job in mock_jobs:
-            job_results += f"- {job['title']} at {job['company']} ({job['location']})\n"
-            job_results += f"  {job['type']} | Posted: {job['posted_date']}\n"
-            job_results += f"  [<a href='{job['url']}' target='_blank' class='apply-btn'>Apply Now</a>]\n\n"
-        
-        logger.info("Sending mock job data response")
+        # Gemini and the local index run side by side within the per-turn latency budget
+        result = await get_tiered_job_search().search(job_role, location, experience, job_type, skill)
+        jobs = result.jobs[:JOB_RESULTS_PAGE_SIZE]
+        logger.info(f"Job search served by {result.tier} tier in {result.elapsed * 1000:.0f} ms "
+                    f"({len(jobs)} shown of {result.total})")
+        job_cursors.start(tracker.sender_id, result.tier, result.total,
+                          ranked=result.ranked, jobs=result.jobs, shown=len(jobs),
+                          query=(job_role, location, experience, job_type, skill))
+        
+        # Jobs go out as structured data; the widget renders the cards
         dispatcher.utter_message(
             template="utter_job_results",
-            count=len(mock_jobs),
-            job_results=job_results
+            count=result.total,
+            json_message=job_results_payload(jobs, 1, result.total, ranked_source(result.ranked))
         )
         
         # Return empty list as we're not setting any slots
         return []
     
+class ActionShowMoreJobs(Action):
+    """Action to show the next page of the sender's last job search."""
+
+    def name(self) -> Text:
+        return "action_show_more_jobs"
+
+    @instrument_action
+    async def run(self, dispatcher: CollectingDispatcher,
+                  tracker: Tracker,
+                  domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+        """Page through the stored results; the total comes from the cursor."""
+        page = job_cursors.next_page(tracker.sender_id, JOB_RESULTS_PAGE_SIZE)
+        if page is None:
+            dispatcher.utter_message(template="utter_no_job_search")
+            return []
+
+        if page.start == page.stop:
+            dispatcher.utter_message(template="utter_no_more_jobs", count=page.total)
+            return []
+
+        jobs = await jobs_for_page(tracker.sender_id, page)
+        if jobs is None:
+            # The listings were reloaded, so the stored ids point at different rows
+            job_cursors.clear(tracker.sender_id)
+            dispatcher.utter_message(template="utter_no_job_search")
+            return []
+
+        dispatcher.utter_message(
+            template="utter_more_job_results",
+            first=page.start + 1,
+            last=page.stop,
+            count=page.total,
+            json_message=job_results_payload(jobs, page.start + 1, page.total, ranked_source(page.cursor.ranked))
+        )
+        return []
+
 class ActionProvideEventsInfo(Action):
     """Action to provide information about events."""
 
     def name(self) -> Text:
         return "action_provide_events_info"
 
+    @instrument_action
     def run(self, dispatcher: CollectingDispatcher,
             tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         """Provide information about upcoming events."""
         
-        # Try to load the session details JSON if available
+        # Use the shared catalog if the session details JSON is available
         try:
-            # Path to the session details JSON
-            data_path = os.path.join(os.getcwd(), "data", "Session Details.json")
+            catalog = event_catalog.get()
             
-            if os.path.exists(data_path):
-                # Read the data
-                with open(data_path, 'r') as file:
-                    session_data = json.load(file)
+            if catalog is not None:
+                entities = tracker.latest_message.get("entities", [])
                 
-                # Filter for events
-                events = [s for s in session_data if s.get('type') == 'event']
+                # Only show events in the requested period, or upcoming ones by default
+                date_values = [e["value"] for e in entities if e["entity"] == "date"]
+                start, end = resolve_date_range(" ".join(date_values) or tracker.latest_message.get('text', ''))
                 
                 # Check for event type in entities
-                event_types = [e["value"] for e in tracker.latest_message.get("entities", []) 
-                              if e["entity"] == "event_type"]
+                event_types = [e["value"] for e in entities if e["entity"] == "event_type"]
                 
-                # If specific event type requested, filter for it
-                if event_types:
-                    filtered_events = []
-                    for event_type in event_types:
-                        filtered_events.extend([e for e in events if event_type.lower() in e.get('title', '').lower()])
-                    
-                    # If we found specific events, use those; otherwise, fall back to all events
-                    if filtered_events:
-                        events = filtered_events
+                # If specific event type requested, look it up in the title index
+                events = event_catalog.query('event', start, end, keywords=event_types)
+                
+                # If we found no specific events, fall back to all events in the period
+                if event_types and not events:
+                    events = event_catalog.query('event', start, end)
                 
                 if events:
-                    # Sort events by date
-                    from datetime import datetime
-                    
-                    # Convert date strings to datetime objects for sorting
-                    for event in events:
-                        try:
-                            event['date_obj'] = datetime.strptime(event.get('date', ''), '%B %d, %Y')
-                        except:
-                            # If date can't be parsed, use a far future date
-                            event['date_obj'] = datetime(2099, 12, 31)
-                    
-                    # Sort by date
-                    events.sort(key=lambda x: x['date_obj'])
-                    
-                    # Remove the datetime objects after sorting
-                    for event in events:
-                        del event['date_obj']
-                    
-                    # Format the events
+                    # Events are already sorted by date in the catalog
                     events_info = "Here are some upcoming events:\n\n"
                     for event in events[:5]:  # Show top 5 events
-                        events_info += f"- {event.get('title')} on {event.get('date')} at {event.get('time')}\n"
-                        events_info += f"  {event.get('description')}\n\n"
+                        events_info += f"- {event.title} on {event.date} at {event.time}\n"
+                        events_info += f"  {event.description}\n\n"
                     
                     events_info += "Would you like more details about any of these events or information about other types of events? You can also browse all events in the 'Events' section of Herkey."
                     
@@ -407,48 +444,27 @@ class ActionProvideSessionsInfo(Action):
     def name(self) -> Text:
         return "action_provide_sessions_info"
 
+    @instrument_action
     def run(self, dispatcher: CollectingDispatcher,
             tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         """Provide information about available sessions."""
         
-        # Try to load the session details JSON if available
+        # Use the shared catalog if the session details JSON is available
         try:
-            # Path to the session details JSON
-            data_path = os.path.join(os.getcwd(), "data", "Session Details.json")
+            catalog = event_catalog.get()
             
-            if os.path.exists(data_path):
-                # Read the data
-                with open(data_path, 'r') as file:
-                    session_data = json.load(file)
-                
-                # Filter for sessions
-                sessions = [s for s in session_data if s.get('type') == 'session']
+            if catalog is not None:
+                date_values = [e["value"] for e in tracker.latest_message.get("entities", []) if e["entity"] == "date"]
+                start, end = resolve_date_range(" ".join(date_values) or tracker.latest_message.get('text', ''))
+                sessions = event_catalog.query('session', start, end)
                 
                 if sessions:
-                    # Sort sessions by date
-                    from datetime import datetime
-                    
-                    # Convert date strings to datetime objects for sorting
-                    for session in sessions:
-                        try:
-                            session['date_obj'] = datetime.strptime(session.get('date', ''), '%B %d, %Y')
-                        except:
-                            # If date can't be parsed, use a far future date
-                            session['date_obj'] = datetime(2099, 12, 31)
-                    
-                    # Sort by date
-                    sessions.sort(key=lambda x: x['date_obj'])
-                    
-                    # Remove the datetime objects after sorting
-                    for session in sessions:
-                        del session['date_obj']
-                    
-                    # Format the sessions
+                    # Sessions are already sorted by date in the catalog
                     sessions_info = "Here are some upcoming learning sessions:\n\n"
                     for session in sessions[:5]:  # Show top 5 sessions
-                        sessions_info += f"- {session.get('title')} on {session.get('date')} at {session.get('time')}\n"
-                        sessions_info += f"  {session.get('description')}\n\n"
+                        sessions_info += f"- {session.title} on {session.date} at {session.time}\n"
+                        sessions_info += f"  {session.description}\n\n"
                     
                     sessions_info += "These sessions are designed to help you develop various skills relevant to your career. You can check the 'Sessions' section on Herkey to register for these or explore more available sessions."
                     
@@ -514,6 +530,7 @@ class ActionProvideMentorshipInfo(Action):
     def name(self) -> Text:
         return "action_provide_mentorship_info"
 
+    @instrument_action
     def run(self, dispatcher: CollectingDispatcher,
             tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
@@ -604,10 +621,16 @@ class ActionHandleFAQ(Action):
     """Enhanced action to handle frequently asked questions using the structured FAQ data."""
 
     def __init__(self):
-        # Load the FAQ database
+        self.faq_path = os.path.join(DATA_DIR, "faqs.json")
+        self.faq_mtime = None
+        self.load_faqs()
+
+    def load_faqs(self):
+        """(Re)load the FAQ database and rebuild the matcher, which also resets its answer cache."""
+        faq_path = self.faq_path
         try:
-            faq_path = os.path.join(os.getcwd(), "data", "faqs.json")
             if os.path.exists(faq_path):
+                self.faq_mtime = os.path.getmtime(faq_path)
                 with open(faq_path, 'r') as f:
                     faq_data = json.load(f)
                     
@@ -643,14 +666,30 @@ class ActionHandleFAQ(Action):
             self.question_to_category = {}
             print(f"Error loading FAQ data: {e}")
 
+        # Vectorize the questions once so each message is a single sparse lookup
+        self.faq_matcher = FAQMatcher(self.all_questions)
+
+    def reload_if_changed(self):
+        """Reload the FAQ database if the file was modified since it was loaded."""
+        try:
+            mtime = os.path.getmtime(self.faq_path)
+        except OSError:
+            return
+        if mtime != self.faq_mtime:
+            logger.info(f"FAQ data changed, reloading (cache stats before reload: {self.faq_matcher.cache.stats()})")
+            self.load_faqs()
+
     def name(self) -> Text:
         return "action_handle_faq"
 
+    @instrument_action
     def run(self, dispatcher: CollectingDispatcher,
             tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         """Provide answers to frequently asked questions."""
         
+        self.reload_if_changed()
+        
         # Get the latest user message
         user_message = tracker.latest_message.get('text', '').lower()
         
@@ -658,10 +697,10 @@ class ActionHandleFAQ(Action):
         user_message = user_message.replace("jobsforher", "herkey")
         
         # Try to find the closest matching question
-        matches = get_close_matches(user_message, self.all_questions, n=1, cutoff=0.6)
+        match = self.faq_matcher.match(user_message)
         
-        if matches:
-            matched_question = matches[0]
+        if match:
+            matched_question = self.all_questions[match[0]]
             answer = self.question_to_answer[matched_question]
             category = self.question_to_category[matched_question]
             
@@ -691,6 +730,7 @@ class ActionAddressGenderBias(Action):
     def name(self) -> Text:
         return "action_address_gender_bias"
 
+    @instrument_action
     def run(self, dispatcher: CollectingDispatcher,
             tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
@@ -737,6 +777,7 @@ class ValidateJobSearchForm(FormValidationAction):
     def name(self) -> Text:
         return "validate_job_search_form"
 
+    @instrument_action
     def validate_job_role(
         self,
         slot_value: Any,
@@ -748,19 +789,9 @@ class ValidateJobSearchForm(FormValidationAction):
         
         if not slot_value:
             # Check if we can extract job role from the message
-            latest_message = tracker.latest_message.get('text', '').lower()
-            
-            # Try to extract common job roles
-            if 'data science' in latest_message or 'data scientist' in latest_message:
-                return {"job_role": "data science"}
-            elif 'software' in latest_message and ('engineer' in latest_message or 'developer' in latest_message):
-                return {"job_role": "software developer"}
-            elif 'product manager' in latest_message:
-                return {"job_role": "product manager"}
-            elif 'marketing' in latest_message:
-                return {"job_role": "marketing"}
-            elif 'designer' in latest_message or 'design' in latest_message:
-                return {"job_role": "designer"}
+            job_role = gazetteer.extract(tracker.latest_message.get('text', '')).role
+            if job_role:
+                return {"job_role": job_role}
             
             # No job role detected
             dispatcher.utter_message(text="Please provide a valid job role, such as 'Software Developer', 'Data Scientist', or 'Marketing Manager'.")
@@ -775,6 +806,7 @@ class ValidateJobSearchForm(FormValidationAction):
             dispatcher.utter_message(text="Please provide a more specific job role, such as 'Software Developer' or 'Marketing Manager'.")
             return {"job_role": None}
 
+    @instrument_action
     def validate_location(
         self,
         slot_value: Any,
@@ -785,48 +817,32 @@ class ValidateJobSearchForm(FormValidationAction):
         """Validate location value."""
         
         if not slot_value:
-            # Check if we can extract location from the message
-            latest_message = tracker.latest_message.get('text', '').lower()
-            
-            # Try to extract common locations
-            if 'bangalore' in latest_message:
-                return {"location": "Bangalore"}
-            elif 'mumbai' in latest_message:
-                return {"location": "Mumbai"}
-            elif 'delhi' in latest_message:
-                return {"location": "Delhi"}
-            elif 'hyderabad' in latest_message:
-                return {"location": "Hyderabad"}
-            elif 'remote' in latest_message or 'work from home' in latest_message:
-                return {"location": "Remote"}
+            # Only a span marked as a place is resolved, never the whole sentence ("sign me up")
+            message = tracker.latest_message.get('text', '')
+            mention = next(tracker.get_latest_entity_values("location"), None) or gazetteer.extract(message).location
+            if mention:
+                # Normalize aliases, other cities and misspellings ("Gurugram", "Kochi", "Banglore")
+                resolved = location_service.resolve(mention)
+                return {"location": resolved.name if resolved else mention}
             
             # No location detected
             dispatcher.utter_message(text="Please provide a valid location, such as 'Bangalore', 'Mumbai', or 'Remote'.")
             return {"location": None}
         
         # We have a slot value
+        # Normalize aliases and misspellings to the canonical name; short values must be a known alias ("UP")
+        resolved = location_service.resolve(slot_value)
+        if resolved:
+            return {"location": resolved.name}
         if len(slot_value) > 2:
-            # Valid location
-            # Check for common location spelling variations
-            slot_value_lower = slot_value.lower()
-            if 'bangalore' in slot_value_lower:
-                return {"location": "Bangalore"}
-            elif 'mumbai' in slot_value_lower:
-                return {"location": "Mumbai"}
-            elif 'delhi' in slot_value_lower:
-                return {"location": "Delhi"}
-            elif 'hyderabad' in slot_value_lower:
-                return {"location": "Hyderabad"}
-            elif 'remote' in slot_value_lower or 'work from home' in slot_value_lower:
-                return {"location": "Remote"}
-            
-            # Other location
+            # Valid location; keep unknown locations as given
             return {"location": slot_value}
         else:
             # Invalid location (too short)
             dispatcher.utter_message(text="Please provide a valid location, such as 'Bangalore' or 'Remote'.")
             return {"location": None}
 
+    @instrument_action
     def validate_experience(
         self,
         slot_value: Any,
@@ -837,23 +853,10 @@ class ValidateJobSearchForm(FormValidationAction):
         """Validate experience value."""
         
         if not slot_value:
-            # Check if we can extract experience from the message
-            latest_message = tracker.latest_message.get('text', '').lower()
-            
-            # Try to extract years of experience
-            import re
-            years_match = re.search(r'(\d+)\s*(?:years?|yrs?)', latest_message)
-            if years_match:
-                years = years_match.group(1)
-                return {"experience": f"{years} years"}
-            
-            # Check for experience levels
-            if 'entry' in latest_message or 'junior' in latest_message or 'fresher' in latest_message:
-                return {"experience": "entry level"}
-            elif 'mid' in latest_message:
-                return {"experience": "mid level"}
-            elif 'senior' in latest_message or 'experienced' in latest_message:
-                return {"experience": "senior level"}
+            # Check if we can extract years of experience or a level from the message
+            experience = gazetteer.extract(tracker.latest_message.get('text', '')).experience
+            if experience:
+                return {"experience": experience}
             
             # No experience detected
             dispatcher.utter_message(text="Please provide your years of experience, such as '3 years' or specify if you're at entry, mid, or senior level.")
@@ -875,6 +878,7 @@ class ActionPauseConversation(Action):
     def name(self) -> Text:
         return "action_pause_conversation"
 
+    @instrument_action
     def run(self, dispatcher: CollectingDispatcher,
             tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
@@ -897,6 +901,7 @@ class ActionResumeConversation(Action):
     def name(self) -> Text:
         return "action_resume_conversation"
 
+    @instrument_action
     def run(self, dispatcher: CollectingDispatcher,
             tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
@@ -921,9 +926,10 @@ class ActionTestGeminiAPI(Action):
     def name(self) -> Text:
         return "action_test_gemini_api"
 
-    def run(self, dispatcher: CollectingDispatcher,
-            tracker: Tracker,
-            domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+    @instrument_action
+    async def run(self, dispatcher: CollectingDispatcher,
+                  tracker: Tracker,
+                  domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         """Test Gemini API connection and log results."""
         
         logger.info("Received Gemini API test request from frontend")
@@ -932,8 +938,8 @@ class ActionTestGeminiAPI(Action):
         try:
             # Check if HerkeyJobSearch is available
             if herkey_search_available:
-                # Initialize the search engine
-                search_engine = HerkeyJobSearch()
+                # Reuse the shared search engine
+                search_engine = get_herkey_search_engine()
                 
                 # Check if API key is available and valid
                 if search_engine.api_key:
@@ -942,7 +948,7 @@ class ActionTestGeminiAPI(Action):
                     # Make a test request to Gemini API
                     try:
                         # Just make a small test request
-                        test_jobs = search_engine.search_jobs("test", "test", "1")
+                        test_jobs = await search_engine.search_jobs("test", "test", "1")
                         if test_jobs and len(test_jobs) > 0:
                             logger.info("Gemini API test successful")
                             # No response needed, just log success
@@ -0,0 +1,326 @@
+"""
+In-process micro-benchmarks for the custom actions.
+
+Each scenario builds a synthetic Tracker and a CollectingDispatcher and calls
+the action's run() directly - no Rasa server, no network. Gemini is replaced
+by a local stub with a configurable latency.
+
+Usage (from the project root):
+    python -m benchmarks.bench_actions
+    python -m benchmarks.bench_actions --iterations 500 --only faq,events
+    python -m benchmarks.bench_actions --compare benchmarks/results/<commit>.json
+
+Results are printed and saved as JSON (benchmarks/results/<commit>.json by
+default) so runs can be compared across commits.
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import platform
+import warnings
+import contextlib
+import subprocess
+from datetime import datetime
+
+# The benchmark must not start background work or bind ports on import of the actions
+os.environ.setdefault("JOB_PREWARM_ENABLED", "false")
+os.environ.setdefault("METRICS_ENABLED", "false")
+os.environ.setdefault("GEMINI_RATE_LIMIT", "0")
+
+import yaml
+from rasa_sdk import Tracker
+from rasa_sdk.executor import CollectingDispatcher
+
+from actions import actions
+from utils.tiered_search import CircuitBreaker, TieredJobSearch
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+FAQ_MESSAGES = [
+    "What is Herkey?",
+    "how do i sign up",
+    "Is it free to use JobsForHer?",
+    "can I find part time work here",
+    "What is the weather like today?",
+]
+
+JOB_QUERIES = [
+    ("software developer", "Bangalore", "3 years"),
+    ("data science", "Mumbai", "5 years"),
+    ("product manager", "Delhi", None),
+    ("marketing", "Remote", "1 year"),
+]
+
+
+def make_tracker(text, slots=None, intent="", entities=None, events=None, active_loop=None):
+    """Build a Tracker as the action server would receive it."""
+    return Tracker(
+        sender_id="benchmark",
+        slots=slots or {},
+        latest_message={
+            "text": text,
+            "intent": {"name": intent, "confidence": 1.0},
+            "entities": entities or [],
+        },
+        events=events or [],
+        paused=False,
+        followup_action=None,
+        active_loop=active_loop or {},
+        latest_action_name="action_listen",
+    )
+
+
+class GeminiStub:
+    """Stands in for the Gemini request, returning canned jobs after a fixed delay."""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.calls = 0
+
+    async def __call__(self, job_role, location=None, experience=None, background=False):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return [
+            {
+                "title": f"{(job_role or 'job').title()} {n}",
+                "company": "Stub Corp",
+                "location": location or "Remote",
+                "type": "Full-time",
+                "posted_date": "1 day ago",
+                "url": f"https://herkey.com/jobs/apply/stub-{n}",
+            }
+            for n in range(5)
+        ]
+
+
+async def use_gemini_stub(stub):
+    """
+    Route the shared search engine and tiered search through the stub.
+
+    One probe search must be answered by the stub; otherwise a broken stub
+    would quietly fall back to the CSV tier and be timed as Gemini.
+    """
+    engine = actions.get_herkey_search_engine()
+    engine.api_key = "benchmark"
+    engine._request_jobs = stub
+    engine.cache.clear()
+    actions._tiered_job_search = TieredJobSearch(engine.fetch_jobs, actions.search_local_jobs, actions.get_mock_jobs)
+
+    calls = stub.calls
+    result = await actions._tiered_job_search.search(*JOB_QUERIES[0])
+    assert stub.calls > calls, "The Gemini stub was not called"
+    assert result.tier == "gemini", f"Probe search was served by the {result.tier} tier, not the Gemini stub"
+    engine.cache.clear()
+    return engine
+
+
+def check_gemini_breaker():
+    """Fail if the Gemini tier failed during the scenario and searches fell back to CSV."""
+    breaker = actions.get_tiered_job_search().breaker
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.failures == 0, (
+        f"Gemini stub failed during the run (breaker {breaker.state}, {breaker.failures} failures)"
+    )
+
+
+def use_local_only():
+    """Disable the Gemini tier so searches are served by the CSV index."""
+    actions._tiered_job_search = TieredJobSearch(None, actions.search_local_jobs, actions.get_mock_jobs)
+
+
+def build_scenarios(domain, gemini_latency):
+    """
+    Return the benchmark scenarios.
+
+    Each is (name, setup, step, check) where step(i) returns the coroutine
+    or value of one action call; setup (plain or async) runs before the
+    scenario and check after it.
+    """
+    search = actions.ActionSearchJobs()
+    faq = actions.ActionHandleFAQ()
+    events = actions.ActionProvideEventsInfo()
+    sessions = actions.ActionProvideSessionsInfo()
+    form = actions.ValidateJobSearchForm()
+    stub = GeminiStub(gemini_latency)
+
+    # Generated datasets come with reworded questions; cycling through them avoids measuring only cache hits
+    faq_messages = FAQ_MESSAGES
+    paraphrase_path = os.path.join(actions.DATA_DIR, "faq_paraphrases.json")
+    if os.path.exists(paraphrase_path):
+        with open(paraphrase_path, "r") as f:
+            faq_messages = [entry["message"] for entry in json.load(f)] or FAQ_MESSAGES
+
+    def job_tracker(i):
+        role, location, experience = JOB_QUERIES[i % len(JOB_QUERIES)]
+        return make_tracker(f"find {role} jobs", slots={
+            "job_role": role, "location": location, "experience": experience,
+        }, intent="search_jobs")
+
+    def search_step(i):
+        return search.run(CollectingDispatcher(), job_tracker(i), domain)
+
+    def search_cold_step(i):
+        actions.get_herkey_search_engine().cache.clear()
+        return search.run(CollectingDispatcher(), job_tracker(i), domain)
+
+    def faq_step(i):
+        message = faq_messages[i % len(faq_messages)]
+        return faq.run(CollectingDispatcher(), make_tracker(message, intent="faq"), domain)
+
+    def events_step(i):
+        text = ["any events this month?", "upcoming events", "events next week"][i % 3]
+        return events.run(CollectingDispatcher(), make_tracker(text, intent="ask_events"), domain)
+
+    def sessions_step(i):
+        text = ["upcoming sessions", "sessions in june", "any sessions tomorrow"][i % 3]
+        return sessions.run(CollectingDispatcher(), make_tracker(text, intent="ask_sessions"), domain)
+
+    def form_step(i):
+        role, location, experience = JOB_QUERIES[i % len(JOB_QUERIES)]
+        slots = {"job_role": role, "location": location, "experience": experience or "2 years",
+                 "requested_slot": "experience"}
+        slot_events = [{"event": "slot", "name": name, "value": value} for name, value in slots.items()]
+        tracker = make_tracker(experience or "2 years", slots=slots, events=slot_events,
+                               active_loop={"name": "job_search_form"})
+        return form.run(CollectingDispatcher(), tracker, domain)
+
+    return [
+        ("search_jobs_gemini_cached", lambda: use_gemini_stub(stub), search_step, check_gemini_breaker),
+        ("search_jobs_gemini_cold", lambda: use_gemini_stub(stub), search_cold_step, check_gemini_breaker),
+        ("search_jobs_csv", use_local_only, search_step, None),
+        ("faq", None, faq_step, None),
+        ("events", None, events_step, None),
+        ("sessions", None, sessions_step, None),
+        ("validate_job_search_form", None, form_step, None),
+    ]
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+async def run_scenario(step, iterations, warmup):
+    """Time iterations calls of step after warmup untimed calls."""
+    async def call(i):
+        result = step(i)
+        if asyncio.iscoroutine(result):
+            await result
+
+    for i in range(warmup):
+        await call(i)
+
+    samples = []
+    started = time.perf_counter()
+    for i in range(iterations):
+        t0 = time.perf_counter()
+        await call(i)
+        samples.append(time.perf_counter() - t0)
+    total = time.perf_counter() - started
+
+    samples.sort()
+    return {
+        "iterations": iterations,
+        "ops_per_sec": iterations / total if total else 0.0,
+        "mean_ms": sum(samples) / len(samples) * 1000,
+        "p50_ms": percentile(samples, 0.50) * 1000,
+        "p95_ms": percentile(samples, 0.95) * 1000,
+        "p99_ms": percentile(samples, 0.99) * 1000,
+        "max_ms": samples[-1] * 1000,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_report(results, baseline=None):
+    header = f"{'scenario':<28}{'ops/sec':>12}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    if baseline:
+        header += f"{'p50 vs base':>14}"
+    print(header)
+    print("-" * len(header))
+    for name, stats in results.items():
+        line = (f"{name:<28}{stats['ops_per_sec']:>12.1f}{stats['p50_ms']:>10.3f}"
+                f"{stats['p95_ms']:>10.3f}{stats['p99_ms']:>10.3f}")
+        base = (baseline or {}).get(name)
+        if base and base["p50_ms"]:
+            line += f"{(stats['p50_ms'] / base['p50_ms'] - 1) * 100:>+13.1f}%"
+        print(line)
+
+
+async def main_async(args):
+    with open(os.path.join(ROOT, "domain.yml"), "r") as f:
+        domain = yaml.safe_load(f)
+
+    only = set(args.only.split(",")) if args.only else None
+    results = {}
+    for name, setup, step, check in build_scenarios(domain, args.gemini_latency):
+        if only and not any(name.startswith(prefix) for prefix in only):
+            continue
+        # The search engine reports progress with print(); keep terminal I/O out of the timings
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            if setup is not None:
+                prepared = setup()
+                if asyncio.iscoroutine(prepared):
+                    await prepared
+            results[name] = await run_scenario(step, args.iterations, args.warmup)
+        if check is not None:
+            check()
+        print(f"  {name}: {results[name]['ops_per_sec']:.1f} ops/sec", file=sys.stderr)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the custom actions in-process.")
+    parser.add_argument("--iterations", type=int, default=200, help="Timed calls per scenario")
+    parser.add_argument("--warmup", type=int, default=20, help="Untimed calls before timing")
+    parser.add_argument("--gemini-latency", type=float, default=0.05,
+                        help="Seconds the Gemini stub takes per request")
+    parser.add_argument("--only", help="Comma-separated scenario name prefixes to run")
+    parser.add_argument("--output", help="Where to write the JSON results")
+    parser.add_argument("--compare", help="Earlier results JSON to compare p50 latency against")
+    args = parser.parse_args()
+
+    # Action logging and deprecation warnings would dominate the timings
+    import logging
+    logging.disable(logging.WARNING)
+    warnings.simplefilter("ignore")
+
+    results = asyncio.run(main_async(args))
+
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "iterations": args.iterations,
+        "gemini_latency": args.gemini_latency,
+        "scenarios": results,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)["scenarios"]
+    print_report(results, baseline)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Local stand-in for the Gemini generateContent API, for load tests.
+
+Answers generateContent and streamGenerateContent (SSE) with five valid job
+listings after a configurable delay. Run it and point the action server at it:
+
+    python -m benchmarks.gemini_stub --port 8787 --latency 0.8
+    GEMINI_API_KEY=stub GEMINI_API_BASE=http://localhost:8787/v1beta/models/gemini-1.5-flash rasa run actions
+"""
+import re
+import json
+import asyncio
+import argparse
+
+from aiohttp import web
+
+_ROLE_RE = re.compile(r"for '([^']*)' positions")
+_LOCATION_RE = re.compile(r" in ([A-Za-z ]+?)(?: with|\.)")
+
+
+def stub_jobs(prompt):
+    """Build five jobs for the role and location named in the prompt."""
+    role_match = _ROLE_RE.search(prompt)
+    location_match = _LOCATION_RE.search(prompt)
+    role = (role_match.group(1) if role_match else "Professional").title()
+    location = location_match.group(1) if location_match else "Remote"
+    levels = ["Junior", "", "Senior", "Lead", "Principal"]
+    return [
+        {
+            "title": f"{level} {role}".strip(),
+            "company": f"Stub Company {n + 1}",
+            "location": location,
+            "type": "Full-time",
+            "posted_date": f"{n + 1} days ago",
+        }
+        for n, level in enumerate(levels)
+    ]
+
+
+def response_body(text):
+    return {"candidates": [{"content": {"parts": [{"text": text}], "role": "model"}, "finishReason": "STOP"}]}
+
+
+def make_app(latency, chunks):
+    """
+    Args:
+        latency (float): Seconds until the full response is available
+        chunks (int): Number of SSE events a streamed response is split into
+    """
+    stats = {"requests": 0, "streamed": 0}
+
+    async def handle(request):
+        model_action = request.match_info["model_action"]
+        body = await request.json()
+        prompt = body["contents"][0]["parts"][0]["text"]
+        text = json.dumps(stub_jobs(prompt))
+        stats["requests"] += 1
+
+        if model_action.endswith(":generateContent"):
+            await asyncio.sleep(latency)
+            return web.json_response(response_body(text))
+
+        if not model_action.endswith(":streamGenerateContent"):
+            raise web.HTTPNotFound()
+
+        stats["streamed"] += 1
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        size = -(-len(text) // chunks)
+        try:
+            for start in range(0, len(text), size):
+                await asyncio.sleep(latency / chunks)
+                event = json.dumps(response_body(text[start:start + size]))
+                await response.write(f"data: {event}\r\n\r\n".encode())
+        except ConnectionResetError:
+            # The client stops reading once the job array is complete
+            pass
+        return response
+
+    async def handle_stats(request):
+        return web.json_response(stats)
+
+    app = web.Application()
+    app.router.add_post("/v1/models/{model_action}", handle)
+    app.router.add_post("/v1beta/models/{model_action}", handle)
+    app.router.add_get("/stats", handle_stats)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve canned Gemini job listings locally.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--latency", type=float, default=0.8, help="Seconds per response")
+    parser.add_argument("--chunks", type=int, default=8, help="SSE events per streamed response")
+    args = parser.parse_args()
+    web.run_app(make_app(args.latency, max(args.chunks, 1)), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
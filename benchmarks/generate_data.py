@@ -0,0 +1,281 @@
+"""
+Seeded generator for production-scale job, FAQ and event datasets.
+
+Writes files with the same names and schemas as data/, so the action server
+and the benchmarks can be pointed at them with ASHA_DATA_DIR:
+
+    python -m benchmarks.generate_data --jobs 1000000 --faqs 20000 --events 5000
+    ASHA_DATA_DIR=benchmarks/data python -m benchmarks.bench_actions
+
+Output for the same arguments (including --seed and --start-date) is
+byte-for-byte identical. Besides job_listing_data.csv, faqs.json and
+"Session Details.json", a faq_paraphrases.json file lists reworded
+questions with the question they should match, for measuring FAQ accuracy.
+"""
+import os
+import sys
+import json
+import argparse
+import itertools
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUTPUT_DIR = os.path.join(ROOT, "benchmarks", "data")
+
+# Rows generated and written per CSV chunk
+JOB_CHUNK_SIZE = 250_000
+
+# role: (title variants, skills, industry, relative frequency)
+ROLES = {
+    "software developer": (["Software Engineer", "Software Developer", "Backend Developer"],
+                           ["python", "java", "javascript", "react", "sql", "aws"], "IT", 10),
+    "data science": (["Data Scientist", "Data Analyst", "Machine Learning Engineer"],
+                     ["python", "sql", "statistics", "machine learning", "pandas", "tableau"], "IT", 6),
+    "product manager": (["Product Manager", "Product Owner", "Technical Product Manager"],
+                        ["roadmapping", "agile", "analytics", "stakeholder management", "jira", "sql"], "IT", 4),
+    "marketing": (["Marketing Manager", "Digital Marketing Specialist", "Content Marketer"],
+                  ["seo", "content writing", "social media", "google analytics", "branding", "email marketing"],
+                  "Marketing", 5),
+    "designer": (["UX Designer", "UI Designer", "Product Designer"],
+                 ["figma", "user research", "prototyping", "sketch", "illustrator", "wireframing"], "Design", 4),
+    "hr": (["HR Manager", "Talent Acquisition Specialist", "HR Business Partner"],
+           ["recruiting", "onboarding", "payroll", "employee relations", "hrms", "compliance"], "Human Resources", 3),
+    "finance": (["Financial Analyst", "Accountant", "Finance Manager"],
+                ["excel", "financial modeling", "tally", "gst", "budgeting", "sap"], "Finance", 3),
+    "sales": (["Sales Executive", "Account Manager", "Business Development Manager"],
+              ["negotiation", "crm", "lead generation", "b2b sales", "salesforce", "communication"], "Sales", 4),
+    "operations": (["Operations Manager", "Operations Analyst", "Supply Chain Analyst"],
+                   ["process improvement", "excel", "logistics", "six sigma", "vendor management", "sap"],
+                   "Operations", 2),
+    "teacher": (["Teacher", "Curriculum Designer", "Instructional Designer"],
+                ["lesson planning", "classroom management", "edtech", "assessment", "communication", "elearning"],
+                "Education", 2),
+    "customer support": (["Customer Support Executive", "Customer Success Manager", "Support Engineer"],
+                         ["communication", "zendesk", "crm", "troubleshooting", "english", "hindi"],
+                         "Customer Service", 3),
+    "devops": (["DevOps Engineer", "Site Reliability Engineer", "Cloud Engineer"],
+               ["docker", "kubernetes", "aws", "terraform", "linux", "ci/cd"], "IT", 2),
+}
+
+# location: relative frequency
+LOCATIONS = {
+    "Bangalore": 10, "Mumbai": 7, "Delhi": 6, "Hyderabad": 6, "Pune": 5, "Chennai": 5, "Remote": 8,
+    "Gurgaon": 4, "Noida": 3, "Kolkata": 3, "Ahmedabad": 2, "Kochi": 1, "Jaipur": 1, "Chandigarh": 1,
+}
+
+JOB_TYPES = {"full-time": 75, "part-time": 10, "contract": 8, "internship": 4, "freelance": 3}
+
+COMPANY_PREFIXES = ["Tech", "Inno", "Data", "Cloud", "Bright", "Nova", "Quantum", "Green", "Blue", "Prime",
+                    "Smart", "Next", "Core", "Vertex", "Apex", "Silver", "Urban", "Bharat", "Sun", "Peak"]
+COMPANY_SUFFIXES = ["Corp", "Labs", "Systems", "Works", "Solutions", "Digital", "Soft", "Analytics",
+                    "Ventures", "Global", "Networks", "Partners", "Tech", "Hub", "Group"]
+
+FAQ_CATEGORIES = {
+    "Account and Profile": ["my profile", "my resume", "my password", "my account", "my email address",
+                            "my profile photo", "my work history", "my skills section", "my notification settings",
+                            "my privacy settings"],
+    "Job Search": ["a job alert", "a saved job", "a job application", "remote jobs", "part-time jobs",
+                   "jobs near me", "a recommended job", "an application status", "a job filter", "internships"],
+    "Returning to Work": ["a returnship", "a career break", "a restart program", "flexible roles",
+                          "a career counselling session", "a skill refresher course", "a comeback plan",
+                          "a return-to-work mentor", "re-entry jobs", "a resume gap explanation"],
+    "Events and Mentorship": ["a mentor", "a webinar", "a workshop", "a mentorship session", "an event recording",
+                              "a community group", "a networking meetup", "a discussion forum",
+                              "an event certificate", "a speaker session"],
+    "Platform Features and Benefits": ["the HerKey app", "a premium membership", "a course", "a badge",
+                                       "the career quiz", "a learning path", "the resume builder",
+                                       "a company review", "the salary guide", "the referral program"],
+}
+FAQ_VERBS = ["create", "update", "delete", "find", "share", "download", "upload", "edit", "apply for",
+             "cancel", "join", "book", "track", "recover", "verify", "change", "report", "access",
+             "renew", "hide"]
+FAQ_CONTEXTS = ["", " from my phone", " after a career break", " for free", " without an account",
+                " in Hindi", " on the website", " as a fresher", " as a returning professional",
+                " for a friend", " quickly", " more than once", " outside India", " during a notice period",
+                " while working full-time", " on weekends", " with a disability", " as a recruiter",
+                " for my team", " before the deadline", " after applying", " from LinkedIn",
+                " using my Google account", " with an old email", " in the new app version"]
+FAQ_DEVICES = ["", " on Android", " on iOS", " on desktop"]
+
+FAQ_CANONICAL = "How do I {verb} {obj}{context}?"
+FAQ_PARAPHRASES = [
+    "What is the best way to {verb} {obj}{context}?",
+    "can i {verb} {obj}{context} on herkey",
+    "I want to {verb} {obj}{context}, what should I do?",
+    "Is it possible to {verb} {obj}{context}?",
+    "steps to {verb} {obj}{context}",
+    "Please help me {verb} {obj}{context}",
+]
+FAQ_ANSWER = ("To {verb} {obj}{context}, sign in to HerKey, open {section} from the menu and follow the "
+              "on-screen steps. If anything goes wrong, write to support and we will help within two working days.")
+FAQ_SECTIONS = {
+    "Account and Profile": "Settings", "Job Search": "Jobs", "Returning to Work": "Restart",
+    "Events and Mentorship": "Community", "Platform Features and Benefits": "Explore",
+}
+
+EVENT_TOPICS = ["Women in Tech", "Resume Building", "Interview Skills", "Negotiating Your Salary",
+                "Returning to Work", "Leadership for Women", "Personal Branding", "LinkedIn Profile",
+                "Data Science Careers", "Product Management", "UX Design", "Public Speaking",
+                "Financial Planning", "Work-Life Balance", "Entrepreneurship", "Cloud Computing",
+                "Digital Marketing", "Career Switching", "Mentoring Circles", "AI for Everyone",
+                "Networking Skills", "Remote Work", "Freelancing", "Mental Wellbeing at Work"]
+EVENT_FORMATS = {"event": ["Workshop", "Meetup", "Conference", "Hackathon", "Career Fair", "Summit"],
+                 "session": ["Webinar", "Masterclass", "Q&A Session", "Fireside Chat", "Bootcamp", "Clinic"]}
+EVENT_TIMES = ["10:00 AM", "11:00 AM", "12:30 PM", "2:00 PM", "3:30 PM", "5:00 PM", "6:30 PM", "7:00 PM"]
+EVENT_LOCATIONS = {"Online": 6, "Bangalore": 2, "Mumbai": 2, "Delhi": 1, "Hyderabad": 1, "Pune": 1, "Chennai": 1}
+EVENT_DESCRIPTION = "Join us for a {format_lower} on {topic_lower} with practical advice from women leaders."
+
+
+def _weights(table):
+    values = np.array(list(table.values()), dtype=float)
+    return values / values.sum()
+
+
+def generate_jobs(rng, count, path, chunk_size=JOB_CHUNK_SIZE):
+    """
+    Write count job listings to path in the job_listing_data.csv schema.
+
+    Rows are generated column-wise per chunk, so memory stays bounded by the
+    chunk size regardless of count.
+    """
+    role_names = list(ROLES)
+    titles = np.array([[spec[0][v] for v in range(3)] for spec in ROLES.values()], dtype=object)
+    skill_sets = np.array([[" ".join(combo) for combo in itertools.combinations(spec[1], 3)]
+                           for spec in ROLES.values()], dtype=object)
+    industries = np.array([spec[2] for spec in ROLES.values()], dtype=object)
+    roles = np.array(role_names, dtype=object)
+    role_p = _weights({name: spec[3] for name, spec in ROLES.items()})
+    companies = np.array([p + s for p in COMPANY_PREFIXES for s in COMPANY_SUFFIXES], dtype=object)
+    locations = np.array(list(LOCATIONS), dtype=object)
+    job_types = np.array(list(JOB_TYPES), dtype=object)
+    seniority = np.array(["Junior ", "", "Senior ", "Lead "], dtype=object)
+
+    written = 0
+    with open(path, "w", newline="") as f:
+        while written < count:
+            n = min(chunk_size, count - written)
+            role = rng.choice(len(roles), size=n, p=role_p)
+            experience = np.minimum(rng.geometric(0.22, size=n) - 1, 20)
+            level = np.digitize(experience, [2, 5, 9])
+            title = seniority[level] + titles[role, rng.integers(3, size=n)]
+            frame = pd.DataFrame({
+                "title": title,
+                "company": companies[rng.integers(len(companies), size=n)],
+                "role": roles[role],
+                "location": locations[rng.choice(len(locations), size=n, p=_weights(LOCATIONS))],
+                "job_type": job_types[rng.choice(len(job_types), size=n, p=_weights(JOB_TYPES))],
+                "experience": experience,
+                "skills": skill_sets[role, rng.integers(skill_sets.shape[1], size=n)],
+                "industry": industries[role],
+            })
+            frame.to_csv(f, header=written == 0, index=False)
+            written += n
+    return written
+
+
+def _faq_space():
+    objects = [(category, obj) for category, objs in FAQ_CATEGORIES.items() for obj in objs]
+    return objects, len(FAQ_VERBS) * len(objects) * len(FAQ_CONTEXTS) * len(FAQ_DEVICES)
+
+
+def generate_faqs(rng, count, paraphrases_per_question, path, paraphrase_path):
+    """
+    Write count distinct FAQ entries to path in the faqs.json schema, and
+    reworded versions of them to paraphrase_path.
+    """
+    objects, space = _faq_space()
+    if count > space:
+        raise ValueError(f"At most {space} distinct FAQs can be generated, {count} requested")
+
+    categories = {category: [] for category in FAQ_CATEGORIES}
+    paraphrases = []
+    for index in sorted(rng.choice(space, size=count, replace=False).tolist()):
+        index, device_index = divmod(index, len(FAQ_DEVICES))
+        index, context_index = divmod(index, len(FAQ_CONTEXTS))
+        verb_index, object_index = divmod(index, len(objects))
+        category, obj = objects[object_index]
+        fields = {"verb": FAQ_VERBS[verb_index], "obj": obj,
+                  "context": FAQ_CONTEXTS[context_index] + FAQ_DEVICES[device_index]}
+
+        question = FAQ_CANONICAL.format(**fields)
+        categories[category].append({
+            "question": question,
+            "answer": FAQ_ANSWER.format(section=FAQ_SECTIONS[category], **fields),
+        })
+        for template_index in rng.choice(len(FAQ_PARAPHRASES), size=paraphrases_per_question, replace=False):
+            paraphrases.append({"message": FAQ_PARAPHRASES[template_index].format(**fields), "question": question})
+
+    with open(path, "w") as f:
+        json.dump({"faq": [{"category": name, "questions": questions}
+                           for name, questions in categories.items() if questions]}, f, indent=1)
+    with open(paraphrase_path, "w") as f:
+        json.dump(paraphrases, f, indent=1)
+    return count, len(paraphrases)
+
+
+def generate_events(rng, count, start, days, session_share, path):
+    """Write count events and sessions spread over days from start, in the Session Details.json schema."""
+    location_names = list(EVENT_LOCATIONS)
+    location_p = _weights(EVENT_LOCATIONS)
+    entries = []
+    for entry_id in range(1, count + 1):
+        entry_type = "session" if rng.random() < session_share else "event"
+        topic = EVENT_TOPICS[rng.integers(len(EVENT_TOPICS))]
+        event_format = EVENT_FORMATS[entry_type][rng.integers(len(EVENT_FORMATS[entry_type]))]
+        day = start + timedelta(days=int(rng.integers(days)))
+        entries.append({
+            "id": entry_id,
+            "type": entry_type,
+            "title": f"{topic} {event_format}",
+            "date": f"{day:%B} {day.day}, {day.year}",
+            "time": EVENT_TIMES[rng.integers(len(EVENT_TIMES))],
+            "location": location_names[rng.choice(len(location_names), p=location_p)],
+            "description": EVENT_DESCRIPTION.format(format_lower=event_format.lower(), topic_lower=topic.lower()),
+        })
+    with open(path, "w") as f:
+        json.dump(entries, f, indent=1)
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate seeded, schema-compatible datasets at scale.")
+    parser.add_argument("--jobs", type=int, default=100_000, help="Job listings to generate (0 to skip)")
+    parser.add_argument("--faqs", type=int, default=10_000, help="FAQ questions to generate (0 to skip)")
+    parser.add_argument("--paraphrases", type=int, default=2, help="Reworded variants per FAQ question")
+    parser.add_argument("--events", type=int, default=2_000, help="Events and sessions to generate (0 to skip)")
+    parser.add_argument("--session-share", type=float, default=0.4, help="Fraction of calendar entries that are sessions")
+    parser.add_argument("--start-date", type=lambda s: datetime.strptime(s, "%Y-%m-%d").date(),
+                        default=date.today(), help="First calendar day (YYYY-MM-DD); defaults to today")
+    parser.add_argument("--days", type=int, default=365, help="Days the calendar spans")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT_DIR, help="Directory to write the datasets to")
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+    # Independent streams per dataset, so changing one size leaves the others unchanged
+    job_rng, faq_rng, event_rng = (np.random.default_rng(seq) for seq in np.random.SeedSequence(args.seed).spawn(3))
+    manifest = {"seed": args.seed, "start_date": args.start_date.isoformat(), "days": args.days}
+
+    if args.jobs:
+        manifest["jobs"] = generate_jobs(job_rng, args.jobs, os.path.join(args.output, "job_listing_data.csv"))
+        print(f"Wrote {manifest['jobs']} job listings", file=sys.stderr)
+    if args.faqs:
+        manifest["faqs"], manifest["faq_paraphrases"] = generate_faqs(
+            faq_rng, args.faqs, args.paraphrases,
+            os.path.join(args.output, "faqs.json"), os.path.join(args.output, "faq_paraphrases.json"))
+        print(f"Wrote {manifest['faqs']} FAQs and {manifest['faq_paraphrases']} paraphrases", file=sys.stderr)
+    if args.events:
+        manifest["events"] = generate_events(event_rng, args.events, args.start_date, args.days,
+                                             args.session_share, os.path.join(args.output, "Session Details.json"))
+        print(f"Wrote {manifest['events']} events and sessions", file=sys.stderr)
+
+    with open(os.path.join(args.output, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=1)
+    print(f"Datasets written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""
+Concurrent conversation load generator for the Rasa REST webhook.
+
+Replays scripted conversations (greeting -> job search form -> events -> FAQ,
+plus the stories in tests/test_stories.yml) from many simulated users at
+once and reports throughput, error rate and latency percentiles per step.
+
+Typical local setup, with Gemini replaced by the stub:
+
+    python -m benchmarks.gemini_stub --port 8787
+    GEMINI_API_KEY=stub GEMINI_API_BASE=http://localhost:8787/v1beta/models/gemini-1.5-flash rasa run actions
+    rasa run --enable-api
+    python -m benchmarks.load_webhook --conversations 500 --rate 20 --concurrency 100
+"""
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+from collections import defaultdict
+
+import yaml
+import aiohttp
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_URL = "http://localhost:5005/webhooks/rest/webhook"
+DEFAULT_STORIES = os.path.join(ROOT, "tests", "test_stories.yml")
+
+# (step name, message) pairs of the main scripted conversation
+JOB_SEARCH_SCRIPT = [
+    ("greet", "Hello"),
+    ("search_job", "I'm looking for a job"),
+    ("job_role", "Software developer"),
+    ("location", "Bangalore"),
+    ("experience", "3 years"),
+    ("events", "Tell me about upcoming events"),
+    ("faq", "What is HerKey?"),
+]
+
+
+def load_story_scripts(path):
+    """
+    Turn the user turns of each test story into a script.
+
+    Steps are named after the story's intent labels, so the same intent is
+    aggregated across stories.
+
+    Returns:
+        dict: Story name -> list of (step name, message)
+    """
+    with open(path, "r") as f:
+        stories = (yaml.safe_load(f) or {}).get("stories", [])
+
+    scripts = {}
+    for story in stories:
+        script = [
+            (f"story:{step.get('intent', 'user')}", step["user"].strip())
+            for step in story.get("steps", []) if "user" in step
+        ]
+        if script:
+            scripts[story.get("story", f"story {len(scripts) + 1}")] = script
+    return scripts
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+class LoadStats:
+    """Per-step latency samples and outcome counts."""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.empty = defaultdict(int)
+        self.error_kinds = defaultdict(int)
+        self.conversations = 0
+        self.failed_conversations = 0
+
+    def record(self, step, latency, error=None, empty=False):
+        self.latencies[step].append(latency)
+        if error:
+            self.errors[step] += 1
+            self.error_kinds[error] += 1
+        elif empty:
+            self.empty[step] += 1
+
+    def summary(self, elapsed):
+        steps = {}
+        total = errors = 0
+        for step, samples in self.latencies.items():
+            samples = sorted(samples)
+            total += len(samples)
+            errors += self.errors[step]
+            steps[step] = {
+                "requests": len(samples),
+                "errors": self.errors[step],
+                "error_rate": self.errors[step] / len(samples),
+                "empty_responses": self.empty[step],
+                "p50_ms": percentile(samples, 0.50) * 1000,
+                "p95_ms": percentile(samples, 0.95) * 1000,
+                "p99_ms": percentile(samples, 0.99) * 1000,
+                "max_ms": samples[-1] * 1000,
+            }
+        return {
+            "elapsed_s": elapsed,
+            "conversations": self.conversations,
+            "failed_conversations": self.failed_conversations,
+            "requests": total,
+            "throughput_rps": total / elapsed if elapsed else 0.0,
+            "error_rate": errors / total if total else 0.0,
+            "error_kinds": dict(self.error_kinds),
+            "steps": steps,
+        }
+
+
+async def run_conversation(session, url, sender, script, stats, think_time, rng):
+    """Send the script's messages in order as one user; stop at the first failed turn."""
+    failed = False
+    for step, message in script:
+        started = time.perf_counter()
+        error = None
+        empty = False
+        try:
+            async with session.post(url, json={"sender": sender, "message": message}) as response:
+                if response.status != 200:
+                    error = f"http_{response.status}"
+                    await response.read()
+                else:
+                    empty = not await response.json(content_type=None)
+        except asyncio.TimeoutError:
+            error = "timeout"
+        except aiohttp.ClientError as e:
+            error = type(e).__name__
+        except ValueError:
+            error = "invalid_json"
+        stats.record(step, time.perf_counter() - started, error, empty)
+
+        if error:
+            failed = True
+            break
+        if think_time:
+            await asyncio.sleep(rng.expovariate(1.0 / think_time))
+
+    stats.conversations += 1
+    stats.failed_conversations += failed
+
+
+async def run_load(args, scripts):
+    stats = LoadStats()
+    rng = random.Random(args.seed)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    timeout = aiohttp.ClientTimeout(total=args.timeout)
+    connector = aiohttp.TCPConnector(limit=args.concurrency)
+    script_names = list(scripts)
+    run_id = int(time.time())
+
+    async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+        async def user(n):
+            async with semaphore:
+                # Main script for most users, stories for the rest
+                name = script_names[0] if rng.random() < args.script_share else rng.choice(script_names)
+                await run_conversation(session, args.url, f"load_{run_id}_{n}", scripts[name],
+                                       stats, args.think_time, rng)
+
+        started = time.perf_counter()
+        tasks = []
+        for n in range(args.conversations):
+            tasks.append(asyncio.ensure_future(user(n)))
+            if args.rate > 0:
+                # Open-loop Poisson arrivals, independent of how fast the server answers
+                await asyncio.sleep(rng.expovariate(args.rate))
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+
+    return stats.summary(elapsed)
+
+
+def print_report(summary):
+    print(f"{summary['conversations']} conversations, {summary['requests']} requests in "
+          f"{summary['elapsed_s']:.1f}s: {summary['throughput_rps']:.1f} req/s, "
+          f"error rate {summary['error_rate'] * 100:.2f}%")
+    if summary["error_kinds"]:
+        print("errors: " + ", ".join(f"{kind}={count}" for kind, count in sorted(summary["error_kinds"].items())))
+    header = f"{'step':<24}{'requests':>10}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+    print(header)
+    print("-" * len(header))
+    for step, row in summary["steps"].items():
+        print(f"{step:<24}{row['requests']:>10}{row['errors']:>8}{row['p50_ms']:>10.1f}"
+              f"{row['p95_ms']:>10.1f}{row['p99_ms']:>10.1f}{row['max_ms']:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay concurrent conversations against the REST webhook.")
+    parser.add_argument("--url", default=DEFAULT_URL, help="REST webhook URL")
+    parser.add_argument("--conversations", type=int, default=200, help="Conversations to run in total")
+    parser.add_argument("--rate", type=float, default=10.0,
+                        help="New conversations per second (Poisson); 0 starts them all at once")
+    parser.add_argument("--concurrency", type=int, default=50, help="Maximum conversations in progress")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Mean seconds a user pauses between turns")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Seconds before a request counts as failed")
+    parser.add_argument("--stories", default=DEFAULT_STORIES, help="Test stories to replay as well ('' to skip)")
+    parser.add_argument("--script-share", type=float, default=0.7,
+                        help="Fraction of users following the job-search script rather than a story")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for arrivals and script choice")
+    parser.add_argument("--output", help="Write the summary as JSON to this path")
+    args = parser.parse_args()
+
+    scripts = {"job_search": JOB_SEARCH_SCRIPT}
+    if args.stories and os.path.exists(args.stories):
+        scripts.update(load_story_scripts(args.stories))
+
+    summary = asyncio.run(run_load(args, scripts))
+    print_report(summary)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2)
+        print(f"\nSummary written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# test_cache_warmer.py
+import asyncio
+
+from utils import herkey_search
+from utils.herkey_search import HerkeyJobSearch
+from utils.job_cache import JobSearchCache
+from utils.cache_warmer import CacheWarmer
+from utils.rate_limiter import GeminiRateLimiter, RateLimitExceeded, TokenBucket
+
+class StubSearch(HerkeyJobSearch):
+    """HerkeyJobSearch whose Gemini request is replaced by a counter."""
+
+    def __init__(self, cache, rate_limiter=None):
+        super().__init__(cache=cache, rate_limiter=rate_limiter or GeminiRateLimiter(TokenBucket(rate=100, capacity=10)))
+        self.api_key = "test-key"
+        self.requests = []
+        self.background = []
+
+    async def _request_jobs(self, job_role, location=None, experience=None, background=False):
+        if not await self.rate_limiter.acquire(background=background):
+            raise RateLimitExceeded("Gemini API rate limit reached")
+        self.requests.append((job_role, location))
+        self.background.append(background)
+        await asyncio.sleep(0.01)
+        return [{"title": f"{job_role} #{len(self.requests)}", "company": "Acme"}]
+
+def test_warmer_refreshes_logged_and_seed_queries():
+    async def run():
+        engine = StubSearch(JobSearchCache())
+        await engine.fetch_jobs("ux designer", "Pune")
+        warmer = CacheWarmer(engine, roles=["marketing"], locations=["Delhi", "Remote"], top_n=3, interval=60, pace=0)
+
+        assert warmer.popular_queries() == [("ux designer", "pune"), ("marketing", "delhi"), ("marketing", "remote")]
+        warmed = await warmer.warm_once()
+        # The logged query is already fresh in the cache, so only the seeds are fetched
+        return engine, warmed
+
+    engine, warmed = asyncio.run(run())
+    assert warmed == 2
+    assert engine.requests == [("ux designer", "Pune"), ("marketing", "delhi"), ("marketing", "remote")]
+    assert engine.background == [False, True, True]
+    assert engine.cache.get("Marketing", "Delhi") is not None
+
+def test_warmer_probes_do_not_count_as_cache_traffic():
+    async def run():
+        engine = StubSearch(JobSearchCache())
+        await engine.fetch_jobs("marketing", "Delhi")
+        before = engine.cache.stats()
+        warmer = CacheWarmer(engine, roles=["marketing"], locations=["Delhi", "Pune"], interval=60, pace=0)
+        await warmer.warm_once()
+        return before, engine.cache.stats()
+
+    before, after = asyncio.run(run())
+    assert (after["hits"], after["misses"]) == (before["hits"], before["misses"])
+
+def test_stale_result_is_served_while_refreshing():
+    async def run():
+        engine = StubSearch(JobSearchCache(ttl=0, stale_ttl=60))
+        first = await engine.fetch_jobs("marketing", "Delhi")
+        second = await engine.fetch_jobs("marketing", "Delhi")
+        await asyncio.sleep(0.05)
+        return engine, first, second
+
+    engine, first, second = asyncio.run(run())
+    assert second == first, "Stale copy should be returned immediately"
+    assert len(engine.requests) == 2, "A background refresh should have been made"
+    assert engine.cache.get("marketing", "Delhi")[0]["title"] == "marketing #2"
+
+def test_warmer_leaves_reserved_tokens_to_users():
+    async def run():
+        # Three tokens and a reserve of two: one background refresh fits
+        limiter = GeminiRateLimiter(TokenBucket(rate=0.001, capacity=3), background_reserve=2)
+        engine = StubSearch(JobSearchCache(), rate_limiter=limiter)
+        warmer = CacheWarmer(engine, roles=["marketing", "design"], locations=["Delhi", "Pune"], interval=60, pace=0.01)
+        warmed = await warmer.warm_once()
+        user_jobs = await engine.fetch_jobs("data science", "Mumbai")
+        return engine, warmer, warmed, user_jobs
+
+    engine, warmer, warmed, user_jobs = asyncio.run(run())
+    assert warmed == 1
+    assert warmer.stats()["deferred"] == 1, "The pass should stop at the first refresh turned away"
+    assert engine.rate_limiter.stats()["rejected"] == 0
+    assert user_jobs is not None, "Users still get the tokens the warmer left"
+
+def test_query_counts_are_bounded_and_decay(monkeypatch):
+    monkeypatch.setattr(herkey_search, "JOB_QUERY_LOG_SIZE", 2)
+
+    async def run():
+        engine = StubSearch(JobSearchCache())
+        for _ in range(3):
+            await engine.fetch_jobs("marketing", "Delhi")
+        for n in range(5):
+            await engine.fetch_jobs(f"role {n}", "Pune")
+        return engine
+
+    engine = asyncio.run(run())
+    assert len(engine.query_counts) <= 4
+    assert engine.query_counts.most_common(1)[0][1] == 3
+
+    engine.decay_query_counts()
+    assert list(engine.query_counts.values()) == [1], "Queries asked once are forgotten after a pass"
@@ -0,0 +1,62 @@
+# test_event_catalog.py
+import os
+import json
+import tempfile
+
+from datetime import datetime
+
+from utils.event_catalog import EventCatalog, resolve_date_range
+
+ENTRIES = [
+    {"id": 1, "type": "event", "title": "Networking Mixer", "date": "May 25, 2025", "time": "5:00 PM"},
+    {"id": 2, "type": "event", "title": "Resume Building Workshop", "date": "May 15, 2025", "time": "3:30 PM"},
+    {"id": 3, "type": "session", "title": "Career Growth Strategies", "date": "May 12, 2025", "time": "2:00 PM"},
+    {"id": 4, "type": "event", "title": "Date To Be Announced", "date": "TBD", "time": ""},
+]
+
+def write_catalog(directory, entries):
+    path = os.path.join(directory, "Session Details.json")
+    with open(path, 'w') as f:
+        json.dump(entries, f)
+    return path
+
+def test_entries_are_split_and_sorted():
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog = EventCatalog(write_catalog(tmp, ENTRIES)).get()
+        assert [e.id for e in catalog.events] == [2, 1, 4]
+        assert [s.id for s in catalog.sessions] == [3]
+
+def test_catalog_reloads_when_file_changes():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_catalog(tmp, ENTRIES)
+        catalog = EventCatalog(path, check_interval=0)
+        first = catalog.get()
+        assert catalog.get() is first
+
+        write_catalog(tmp, ENTRIES[:1])
+        os.utime(path, (first.mtime + 10, first.mtime + 10))
+        assert [e.id for e in catalog.get().events] == [1]
+
+def test_query_by_date_range_and_keyword():
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog = EventCatalog(write_catalog(tmp, ENTRIES))
+        upcoming = catalog.query('event', start=datetime(2025, 5, 20))
+        assert [e.id for e in upcoming] == [1, 4]
+        may = catalog.query('event', start=datetime(2025, 5, 1), end=datetime(2025, 6, 1))
+        assert [e.id for e in may] == [2, 1]
+        assert [e.id for e in catalog.query('event', keywords=["workshops"])] == [2]
+        assert catalog.query('event', start=datetime(2025, 5, 20), keywords=["workshop"]) == []
+
+def test_resolve_date_range():
+    now = datetime(2025, 5, 14, 15, 30)  # a Wednesday
+    assert resolve_date_range("any events this week?", now) == (datetime(2025, 5, 14), datetime(2025, 5, 19))
+    assert resolve_date_range("events next month", now) == (datetime(2025, 6, 1), datetime(2025, 7, 1))
+    assert resolve_date_range("workshops in march", now) == (datetime(2026, 3, 1), datetime(2026, 4, 1))
+    assert resolve_date_range("may I see the events", now) == (datetime(2025, 5, 14), None)
+
+if __name__ == "__main__":
+    test_entries_are_split_and_sorted()
+    test_catalog_reloads_when_file_changes()
+    test_query_by_date_range_and_keyword()
+    test_resolve_date_range()
+    print("All event catalog tests passed!")
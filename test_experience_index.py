@@ -0,0 +1,32 @@
+# test_experience_index.py
+import numpy as np
+
+from utils.experience_index import ExperienceIndex, experience_ranges, parse_experience, MAX_EXPERIENCE_YEARS
+
+def test_parse_experience():
+    assert parse_experience(5) == (5.0, 5.0)
+    assert parse_experience("3-5 years") == (3.0, 5.0)
+    assert parse_experience("4 to 2 yrs") == (2.0, 4.0)
+    assert parse_experience("10+ years") == (10.0, MAX_EXPERIENCE_YEARS)
+    assert parse_experience("entry level") == (0.0, 2.0)
+    assert parse_experience("senior level") == (6.0, MAX_EXPERIENCE_YEARS)
+    # A stated number is more specific than a level word
+    assert parse_experience("senior, 7 years") == (7.0, 7.0)
+    assert parse_experience("some") is None
+    assert parse_experience(float("nan")) is None
+
+def test_ranges_parse_each_distinct_value():
+    mins, maxs = experience_ranges([5, "3-5 years", None, "unknown", 5])
+    assert mins.tolist()[:2] == [5.0, 3.0] and maxs.tolist()[:2] == [5.0, 5.0]
+    assert np.isnan(mins[2]) and np.isnan(mins[3])
+    assert mins[4] == 5.0
+
+def test_lookup_is_an_overlap_not_a_digit_match():
+    mins, maxs = experience_ranges([1, 10, 11, "1-3 years", 15, None, "entry level"])
+    index = ExperienceIndex(mins, maxs)
+    assert len(index) == 6
+    # "1 year" used to match 10, 11 and 15 as substrings
+    assert index.lookup("1 year").tolist() == [0, 3, 6]
+    assert index.lookup("10+ years").tolist() == [1, 2, 4]
+    assert index.lookup("mid level").tolist() == [3]
+    assert index.lookup("whatever") is None
@@ -0,0 +1,104 @@
+# test_faq_matcher.py
+import os
+import json
+
+from utils.faq_matcher import FAQMatcher
+
+FAQ_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "faqs.json")
+
+# Reworded questions and the bundled question each should match, by its position in faqs.json
+PARAPHRASES = [
+    ("what is herkey", 0),
+    ("tell me about herkey", 0),
+    ("how is herkey different from other job sites", 1),
+    ("what kind of jobs are on herkey", 2),
+    ("i want to return to work after a career break", 3),
+    ("are there resources to upskill", 4),
+    ("how do i search for jobs", 5),
+    ("how to find jobs on herkey", 5),
+    ("do you have remote jobs", 6),
+    ("what is mentorher", 7),
+    ("how do i enroll in mentorship", 8),
+    ("what events does herkey organize", 9),
+    ("how can i join networking events", 10),
+    ("how to create an account", 11),
+    ("can i update my profile", 12),
+    ("i can't log into my account", 13),
+    ("the website is not loading", 14),
+]
+
+# Messages with no good answer; each must fall through to the default reply
+UNANSWERABLE = [
+    "How can JobsForHer help me?",
+    "is herkey for men",
+    "what's the weather",
+    "tell me a joke",
+    "can I find part time work here",
+    "who won the cricket match",
+    "what is your name",
+    "i like pizza",
+    "book a flight to goa",
+]
+
+def bundled_questions():
+    with open(FAQ_PATH, "r") as f:
+        return [q["question"] for category in json.load(f)["faq"] for q in category["questions"]]
+
+QUESTIONS = [
+    "how can i search for jobs on herkey?",
+    "does herkey offer remote job opportunities?",
+    "how do i create an account on herkey?",
+]
+
+def test_paraphrases_match_the_right_question():
+    matcher = FAQMatcher(QUESTIONS)
+    assert matcher.match("how do i search for jobs")[0] == 0
+    assert matcher.match("how to create an account")[0] == 2
+
+def test_unrelated_message_is_below_threshold():
+    matcher = FAQMatcher(QUESTIONS)
+    assert matcher.match("tell me a joke") is None
+
+def test_top_k_is_sorted():
+    scores = [score for _, score in FAQMatcher(QUESTIONS).top_k("remote jobs on herkey", k=3)]
+    assert scores == sorted(scores, reverse=True)
+
+def test_normalized_messages_hit_the_cache():
+    matcher = FAQMatcher(QUESTIONS)
+    first = matcher.match("How do I search for jobs?")
+    assert matcher.match("  how do i SEARCH for jobs ") == first
+    assert matcher.match("tell me a joke") is None
+    assert matcher.match("Tell me a joke!") is None
+    stats = matcher.cache.stats()
+    assert stats["hits"] == 2 and stats["misses"] == 2
+
+def test_bundled_faq_paraphrases():
+    matcher = FAQMatcher(bundled_questions())
+    results = {message: matcher.match(message) for message, _ in PARAPHRASES}
+    wrong = [message for message, expected in PARAPHRASES
+             if results[message] is not None and results[message][0] != expected]
+    answered = sum(1 for result in results.values() if result is not None)
+    # Unsure matches fall back to the default reply, but a given answer must be the right one
+    assert wrong == []
+    assert answered >= 13, f"Only {answered} of {len(PARAPHRASES)} paraphrases answered"
+
+def test_bundled_faq_rejects_unanswerable_messages():
+    matcher = FAQMatcher(bundled_questions())
+    matched = {message: matcher.match(message) for message in UNANSWERABLE}
+    assert {message: result for message, result in matched.items() if result is not None} == {}
+
+def test_close_runner_up_means_no_answer():
+    matcher = FAQMatcher(bundled_questions())
+    best, second = matcher.top_k("How can JobsForHer help me?", k=2)
+    assert best[1] - second[1] < matcher.margin
+    assert FAQMatcher(bundled_questions(), threshold=0.3, margin=0).match("How can JobsForHer help me?") is not None
+
+if __name__ == "__main__":
+    test_paraphrases_match_the_right_question()
+    test_unrelated_message_is_below_threshold()
+    test_top_k_is_sorted()
+    test_normalized_messages_hit_the_cache()
+    test_bundled_faq_paraphrases()
+    test_bundled_faq_rejects_unanswerable_messages()
+    test_close_runner_up_means_no_answer()
+    print("All FAQ matcher tests passed!")
@@ -0,0 +1,60 @@
+# test_gazetteer.py
+import os
+
+from utils.gazetteer import Gazetteer, trie_pattern
+from utils.location_service import LocationService
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+GAZETTEER_PATH = os.path.join(DATA_DIR, "gazetteer.json")
+LOCATIONS = LocationService.from_file(os.path.join(DATA_DIR, "locations.json"))
+
+def test_extracts_all_three_in_one_pass():
+    gazetteer = Gazetteer.from_file(GAZETTEER_PATH, LOCATIONS)
+    match = gazetteer.extract("Senior software engineer roles in Bengaluru, 8 yrs please")
+    assert match == ("software developer", "Bangalore", "8 years")
+
+    match = gazetteer.extract("any designers jobs I can do from   home? I'm a fresher")
+    assert match == ("designer", "Remote", "entry level")
+    assert gazetteer.extract("show me something") == (None, None, None)
+
+def test_longest_synonym_wins():
+    locations = LocationService([{"id": 1, "name": "Delhi", "kind": "city", "aliases": ["new delhi"]}])
+    gazetteer = Gazetteer({"experience": {"senior level": ["senior"], "senior lead": ["senior lead"]}}, locations)
+    assert gazetteer.extract("senior lead in new delhi") == (None, "Delhi", "senior lead")
+
+def test_canonical_location_only_matches_that_kind():
+    gazetteer = Gazetteer.from_file(GAZETTEER_PATH, LOCATIONS)
+    assert gazetteer.canonical("location", "Bombay") == "Mumbai"
+    assert gazetteer.canonical("location", "marketing") is None
+    assert gazetteer.canonical("location", "Paris") is None
+
+def test_location_spans_agree_with_location_service():
+    gazetteer = Gazetteer.from_file(GAZETTEER_PATH, LOCATIONS)
+    for text in ("Navi Mumbai", "delhi ncr", "Bengaluru", "Gurugram", "from home"):
+        assert gazetteer.extract(f"jobs in {text}").location == LOCATIONS.resolve(text).name, text
+    # Short aliases only count as a whole answer, so they are not spans inside a sentence
+    assert gazetteer.extract("sign me up for marketing").location is None
+
+def test_ambiguous_synonyms_only_count_as_the_whole_message():
+    gazetteer = Gazetteer.from_file(GAZETTEER_PATH, LOCATIONS)
+    assert gazetteer.extract("I want to lead a design team") == (None, None, None)
+    assert gazetteer.extract("can you call me at 3 pm") == (None, None, None)
+    assert gazetteer.extract("moving to ca next month") == (None, None, None)
+    assert gazetteer.extract("entry is free?").experience is None
+    # As the answer to a form question the same words are meant
+    assert gazetteer.extract("Lead").experience == "senior level"
+    assert gazetteer.extract("pm").role == "product manager"
+    assert gazetteer.canonical("role", "design") == "designer"
+
+def test_only_multi_word_roles_replace_a_given_role():
+    gazetteer = Gazetteer.from_file(GAZETTEER_PATH, LOCATIONS)
+    assert gazetteer.explicit_role("actually show me data scientist jobs") == "data science"
+    assert gazetteer.explicit_role("I want to lead a design team") is None
+    assert gazetteer.explicit_role("any developer roles?") is None
+
+def test_trie_pattern_handles_many_terms():
+    terms = [f"title {i}" for i in range(3000)]
+    gazetteer = Gazetteer({"roles": {term: [] for term in terms}})
+    assert gazetteer.extract("hiring a title 2999 now").role == "title 2999"
+    assert gazetteer.extract("hiring a title 29999 now").role is None
+    assert trie_pattern(["ab", "abc"]) == "ab(?:c)?"
@@ -0,0 +1,92 @@
+# test_job_cache.py
+import os
+import asyncio
+import tempfile
+import threading
+
+from utils.job_cache import JobSearchCache, TTLCache, normalize_job_query
+
+def test_ttl_cache_lru_eviction():
+    cache = TTLCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None, "Least recently used entry should be evicted"
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+def test_ttl_cache_expiry():
+    cache = TTLCache(max_size=10, ttl=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+def test_query_normalization():
+    assert normalize_job_query("  Software  Developer", "BANGALORE", "3 years") == \
+        normalize_job_query("software developer", "bangalore", "4 yrs")
+    assert normalize_job_query("designer", None, "entry level")[2] == "entry"
+
+def test_job_search_cache_persists_to_disk():
+    jobs = [{"title": "Backend Engineer", "company": "CloudSystems"}]
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "jobs.db")
+        JobSearchCache(db_path=db_path).set("Software Developer", "Bangalore", "3 years", jobs)
+
+        # A fresh cache (e.g. after a restart) should be warm from the SQLite tier
+        cache = JobSearchCache(db_path=db_path)
+        assert cache.get("software developer", "bangalore", "2 years") == jobs
+        assert cache.get("software developer", "bangalore", "2 years") == jobs
+        stats = cache.stats()
+        assert stats["disk_hits"] == 1
+        assert stats["hits"] == 2
+        assert stats["misses"] == 0
+
+def test_async_disk_access_runs_off_the_event_loop():
+    jobs = [{"title": "Data Analyst", "company": "DataInsights"}]
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "jobs.db")
+        writer, reader = JobSearchCache(db_path=db_path), JobSearchCache(db_path=db_path)
+        disk_threads = []
+        for cache in (writer, reader):
+            for name in ("_load_from_disk", "_save_to_disk"):
+                def record(*args, _method=getattr(cache, name)):
+                    disk_threads.append(threading.get_ident())
+                    return _method(*args)
+                setattr(cache, name, record)
+
+        async def run():
+            await writer.set_async("data science", "Pune", None, jobs)
+            found, fresh_for = await reader.lookup_async("Data Science", "pune")
+            # The second lookup is answered from memory without touching the disk
+            again, _ = await reader.lookup_async("data science", "Pune")
+            return threading.get_ident(), found, fresh_for, again
+
+        loop_thread, found, fresh_for, again = asyncio.run(run())
+    assert found == jobs and again == jobs and fresh_for > 0
+    assert len(disk_threads) == 2 and loop_thread not in disk_threads
+    assert reader.stats()["disk_hits"] == 1
+
+def test_stale_results_are_served_until_the_grace_period_ends():
+    jobs = [{"title": "Data Analyst", "company": "Analytics Pro"}]
+    cache = JobSearchCache(ttl=0, stale_ttl=60)
+    cache.set("data science", "Mumbai", None, jobs)
+
+    cached, fresh_for = cache.lookup("data science", "mumbai")
+    assert cached == jobs
+    assert fresh_for <= 0
+    assert cache.stats()["stale_hits"] == 1
+
+    expired = JobSearchCache(ttl=0, stale_ttl=0)
+    expired.set("data science", "Mumbai", None, jobs)
+    assert expired.get("data science", "Mumbai") is None
+
+if __name__ == "__main__":
+    test_ttl_cache_lru_eviction()
+    test_ttl_cache_expiry()
+    test_query_normalization()
+    test_job_search_cache_persists_to_disk()
+    test_stale_results_are_served_until_the_grace_period_ends()
+    print("All job cache tests passed!")
@@ -0,0 +1,52 @@
+# test_job_cursors.py
+import time
+
+import numpy as np
+
+from utils.job_cursors import JobCursorStore
+from utils.job_index import RankedJobs
+
+def test_pages_advance_until_exhausted():
+    store = JobCursorStore()
+    ranked = RankedJobs("digest", np.arange(12, dtype=np.int32))
+    store.start("alice", "csv", 12, ranked=ranked, shown=5)
+
+    page = store.next_page("alice", 5)
+    assert (page.start, page.stop, page.total) == (5, 10, 12)
+    assert page.cursor.ranked.ids[page.start:page.stop].tolist() == [5, 6, 7, 8, 9]
+    assert store.next_page("alice", 5)[1:] == (10, 12, 12)
+    assert store.next_page("alice", 5)[1:] == (12, 12, 12)
+    assert store.next_page("bob", 5) is None
+
+def test_remote_jobs_are_kept_and_a_new_search_resets():
+    store = JobCursorStore()
+    store.start("alice", "gemini", 3, jobs=[{"title": "A"}, {"title": "B"}, {"title": "C"}], shown=2)
+    page = store.next_page("alice", 2)
+    assert page.cursor.jobs[page.start:page.stop] == [{"title": "C"}]
+
+    store.start("alice", "mock", 1, jobs=[{"title": "Mock"}], shown=1)
+    assert store.next_page("alice", 2)[1:] == (1, 1, 1)
+
+def test_cursors_are_bounded_and_expire():
+    store = JobCursorStore(max_size=2, ttl=0.05)
+    for sender in ("a", "b", "c"):
+        store.start(sender, "mock", 0)
+    assert store.next_page("a", 5) is None
+    assert store.stats()["evictions"] == 1
+    time.sleep(0.06)
+    assert store.next_page("c", 5) is None
+
+def test_only_a_window_of_ids_is_kept_and_refilled():
+    store = JobCursorStore(max_ids=7)
+    ranked = RankedJobs("digest", np.arange(100, 112, dtype=np.int32))
+    query = ("data science", "Pune", None, None, None)
+    store.start("alice", "csv", 12, ranked=ranked, shown=5, query=query)
+
+    page = store.next_page("alice", 5)
+    assert len(page.cursor.ranked.ids) == 7 and page.cursor.query == query
+    assert JobCursorStore.page_ids(page.cursor, page.start, page.stop) is None
+
+    cursor = store.refill("alice", ranked, page.start)
+    assert JobCursorStore.page_ids(cursor, page.start, page.stop).tolist() == [105, 106, 107, 108, 109]
+    page = store.next_page("alice", 5)
+    assert JobCursorStore.page_ids(page.cursor, page.start, page.stop).tolist() == [110, 111]
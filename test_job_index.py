@@ -0,0 +1,64 @@
+# test_job_index.py
+import os
+
+import utils.job_index as job_index_module
+from utils.job_index import JobIndex
+
+CSV_HEADER = "title,company,role,location,job_type,experience,skills,industry\n"
+CSV_ROWS = [
+    "Senior Software Engineer,TechCorp,software developer,Bangalore,full-time,5,python java,IT\n",
+    "Marketing Specialist,BrandWorks,marketing,Mumbai,part-time,2,seo content,Media\n",
+]
+
+def write_csv(path, rows, mtime):
+    with open(path, "w") as f:
+        f.write(CSV_HEADER + "".join(rows))
+    os.utime(path, (mtime, mtime))
+
+def count_loads(monkeypatch):
+    calls = []
+    original = job_index_module.load_job_frame
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(job_index_module, "load_job_frame", counting)
+    return calls
+
+def test_changed_file_is_reloaded(tmp_path, monkeypatch):
+    monkeypatch.setenv("JOB_STORE_DIR", str(tmp_path / "store"))
+    path = str(tmp_path / "jobs.csv")
+    write_csv(path, CSV_ROWS[:1], 1000)
+    index = JobIndex(path, check_interval=0)
+    first = index.load()
+    assert len(first.frame) == 1
+
+    write_csv(path, CSV_ROWS, 2000)
+    second = index.load()
+    assert second is not first and len(second.frame) == 2
+    assert index.search(location="Mumbai")["company"].tolist() == ["BrandWorks"]
+
+def test_bad_file_keeps_previous_snapshot_until_it_changes(tmp_path, monkeypatch):
+    monkeypatch.setenv("JOB_STORE_DIR", str(tmp_path / "store"))
+    path = str(tmp_path / "jobs.csv")
+    write_csv(path, CSV_ROWS, 1000)
+    index = JobIndex(path, check_interval=0)
+    good = index.load()
+
+    # A half-written row with too many fields makes the CSV unparsable
+    calls = count_loads(monkeypatch)
+    write_csv(path, CSV_ROWS + ["Broken,Row,with,far,too,many,fields,for,the,header,here\n"], 2000)
+    assert index.load() is good
+    assert len(calls) == 1
+
+    # Not parsed again while the bad version stays in place, even if touched
+    assert index.load() is good
+    os.utime(path, (3000, 3000))
+    assert index.load() is good
+    assert len(calls) == 1
+    assert len(index.search("engineer")) == 1
+
+    write_csv(path, CSV_ROWS[:1], 4000)
+    assert len(index.load().frame) == 1
+    assert len(calls) == 2
@@ -0,0 +1,32 @@
+# test_job_ranker.py
+from utils.job_ranker import JobRanker, tokenize
+
+JOBS = [
+    {"title": "senior software engineer", "role": "software developer", "location": "bangalore",
+     "job_type": "full-time", "skills": "python java react"},
+    {"title": "machine learning engineer", "role": "data science", "location": "bangalore",
+     "job_type": "full-time", "skills": "python tensorflow"},
+    {"title": "marketing specialist", "role": "marketing", "location": "mumbai",
+     "job_type": "part-time", "skills": "seo content"},
+]
+
+def test_tokenize_normalizes_plurals_and_stop_words():
+    assert tokenize("Developers in Bangalore") == ["developer", "bangalore"]
+
+def test_multi_word_role_is_ranked():
+    ranker = JobRanker(JOBS)
+    ranked = ranker.search("ml engineer python")
+    assert ranked[0][0] == 1
+    assert 2 not in [doc_id for doc_id, _ in ranked]
+
+def test_filters_restrict_candidates():
+    ranker = JobRanker(JOBS)
+    assert [doc_id for doc_id, _ in ranker.search("engineer", location="Mumbai")] == []
+    assert [doc_id for doc_id, _ in ranker.search(None, location="mumbai")] == [2]
+    assert [doc_id for doc_id, _ in ranker.search("engineer", skill="java")] == [0]
+
+if __name__ == "__main__":
+    test_tokenize_normalizes_plurals_and_stop_words()
+    test_multi_word_role_is_ranked()
+    test_filters_restrict_candidates()
+    print("All job ranker tests passed!")
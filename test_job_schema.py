@@ -0,0 +1,45 @@
+# test_job_schema.py
+import utils.herkey_search as herkey_search
+from utils.herkey_search import HerkeyJobSearch, supports_response_schema
+from utils.job_schema import parse_jobs, validate_job, job_url
+
+def test_valid_jobs_survive_invalid_neighbours():
+    text = '''[
+        {"title": "Data Analyst", "company": "Acme", "location": "Pune", "type": "Full-time", "posted_date": "2 days ago"},
+        {"title": "", "company": "Nameless"},
+        "not a job",
+        {"title": "QA Engineer", "company": "Initech", "location": "Remote"}
+    ]'''
+    jobs, rejected = parse_jobs(text)
+    assert [job["title"] for job in jobs] == ["Data Analyst", "QA Engineer"]
+    assert rejected == 2
+    assert jobs[1]["type"] == "Full-time"
+    assert jobs[1]["url"] == "https://herkey.com/jobs/apply/qa-engineer"
+
+def test_truncated_output_keeps_complete_jobs():
+    text = '[{"title": "UX Designer", "company": "Globex"}, {"title": "PM", "comp'
+    jobs, rejected = parse_jobs(text)
+    assert [job["company"] for job in jobs] == ["Globex"]
+    assert rejected == 0
+
+def test_validate_job_coerces_values():
+    job = validate_job({"title": "  Backend Dev ", "company": 42, "location": ["x"],
+                        "url": "https://evil.example/phish"})
+    assert job["title"] == "Backend Dev"
+    assert job["company"] == "42"
+    assert job["location"] == ""
+    assert job["url"] == job_url("Backend Dev")
+    assert validate_job(["title"]) is None
+
+def test_response_schema_only_sent_to_v1beta(monkeypatch):
+    base = "https://generativelanguage.googleapis.com/{}/models/gemini-1.5-flash"
+    assert supports_response_schema(herkey_search.GEMINI_API_BASE)
+    assert not supports_response_schema(base.format("v1"))
+
+    search = HerkeyJobSearch()
+    assert "responseSchema" in search._build_request("designer")["generationConfig"]
+
+    monkeypatch.setattr(herkey_search, "GEMINI_API_BASE", base.format("v1"))
+    body = search._build_request("designer")
+    assert "responseSchema" not in body["generationConfig"]
+    assert "JSON array" in body["contents"][0]["parts"][0]["text"]
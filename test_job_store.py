@@ -0,0 +1,91 @@
+# test_job_store.py
+import os
+import json
+
+import pandas as pd
+
+import utils.job_store as job_store
+from utils.job_store import META_FILE, STORE_FORMAT, load_job_frame, read_store, write_store
+
+CSV = (
+    "title,company,location,experience\n"
+    "Senior Software Engineer,TechCorp,Bangalore,5\n"
+    "Data Analyst,DataCo,Mumbai,2\n"
+    "Backend Engineer,TechCorp,Bangalore,3\n"
+)
+
+def write_csv(tmp_path, text=CSV):
+    path = tmp_path / "jobs.csv"
+    path.write_text(text)
+    return str(path)
+
+def add_upper(frame):
+    frame["title_uc"] = frame["title"].str.upper()
+    return frame
+
+def test_round_trip_keeps_values_and_encodes_strings(tmp_path):
+    frame = pd.read_csv(write_csv(tmp_path))
+    store_dir = str(tmp_path / "store")
+    os.makedirs(store_dir)
+    meta = write_store(frame, store_dir, "abc")
+
+    kinds = {column["name"]: column["kind"] for column in meta["columns"]}
+    assert kinds == {"title": "dictionary", "company": "dictionary", "location": "dictionary", "experience": "numeric"}
+    assert next(c for c in meta["columns"] if c["name"] == "company")["categories"] == ["TechCorp", "DataCo"]
+
+    loaded = read_store(store_dir)
+    assert isinstance(loaded["company"].dtype, pd.CategoricalDtype)
+    assert loaded["experience"].tolist() == [5, 2, 3]
+    for column in frame.columns:
+        assert loaded[column].tolist() == frame[column].tolist()
+    # Only the finished build is left; no temporary directories
+    assert sorted(os.listdir(store_dir)) == sorted([META_FILE, meta["build"]])
+
+def test_digest_and_version_changes_force_a_rebuild(tmp_path):
+    path = write_csv(tmp_path)
+    store_dir = str(tmp_path / "store")
+    load_job_frame(path, store_dir=store_dir, prepare=add_upper, version="1")
+    with open(os.path.join(store_dir, META_FILE)) as f:
+        meta = json.load(f)
+    assert (meta["format"], meta["version"]) == (STORE_FORMAT, "1")
+
+    # Same CSV and version: served from the store without preparing again
+    calls = []
+    load_job_frame(path, store_dir=store_dir, prepare=lambda f: calls.append(f) or f, version="1")
+    assert calls == []
+
+    # A new version of the derived columns is rebuilt rather than reused
+    frame = load_job_frame(path, store_dir=store_dir, prepare=lambda f: f.assign(title_uc="x"), version="2")
+    assert set(frame["title_uc"]) == {"x"}
+
+    # So is a changed CSV
+    with open(path, "a") as f:
+        f.write("Designer,ArtCo,Pune,1\n")
+    frame = load_job_frame(path, store_dir=store_dir, prepare=add_upper, version="2")
+    assert frame["title_uc"].tolist()[-1] == "DESIGNER"
+    assert len([entry for entry in os.listdir(store_dir) if entry != META_FILE]) == 1
+
+def test_falls_back_to_the_csv_when_the_store_fails(tmp_path, monkeypatch):
+    path = write_csv(tmp_path)
+
+    def broken(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(job_store, "write_store", broken)
+    frame = load_job_frame(path, store_dir=str(tmp_path / "store"), prepare=add_upper)
+    assert frame["title_uc"].tolist()[0] == "SENIOR SOFTWARE ENGINEER"
+    assert not isinstance(frame["title"].dtype, pd.CategoricalDtype)
+
+def test_failed_build_leaves_no_temporary_directory(tmp_path, monkeypatch):
+    store_dir = str(tmp_path / "store")
+    os.makedirs(store_dir)
+
+    def broken(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(job_store.np, "save", broken)
+    try:
+        write_store(pd.read_csv(write_csv(tmp_path)), store_dir, "abc")
+    except OSError:
+        pass
+    assert os.listdir(store_dir) == []
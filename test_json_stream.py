@@ -0,0 +1,34 @@
+# test_json_stream.py
+from utils.json_stream import JSONArrayStreamParser
+
+JOBS_TEXT = '''```json
+[
+  {"title": "Data Analyst", "company": "Acme {Labs}", "tags": ["sql", "excel"]},
+  {"title": "Backend \\"Go\\" Developer", "company": "Initech"}
+]
+```'''
+
+def test_objects_are_yielded_as_soon_as_complete():
+    parser = JSONArrayStreamParser()
+    first_end = JOBS_TEXT.index('},') + 1
+
+    assert parser.feed(JOBS_TEXT[:first_end - 1]) == []
+    first = parser.feed(JOBS_TEXT[first_end - 1:first_end])
+    assert first == [{"title": "Data Analyst", "company": "Acme {Labs}", "tags": ["sql", "excel"]}]
+
+    rest = parser.feed(JOBS_TEXT[first_end:])
+    assert rest == [{"title": 'Backend "Go" Developer', "company": "Initech"}]
+    assert parser.done
+
+def test_single_character_chunks():
+    parser = JSONArrayStreamParser()
+    jobs = []
+    for char in JOBS_TEXT:
+        jobs.extend(parser.feed(char))
+    assert [job["company"] for job in jobs] == ["Acme {Labs}", "Initech"]
+
+def test_malformed_objects_are_skipped():
+    parser = JSONArrayStreamParser()
+    jobs = parser.feed('[{"title": "QA"}, {"title": oops}, {"title": "PM"}]')
+    assert jobs == [{"title": "QA"}, {"title": "PM"}]
+    assert parser.errors == 1
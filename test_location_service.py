@@ -0,0 +1,73 @@
+# test_location_service.py
+import os
+
+import pandas as pd
+
+from utils.job_index import build_location_ids
+from utils.location_service import LocationService
+
+LOCATIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "locations.json")
+
+ENTRIES = [
+    {"id": 1, "name": "Remote", "kind": "remote", "aliases": ["wfh", "work from home"], "standalone": ["anywhere"]},
+    {"id": 10, "name": "Maharashtra", "kind": "state", "aliases": ["mh"]},
+    {"id": 11, "name": "Uttar Pradesh", "kind": "state", "aliases": ["up"]},
+    {"id": 100, "name": "Mumbai", "kind": "city", "state": "Maharashtra", "aliases": ["bombay"]},
+    {"id": 101, "name": "Navi Mumbai", "kind": "city", "state": "Maharashtra"},
+    {"id": 102, "name": "Pune", "kind": "city", "state": "Maharashtra"},
+    {"id": 103, "name": "Bangalore", "kind": "city", "aliases": ["bengaluru"]},
+]
+
+def test_aliases_and_longest_name_win():
+    service = LocationService(ENTRIES)
+    assert service.resolve("Bombay") == (100, "Mumbai", (100,), "alias")
+    assert service.resolve("jobs in Navi Mumbai please").name == "Navi Mumbai"
+    assert service.resolve("I'd like to work from home").id == 1
+    assert service.resolve("Maharashtra").ids == (10, 100, 101, 102)
+
+def test_short_and_standalone_aliases_must_be_the_whole_input():
+    service = LocationService(ENTRIES)
+    assert service.resolve("UP").name == "Uttar Pradesh"
+    assert service.resolve("mh").ids == (10, 100, 101, 102)
+    assert service.resolve("anywhere").name == "Remote"
+    assert service.resolve("sign me up") is None
+    assert service.resolve("I can move anywhere") is None
+    assert service.resolve("mh jobs") is None
+
+def test_fuzzy_matching_is_bounded():
+    service = LocationService(ENTRIES)
+    assert service.resolve("Banglore") == (103, "Bangalore", (103,), "fuzzy")
+    assert service.resolve("mumbia").id == 100
+    # Short names must be typed exactly; far-off words do not match
+    assert service.resolve("Pnue") is None
+    assert service.resolve("marketing") is None
+
+def test_prefix_completion_needs_a_unique_match():
+    service = LocationService(ENTRIES)
+    assert service.resolve("beng") == (103, "Bangalore", (103,), "prefix")
+    assert service.complete("mu") == {100}
+    assert service.resolve("ma") is None
+
+def test_results_are_memoized_per_raw_input():
+    service = LocationService(ENTRIES)
+    assert service.resolve("Bengaluru").id == 103
+    assert service.resolve("Bengaluru").id == 103
+    assert service.resolve("Paris") is None
+    assert service.resolve("Paris") is None
+    stats = service.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 2)
+
+def test_bundled_gazetteer():
+    service = LocationService.from_file(LOCATIONS_PATH)
+    assert service.resolve("Gurugram").name == "Gurgaon"
+    assert service.resolve("Trivandrum").name == "Thiruvananthapuram"
+    assert service.resolve("Hyderbad").name == "Hyderabad"
+    for sentence in ("sign me up", "I can move anywhere", "shop online", "help me with my cv"):
+        assert service.resolve(sentence) is None, sentence
+    assert len(LocationService.from_file("/nonexistent/locations.json")) == 0
+
+def test_job_location_ids():
+    service = LocationService(ENTRIES)
+    frame = pd.DataFrame({"location": ["Mumbai", "Bengaluru", None, "Paris", "Mumbai, Maharashtra"]})
+    assert build_location_ids(frame, service).tolist() == [100, 103, 0, 0, 100]
+    assert build_location_ids(frame, None) is None
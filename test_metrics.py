@@ -0,0 +1,67 @@
+# test_metrics.py
+import asyncio
+import urllib.request
+
+from utils.metrics import Registry, instrument_action, ACTION_DURATION, ACTION_ERRORS, start_metrics_server
+
+def test_histogram_renders_cumulative_buckets():
+    registry = Registry()
+    latency = registry.histogram("demo_seconds", "Demo latency", labels=("tier",), buckets=(0.1, 1))
+    latency.observe(0.05, tier="csv")
+    latency.observe(0.5, tier="csv")
+    registry.counter("demo_total", "Demo count", labels=("tier",)).inc(tier='we"ird')
+
+    text = registry.render()
+    assert '# TYPE demo_seconds histogram' in text
+    assert 'demo_seconds_bucket{tier="csv",le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{tier="csv",le="+Inf"} 2' in text
+    assert 'demo_seconds_count{tier="csv"} 2' in text
+    assert 'demo_total{tier="we\\"ird"} 1' in text
+
+def test_instrumented_actions_record_latency_and_errors():
+    class DemoAction:
+        def name(self):
+            return "action_demo"
+
+        @instrument_action
+        async def run(self):
+            return "ok"
+
+        @instrument_action
+        def validate_role(self):
+            raise ValueError("bad role")
+
+    action = DemoAction()
+    assert asyncio.run(action.run()) == "ok"
+    try:
+        action.validate_role()
+    except ValueError:
+        pass
+
+    assert ACTION_DURATION.count(action="action_demo", step="run") == 1
+    assert ACTION_DURATION.count(action="action_demo", step="validate_role") == 1
+    assert ACTION_ERRORS.value(action="action_demo", step="validate_role") == 1
+
+def test_metrics_endpoint_serves_prometheus_text():
+    server = start_metrics_server(port=0)
+    assert server.server_address[0] == "127.0.0.1", "The endpoint must not listen publicly by default"
+    port = server.server_address[1]
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+        body = response.read().decode()
+        assert response.headers["Content-Type"].startswith("text/plain")
+    assert "asha_action_duration_seconds" in body
+
+def test_endpoint_starts_with_first_action_only_when_enabled(monkeypatch):
+    from utils import metrics
+    started = []
+    monkeypatch.setattr(metrics, "start_metrics_server", lambda: started.append(True))
+    monkeypatch.setattr(metrics, "_metrics_requested", False)
+
+    monkeypatch.setattr(metrics, "METRICS_ENABLED", False)
+    metrics.ensure_metrics_server()
+    assert started == []
+
+    monkeypatch.setattr(metrics, "METRICS_ENABLED", True)
+    metrics.ensure_metrics_server()
+    metrics.ensure_metrics_server()
+    assert started == [True]
@@ -0,0 +1,72 @@
+# test_rate_limiter.py
+import os
+import asyncio
+import sqlite3
+import tempfile
+
+from utils.rate_limiter import TokenBucket, GeminiRateLimiter
+
+def test_bucket_allows_burst_then_queues():
+    bucket = TokenBucket(rate=10, capacity=2)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve(max_wait=0) is None
+    wait = bucket.reserve(max_wait=1)
+    assert 0 < wait <= 0.1
+    # The next waiter queues behind the reserved token
+    assert bucket.reserve(max_wait=1) > wait
+
+def test_bucket_is_shared_through_sqlite():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "limits.db")
+        first = TokenBucket(rate=0.01, capacity=2, db_path=db_path)
+        second = TokenBucket(rate=0.01, capacity=2, db_path=db_path)
+        assert first.reserve() == 0.0
+        assert second.reserve() == 0.0
+        assert first.reserve() is None, "Both processes draw from the same two tokens"
+
+def test_limiter_counts_queued_rejected_and_throttled():
+    async def run():
+        limiter = GeminiRateLimiter(TokenBucket(rate=50, capacity=1), max_wait=0.05)
+        results = [await limiter.acquire(), await limiter.acquire()]
+        limiter.record_throttled()
+        results.append(await limiter.acquire(max_wait=0))
+        return limiter, results
+
+    limiter, results = asyncio.run(run())
+    assert results == [True, True, False]
+    assert limiter.stats() == {"allowed": 2, "queued": 1, "rejected": 1, "deferred": 0, "throttled": 1}
+
+def test_background_calls_never_queue_and_keep_a_reserve():
+    async def run():
+        limiter = GeminiRateLimiter(TokenBucket(rate=0.001, capacity=3), max_wait=5, background_reserve=2)
+        background = [await limiter.acquire(background=True) for _ in range(2)]
+        users = [await limiter.acquire() for _ in range(2)]
+        return limiter, background, users
+
+    limiter, background, users = asyncio.run(run())
+    assert background == [True, False]
+    assert users == [True, True]
+    assert limiter.stats()["deferred"] == 1 and limiter.stats()["rejected"] == 0
+
+def test_sqlite_reserve_does_not_block_the_event_loop():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "limits.db")
+        limiter = GeminiRateLimiter(TokenBucket(rate=1, capacity=2, db_path=db_path))
+        # Another process holds the write lock, so the reservation has to wait for it
+        holder = sqlite3.connect(db_path, isolation_level=None)
+        holder.execute("BEGIN IMMEDIATE")
+
+        async def run():
+            ticks = 0
+            acquire = asyncio.ensure_future(limiter.acquire())
+            while ticks < 10:
+                await asyncio.sleep(0.01)
+                ticks += 1
+            assert not acquire.done()
+            holder.execute("COMMIT")
+            return await acquire, ticks
+
+        allowed, ticks = asyncio.run(run())
+        holder.close()
+    assert allowed is True and ticks == 10
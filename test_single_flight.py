@@ -0,0 +1,41 @@
+# test_single_flight.py
+import asyncio
+
+from utils.single_flight import SingleFlight
+
+def test_concurrent_calls_share_one_request():
+    calls = []
+
+    async def fetch(query):
+        calls.append(query)
+        await asyncio.sleep(0.01)
+        return [f"{query} job"]
+
+    async def run():
+        group = SingleFlight()
+        results = await asyncio.gather(*[group.do("developer", fetch, "developer") for _ in range(10)])
+        return group, results
+
+    group, results = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(result == ["developer job"] for result in results)
+    assert group.stats() == {"calls": 1, "coalesced": 9, "in_flight": 0}
+
+def test_errors_are_shared_and_key_is_released():
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("gemini down")
+
+    async def run():
+        group = SingleFlight()
+        results = await asyncio.gather(group.do("q", fail), group.do("q", fail), return_exceptions=True)
+        return group, results
+
+    group, results = asyncio.run(run())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert group.in_flight() == 0
+
+if __name__ == "__main__":
+    test_concurrent_calls_share_one_request()
+    test_errors_are_shared_and_key_is_released()
+    print("All single-flight tests passed!")
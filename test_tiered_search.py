@@ -0,0 +1,99 @@
+# test_tiered_search.py
+import asyncio
+
+from utils.rate_limiter import RateLimitExceeded
+from utils.tiered_search import CircuitBreaker, TieredJobSearch
+
+CSV_JOBS = [{"title": "Data Scientist", "company": "DataInsights"}]
+GEMINI_JOBS = [{"title": "ML Engineer", "company": "Gemini Labs"}]
+
+async def local(*args):
+    return CSV_JOBS, 1
+
+def mock(job_role, location):
+    return [{"title": "Mock Job", "company": "TechCorp"}]
+
+def make_remote(delay, jobs, calls):
+    async def remote(*args):
+        calls.append(args)
+        await asyncio.sleep(delay)
+        return jobs
+    return remote
+
+def test_gemini_result_is_preferred_within_deadline():
+    search = TieredJobSearch(make_remote(0, GEMINI_JOBS, []), local, mock, budget=1, remote_deadline=0.5)
+    result = asyncio.run(search.search("data science"))
+    assert result.tier == "gemini" and result.jobs == GEMINI_JOBS
+
+def test_slow_gemini_falls_back_to_csv_and_opens_breaker():
+    calls = []
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    search = TieredJobSearch(make_remote(0.2, GEMINI_JOBS, calls), local, mock,
+                             budget=1, remote_deadline=0.01, breaker=breaker)
+
+    async def run():
+        return [await search.search("data science") for _ in range(3)]
+
+    results = asyncio.run(run())
+    assert [r.tier for r in results] == ["csv", "csv", "csv"]
+    assert breaker.state == CircuitBreaker.OPEN
+    # The third search skipped Gemini entirely
+    assert len(calls) == 2
+
+def test_rate_limited_gemini_skips_to_csv_without_tripping_breaker():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+
+    async def throttled(*args):
+        raise RateLimitExceeded("Gemini API rate limit reached")
+
+    search = TieredJobSearch(throttled, local, mock, budget=1, remote_deadline=0.5, breaker=breaker)
+
+    async def run():
+        return [await search.search("data science") for _ in range(3)]
+
+    results = asyncio.run(run())
+    assert [r.tier for r in results] == ["csv", "csv", "csv"]
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.failures == 0
+
+def test_cancelled_probe_does_not_leave_breaker_stuck_half_open():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    calls = []
+    search = TieredJobSearch(make_remote(1, GEMINI_JOBS, calls), local, mock,
+                             budget=2, remote_deadline=1, breaker=breaker)
+
+    async def run():
+        task = asyncio.ensure_future(search.search("data science"))
+        await asyncio.sleep(0.05)
+        assert breaker.state == CircuitBreaker.HALF_OPEN and len(calls) == 1
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(run())
+    assert breaker.allow() is True, "A new probe should be allowed after the cancelled one"
+
+def test_mock_when_no_tier_has_results():
+    async def empty_local(*args):
+        return [], 0
+
+    result = asyncio.run(TieredJobSearch(None, empty_local, mock).search("astronaut"))
+    assert result.tier == "mock"
+
+def test_half_open_breaker_allows_one_probe():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    assert breaker.allow() is True
+    assert breaker.allow() is False
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+if __name__ == "__main__":
+    test_gemini_result_is_preferred_within_deadline()
+    test_slow_gemini_falls_back_to_csv_and_opens_breaker()
+    test_rate_limited_gemini_skips_to_csv_without_tripping_breaker()
+    test_mock_when_no_tier_has_results()
+    test_half_open_breaker_allows_one_probe()
+    print("All tiered search tests passed!")
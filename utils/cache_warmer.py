@@ -0,0 +1,165 @@
+import os
+import asyncio
+import logging
+
+from .rate_limiter import RateLimitExceeded
+
+logger = logging.getLogger(__name__)
+
+# Roles and cities most searched for; override with comma-separated lists
+POPULAR_JOB_ROLES = [
+    role.strip() for role in os.getenv(
+        "JOB_PREWARM_ROLES", "software developer,data science,product manager,marketing,designer"
+    ).split(",") if role.strip()
+]
+POPULAR_LOCATIONS = [
+    city.strip() for city in os.getenv(
+        "JOB_PREWARM_LOCATIONS", "Bangalore,Mumbai,Delhi,Hyderabad,Remote"
+    ).split(",") if city.strip()
+]
+
+# Number of combinations kept warm, seconds between passes and parallel refreshes per pass
+JOB_PREWARM_TOP_N = int(os.getenv("JOB_PREWARM_TOP_N", "25"))
+JOB_PREWARM_INTERVAL = float(os.getenv("JOB_PREWARM_INTERVAL", "900"))
+JOB_PREWARM_CONCURRENCY = int(os.getenv("JOB_PREWARM_CONCURRENCY", "2"))
+
+# Seconds between the start of two refreshes, so a pass is spread out instead of bursting
+JOB_PREWARM_PACE = float(os.getenv("JOB_PREWARM_PACE", "4"))
+
+JOB_PREWARM_ENABLED = os.getenv("JOB_PREWARM_ENABLED", "true").lower() in ("1", "true", "yes")
+
+
+class CacheWarmer:
+    """
+    Keep the job-search cache warm for the most popular queries.
+
+    Every `interval` seconds the top-N (role, location) combinations are
+    refreshed if their cached result is missing or will go stale before the
+    next pass. Combinations come from the queries users actually asked for,
+    topped up with the configured popular roles and cities.
+
+    Refreshes are paced and request Gemini at background priority: they never
+    queue for the rate limit and leave a reserve of tokens for users. The
+    first refresh turned away ends the pass.
+    """
+
+    def __init__(self, search_engine, roles=None, locations=None, top_n=JOB_PREWARM_TOP_N,
+                 interval=JOB_PREWARM_INTERVAL, concurrency=JOB_PREWARM_CONCURRENCY, pace=JOB_PREWARM_PACE):
+        """
+        Args:
+            search_engine (HerkeyJobSearch): Engine whose cache is warmed
+            roles (list, optional): Seed roles; defaults to POPULAR_JOB_ROLES
+            locations (list, optional): Seed locations; defaults to POPULAR_LOCATIONS
+            top_n (int): Number of combinations kept warm
+            interval (float): Seconds between warming passes
+            concurrency (int): Maximum refreshes running at once
+            pace (float): Seconds between the start of two refreshes
+        """
+        self.search_engine = search_engine
+        self.roles = roles if roles is not None else POPULAR_JOB_ROLES
+        self.locations = locations if locations is not None else POPULAR_LOCATIONS
+        self.top_n = top_n
+        self.interval = interval
+        self.concurrency = max(concurrency, 1)
+        self.pace = pace
+        self.refreshed = 0
+        self.failed = 0
+        self.deferred = 0
+        self._task = None
+
+    def popular_queries(self):
+        """
+        Return the (role, location) combinations to keep warm, most popular first.
+
+        Logged queries come first by frequency; seed combinations fill the
+        remaining slots in role-major order.
+        """
+        queries = []
+        for (role, location, _), _count in self.search_engine.query_counts.most_common():
+            if role and (role, location) not in queries:
+                queries.append((role, location))
+
+        for role in self.roles:
+            for location in self.locations:
+                query = (role.lower(), location.lower())
+                if query not in queries:
+                    queries.append(query)
+        return queries[:self.top_n]
+
+    async def warm_once(self):
+        """
+        Refresh every popular query that is missing or about to go stale.
+
+        Query counts are halved afterwards, so the choice follows recent traffic.
+
+        Returns:
+            int: Number of queries refreshed successfully
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        limited = asyncio.Event()
+
+        async def warm(role, location):
+            async with semaphore:
+                if limited.is_set():
+                    return False
+                try:
+                    jobs = await self.search_engine.refresh_jobs(role, location, background=True)
+                except RateLimitExceeded:
+                    self.deferred += 1
+                    limited.set()
+                    return False
+            if jobs is None:
+                self.failed += 1
+                return False
+            self.refreshed += 1
+            return True
+
+        queries = self.popular_queries()
+        self.search_engine.decay_query_counts()
+
+        tasks = []
+        for role, location in queries:
+            # peek leaves the hit-rate statistics to user traffic
+            _, fresh_for = await self.search_engine.cache.peek(role, location)
+            if fresh_for > self.interval:
+                continue
+            if tasks and self.pace > 0:
+                await asyncio.sleep(self.pace)
+            if limited.is_set():
+                logger.info("Cache warmer stopped early to leave the Gemini rate limit to users")
+                break
+            tasks.append(asyncio.ensure_future(warm(role, location)))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        warmed = sum(1 for result in results if result is True)
+        logger.info(f"Cache warmer refreshed {warmed} of {len(queries)} popular job queries")
+        return warmed
+
+    async def _run(self):
+        while True:
+            try:
+                await self.warm_once()
+            except Exception as e:
+                logger.error(f"Cache warming pass failed: {str(e)}")
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        """Start warming in the background on the running event loop (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        return self._task
+
+    def stop(self):
+        """Cancel the background task."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def stats(self):
+        """Return refresh counters."""
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "refreshed": self.refreshed,
+            "failed": self.failed,
+            "deferred": self.deferred
+        }
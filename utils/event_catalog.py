@@ -0,0 +1,222 @@
+import os
+import json
+import time
+import bisect
+import logging
+import calendar
+import threading
+from datetime import datetime, timedelta
+from collections import namedtuple, defaultdict
+
+from .job_ranker import tokenize
+
+logger = logging.getLogger(__name__)
+
+# Seconds between checks of the catalog file for changes
+EVENT_CATALOG_CHECK_INTERVAL = float(os.getenv("EVENT_CATALOG_CHECK_INTERVAL", "5"))
+
+DATE_FORMAT = '%B %d, %Y'
+
+# Entries whose date cannot be parsed sort after everything else
+UNKNOWN_DATE = datetime(2099, 12, 31)
+
+# Immutable view of a single event or session
+EventRecord = namedtuple(
+    "EventRecord",
+    ["id", "type", "title", "date", "time", "location", "description", "timestamp"]
+)
+
+# Date-sorted entries of one type, their timestamps and a title keyword index
+EntryIndex = namedtuple("EntryIndex", ["records", "timestamps", "keywords"])
+
+# One loaded version of the catalog file, entries split by type and sorted by date
+CatalogSnapshot = namedtuple("CatalogSnapshot", ["events", "sessions", "indexes", "mtime", "loaded_at"])
+
+MONTHS = {name.lower(): number for number, name in enumerate(calendar.month_name) if name}
+MONTHS.update({name.lower(): number for number, name in enumerate(calendar.month_abbr) if name})
+
+
+def parse_event_date(date_text):
+    """Return the POSIX timestamp for a catalog date such as "May 10, 2025"."""
+    try:
+        return datetime.strptime(date_text or '', DATE_FORMAT).timestamp()
+    except (TypeError, ValueError):
+        return UNKNOWN_DATE.timestamp()
+
+
+def build_records(entries, entry_type):
+    """Build date-sorted records for all entries of the given type."""
+    records = [
+        EventRecord(
+            id=entry.get('id'),
+            type=entry_type,
+            title=entry.get('title', ''),
+            date=entry.get('date', ''),
+            time=entry.get('time', ''),
+            location=entry.get('location', ''),
+            description=entry.get('description', ''),
+            timestamp=parse_event_date(entry.get('date'))
+        )
+        for entry in entries if entry.get('type') == entry_type
+    ]
+    records.sort(key=lambda record: record.timestamp)
+    return tuple(records)
+
+
+def build_entry_index(records):
+    """Index date-sorted records by timestamp and by the words in their titles."""
+    keywords = defaultdict(list)
+    for position, record in enumerate(records):
+        for token in set(tokenize(record.title)):
+            keywords[token].append(position)
+    return EntryIndex(
+        records=records,
+        timestamps=tuple(record.timestamp for record in records),
+        keywords={token: tuple(positions) for token, positions in keywords.items()}
+    )
+
+
+def resolve_date_range(text, now=None):
+    """
+    Work out the date range a message asks about.
+
+    Recognizes "today", "tomorrow", "this/next week", "this/next month" and
+    month names; anything else means "upcoming from now".
+
+    Returns:
+        tuple: (start, end) datetimes; end is None for an open range
+    """
+    now = now or datetime.now()
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    text = (text or '').lower()
+
+    if 'today' in text:
+        return today, today + timedelta(days=1)
+    if 'tomorrow' in text:
+        return today + timedelta(days=1), today + timedelta(days=2)
+
+    week_start = today - timedelta(days=today.weekday())
+    if 'next week' in text:
+        return week_start + timedelta(weeks=1), week_start + timedelta(weeks=2)
+    if 'this week' in text:
+        return today, week_start + timedelta(weeks=1)
+
+    month_start = today.replace(day=1)
+    next_month_start = (month_start + timedelta(days=32)).replace(day=1)
+    if 'next month' in text:
+        return next_month_start, (next_month_start + timedelta(days=32)).replace(day=1)
+    if 'this month' in text:
+        return today, next_month_start
+
+    for word in tokenize(text):
+        month = MONTHS.get(word)
+        # "may" is usually the verb unless phrased as "in may"
+        if word == 'may' and 'in may' not in text:
+            continue
+        if month:
+            year = today.year if month >= today.month else today.year + 1
+            start = datetime(year, month, 1)
+            return max(start, today), (start + timedelta(days=32)).replace(day=1)
+
+    return today, None
+
+
+class EventCatalog:
+    """Shared, load-once catalog of events and sessions with reload-on-change."""
+
+    def __init__(self, data_path, check_interval=EVENT_CATALOG_CHECK_INTERVAL):
+        """
+        Initialize an empty catalog.
+
+        Args:
+            data_path (str): Path of the session details JSON
+            check_interval (float): Minimum seconds between file change checks
+        """
+        self.data_path = data_path
+        self.check_interval = check_interval
+        self._snapshot = None
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+
+    def load(self):
+        """
+        (Re)build the catalog if the file changed since the last load.
+
+        Returns:
+            CatalogSnapshot: The current snapshot, or None if the file is missing.
+        """
+        with self._lock:
+            self._last_check = time.monotonic()
+            if not os.path.exists(self.data_path):
+                return self._snapshot
+
+            mtime = os.path.getmtime(self.data_path)
+            if self._snapshot is not None and self._snapshot.mtime == mtime:
+                return self._snapshot
+
+            with open(self.data_path, 'r') as file:
+                entries = json.load(file)
+
+            events = build_records(entries, 'event')
+            sessions = build_records(entries, 'session')
+            self._snapshot = CatalogSnapshot(
+                events=events,
+                sessions=sessions,
+                indexes={'event': build_entry_index(events), 'session': build_entry_index(sessions)},
+                mtime=mtime,
+                loaded_at=time.time()
+            )
+            logger.info(f"Event catalog loaded from {self.data_path}: "
+                        f"{len(self._snapshot.events)} events, {len(self._snapshot.sessions)} sessions")
+            return self._snapshot
+
+    def get(self):
+        """Return the current snapshot, reloading first if the file may have changed."""
+        if self._snapshot is None or time.monotonic() - self._last_check >= self.check_interval:
+            return self.load()
+        return self._snapshot
+
+    def query(self, entry_type='event', start=None, end=None, keywords=None):
+        """
+        Return entries of a type within a date range, optionally matching title keywords.
+
+        The range is located with binary search over the sorted timestamps and
+        keywords are resolved through the title index, so no entry is scanned
+        that cannot be part of the result.
+
+        Args:
+            entry_type (str): "event" or "session"
+            start (datetime, optional): Earliest date to include
+            end (datetime, optional): Date to stop before; None leaves the range open
+            keywords (list, optional): Entries must match at least one keyword;
+                all words of a multi-word keyword must appear in the title
+
+        Returns:
+            list: Matching EventRecords in date order
+        """
+        snapshot = self.get()
+        if snapshot is None:
+            return []
+
+        index = snapshot.indexes[entry_type]
+        lo = bisect.bisect_left(index.timestamps, start.timestamp()) if start else 0
+        hi = bisect.bisect_left(index.timestamps, end.timestamp()) if end else len(index.timestamps)
+        if lo >= hi:
+            return []
+
+        if not keywords:
+            return list(index.records[lo:hi])
+
+        positions = set()
+        for keyword in keywords:
+            tokens = tokenize(keyword)
+            if not tokens:
+                continue
+            matches = None
+            for token in tokens:
+                postings = index.keywords.get(token, ())
+                # Postings are sorted, so only the slice inside the date range is visited
+                in_range = postings[bisect.bisect_left(postings, lo):bisect.bisect_left(postings, hi)]
+                matches = set(in_range) if matches is None else matches & set(in_range)
+            positions |= matches
+        return [index.records[position] for position in sorted(positions)]
@@ -0,0 +1,133 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# Upper bound used for open-ended requirements such as "10+ years" or "senior level"
+MAX_EXPERIENCE_YEARS = 50.0
+
+# Years covered by the seniority words validate_experience and the gazetteer produce
+EXPERIENCE_LEVELS = {
+    "entry": (0.0, 2.0),
+    "fresher": (0.0, 1.0),
+    "junior": (0.0, 2.0),
+    "mid": (3.0, 5.0),
+    "intermediate": (3.0, 5.0),
+    "senior": (6.0, MAX_EXPERIENCE_YEARS),
+    "experienced": (6.0, MAX_EXPERIENCE_YEARS),
+    "lead": (8.0, MAX_EXPERIENCE_YEARS),
+    "principal": (10.0, MAX_EXPERIENCE_YEARS),
+}
+
+_NUMBER = r"(\d+(?:\.\d+)?)"
+_RANGE_RE = re.compile(_NUMBER + r"\s*(?:-|–|to)\s*" + _NUMBER)
+_OPEN_RE = re.compile(_NUMBER + r"\s*(?:\+|plus|or more)")
+_YEARS_RE = re.compile(_NUMBER)
+_LEVEL_RE = re.compile(r"\b(" + "|".join(EXPERIENCE_LEVELS) + r")\b")
+
+
+def parse_experience(value):
+    """
+    Parse an experience requirement or answer into a (min, max) range of years.
+
+    Understands plain numbers (5, "5 years"), ranges ("3-5 years", "2 to 4"),
+    open-ended values ("10+ years") and level words ("entry level",
+    "senior level"). Stated numbers take precedence over level words.
+
+    Returns:
+        tuple: (min_years, max_years) as floats, or None if nothing was recognized
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return None if np.isnan(value) else (float(value), float(value))
+
+    text = str(value).lower()
+    match = _RANGE_RE.search(text)
+    if match:
+        low, high = sorted((float(match.group(1)), float(match.group(2))))
+        return low, high
+    match = _OPEN_RE.search(text)
+    if match:
+        return float(match.group(1)), MAX_EXPERIENCE_YEARS
+    match = _YEARS_RE.search(text)
+    if match:
+        years = float(match.group(1))
+        return years, years
+    match = _LEVEL_RE.search(text)
+    if match:
+        return EXPERIENCE_LEVELS[match.group(1)]
+    return None
+
+
+def experience_ranges(values):
+    """
+    Parse a column of experience values into min and max arrays.
+
+    Only the distinct values are parsed, so a large listing costs one parse
+    per distinct requirement. Unrecognized values become NaN.
+
+    Returns:
+        tuple: (mins, maxs) float32 arrays aligned with values
+    """
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+    bounds = np.array(
+        [parse_experience(value) or (np.nan, np.nan) for value in uniques] + [(np.nan, np.nan)],
+        dtype=np.float32,
+    ).reshape(-1, 2)
+    # factorize marks missing values with -1, which picks the trailing NaN row
+    ranges = bounds[codes]
+    return ranges[:, 0], ranges[:, 1]
+
+
+class ExperienceIndex:
+    """
+    Jobs sorted by their minimum required years, for range lookups.
+
+    A query range selects the jobs whose requirement overlaps it: a binary
+    search finds the jobs whose minimum is within reach, and one vectorized
+    comparison of their maximums finishes the test, instead of matching
+    text row by row.
+    """
+
+    def __init__(self, mins, maxs):
+        """
+        Args:
+            mins (array): Minimum years per job (NaN when unknown)
+            maxs (array): Maximum years per job (NaN when unknown)
+        """
+        mins = np.asarray(mins, dtype=np.float32)
+        maxs = np.asarray(maxs, dtype=np.float32)
+        known = np.flatnonzero(~np.isnan(mins))
+        order = known[np.argsort(mins[known], kind="stable")]
+        self._order = order
+        self._mins = mins[order]
+        self._maxs = maxs[order]
+        self.size = len(mins)
+
+    def __len__(self):
+        return len(self._order)
+
+    def overlapping(self, low, high):
+        """
+        Return the ids of the jobs whose experience range overlaps [low, high].
+
+        Jobs with an unknown requirement are never returned.
+
+        Returns:
+            numpy.ndarray: Sorted doc ids
+        """
+        end = np.searchsorted(self._mins, high, side="right")
+        return np.sort(self._order[:end][self._maxs[:end] >= low])
+
+    def lookup(self, experience):
+        """
+        Return the doc ids matching an experience slot value.
+
+        Returns:
+            numpy.ndarray: Sorted doc ids, or None if the value was not recognized
+        """
+        bounds = parse_experience(experience)
+        if bounds is None:
+            return None
+        return self.overlapping(*bounds)
@@ -0,0 +1,141 @@
+import os
+import re
+from difflib import get_close_matches
+
+try:
+    import numpy as np
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    tfidf_available = True
+except ImportError:
+    tfidf_available = False
+
+from .job_cache import TTLCache
+from .metrics import CACHE_LOOKUPS, CACHE_DURATION
+
+# Minimum cosine similarity for a question to count as a match, and how far it must
+# lead the runner-up; shared words like "how can i ... herkey" alone score up to ~0.4
+FAQ_MATCH_THRESHOLD = float(os.getenv("FAQ_MATCH_THRESHOLD", "0.44"))
+FAQ_MATCH_MARGIN = float(os.getenv("FAQ_MATCH_MARGIN", "0.1"))
+
+# Number of normalized messages whose match is remembered
+FAQ_CACHE_SIZE = int(os.getenv("FAQ_CACHE_SIZE", "4096"))
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]+")
+
+
+def normalize_faq_text(text):
+    """
+    Normalize a message or question for matching and caching.
+
+    Lowercases, applies the JobsForHer -> Herkey rename, drops punctuation
+    and collapses whitespace.
+    """
+    text = str(text).lower().replace("jobsforher", "herkey")
+    text = _PUNCTUATION_RE.sub(" ", text)
+    return " ".join(text.split())
+
+
+class FAQMatcher:
+    """
+    Match user messages to FAQ questions with a character n-gram TF-IDF index.
+
+    Questions are vectorized once; each lookup is a single sparse
+    vector-matrix product followed by a top-k selection. If scikit-learn is
+    not installed the matcher falls back to difflib.
+
+    Results of match() are kept in an LRU cache keyed on the normalized
+    message. The cache belongs to this matcher, so building a new matcher
+    when the FAQ data is reloaded also invalidates it.
+    """
+
+    def __init__(self, questions, threshold=FAQ_MATCH_THRESHOLD, margin=FAQ_MATCH_MARGIN,
+                 ngram_range=(2, 4), cache_size=FAQ_CACHE_SIZE):
+        """
+        Build the index.
+
+        Args:
+            questions (list): Question strings
+            threshold (float): Minimum cosine similarity for match()
+            margin (float): Lead the best question needs over the second best in match()
+            ngram_range (tuple): Character n-gram sizes, counted within word boundaries
+            cache_size (int): Maximum number of cached match results
+        """
+        self.questions = [normalize_faq_text(q) for q in questions]
+        self.threshold = threshold
+        self.margin = margin
+        self.cache = TTLCache(max_size=cache_size)
+        self._vectorizer = None
+        self._postings = None
+
+        if tfidf_available and self.questions:
+            self._vectorizer = TfidfVectorizer(
+                analyzer='char_wb',
+                ngram_range=ngram_range,
+                sublinear_tf=True,
+                dtype=np.float32
+            )
+            # Rows are L2-normalized, so a dot product is the cosine similarity.
+            # Stored feature-major so a query only touches the n-grams it contains.
+            self._postings = self._vectorizer.fit_transform(self.questions).T.tocsr()
+
+    def __len__(self):
+        return len(self.questions)
+
+    def top_k(self, message, k=3):
+        """
+        Return the k most similar questions.
+
+        Returns:
+            list: (question index, similarity) pairs, best first
+        """
+        message = normalize_faq_text(message or "")
+        if not self.questions or not message:
+            return []
+
+        if self._vectorizer is None:
+            matches = get_close_matches(message, self.questions, n=k, cutoff=0.0)
+            return [(self.questions.index(q), 1.0 if q == message else 0.0) for q in matches]
+
+        scores = self._vectorizer.transform([message]) @ self._postings
+        if scores.nnz == 0:
+            return []
+
+        data, indices = scores.data, scores.indices
+        if k < len(data):
+            best = np.argpartition(-data, k)[:k]
+        else:
+            best = np.arange(len(data))
+        best = best[np.argsort(-data[best], kind='stable')]
+        return [(int(indices[i]), float(data[i])) for i in best]
+
+    def match(self, message):
+        """
+        Return the best question for message if it clears the threshold.
+
+        The best question must also beat the runner-up by `margin`; a message
+        that is about equally close to two questions gets no answer rather
+        than a guess.
+
+        Returns:
+            tuple: (question index, similarity), or None if nothing is close enough
+        """
+        key = normalize_faq_text(message or "")
+        with CACHE_DURATION.time(cache="faq"):
+            cached = self.cache.get(key)
+        if cached is not None:
+            CACHE_LOOKUPS.inc(cache="faq", result="hit")
+            # Misses are cached as an empty tuple so they are not recomputed either
+            return cached or None
+        CACHE_LOOKUPS.inc(cache="faq", result="miss")
+
+        if self._vectorizer is None:
+            matches = get_close_matches(key, self.questions, n=1, cutoff=0.6)
+            result = (self.questions.index(matches[0]), 1.0) if matches else None
+        else:
+            best = self.top_k(key, k=2)
+            runner_up = best[1][1] if len(best) > 1 else 0.0
+            confident = best and best[0][1] >= self.threshold and best[0][1] - runner_up >= self.margin
+            result = best[0] if confident else None
+
+        self.cache.set(key, result or ())
+        return result
@@ -0,0 +1,153 @@
+import re
+import json
+import logging
+from collections import namedtuple
+
+logger = logging.getLogger(__name__)
+
+# What one pass over a message found; each field is None when not mentioned
+GazetteerMatch = namedtuple("GazetteerMatch", ["role", "location", "experience"])
+
+# Synonym kinds in the data file and the GazetteerMatch field each fills; locations
+# come from the LocationService so there is one place vocabulary
+KINDS = {"roles": "role", "experience": "experience"}
+
+_YEARS_PATTERN = r"(?P<years>\d+)\s*\+?\s*(?:years?|yrs?)"
+
+
+def trie_pattern(terms):
+    """
+    Build a regex alternation for terms with shared prefixes factored out.
+
+    A flat "a|b|c" alternation is tried term by term at every position; the
+    trie form branches once per character, so matching cost grows with the
+    length of the text rather than the number of terms. Longer terms win
+    over their prefixes ("senior level" over "senior").
+    """
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def build(node):
+        is_end = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if is_end:
+            return "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+class Gazetteer:
+    """
+    Extract job role, location and experience from a message in a single pass.
+
+    All synonyms are compiled into one trie-shaped regex together with a
+    "N years" pattern, so a message is scanned once however many role titles
+    and cities there are. Place names and aliases are taken from the
+    LocationService, so a location span gets the same canonical name as
+    resolving it directly.
+
+    Synonyms listed under "standalone" are ordinary words in a sentence
+    ("lead a team", "3 pm", "design"), so they only count when they are
+    the whole message, e.g. the answer to a form question.
+    """
+
+    def __init__(self, synonyms=None, location_service=None):
+        """
+        Args:
+            synonyms (dict): {"roles"|"experience": {canonical: [synonym, ...]}}, plus
+                "standalone" in the same shape for whole-message-only synonyms
+            location_service (LocationService, optional): Source of location names and aliases
+        """
+        self.lookup = {}
+        for kind, field in KINDS.items():
+            for canonical, terms in (synonyms or {}).get(kind, {}).items():
+                for term in [canonical] + list(terms):
+                    term = " ".join(term.lower().split())
+                    if term:
+                        self.lookup.setdefault(term, (field, canonical))
+        self.standalone = {}
+        for kind, field in KINDS.items():
+            for canonical, terms in (synonyms or {}).get("standalone", {}).get(kind, {}).items():
+                for term in terms:
+                    self.standalone.setdefault(" ".join(term.lower().split()), (field, canonical))
+        if location_service is not None:
+            for term, name in location_service.phrases().items():
+                self.lookup.setdefault(term, ("location", name))
+
+        alternatives = [_YEARS_PATTERN]
+        if self.lookup:
+            # Allow simple plurals ("designers", "developers") without listing them
+            alternatives.append(f"(?P<term>{trie_pattern(self.lookup)})(?:s|es)?")
+        self._pattern = re.compile(r"(?<!\w)(?:" + "|".join(alternatives) + r")(?!\w)")
+
+    @classmethod
+    def from_file(cls, path, location_service=None):
+        """Load the synonyms from a JSON file; a missing or broken file leaves only the years pattern and locations."""
+        try:
+            with open(path, "r") as f:
+                return cls(json.load(f), location_service)
+        except (OSError, ValueError) as e:
+            logger.error(f"Could not load gazetteer from {path}: {str(e)}")
+            return cls(location_service=location_service)
+
+    def __len__(self):
+        return len(self.lookup)
+
+    def extract(self, text):
+        """
+        Find the first role, location and experience mentioned in text.
+
+        A stated number of years takes precedence over a seniority word.
+
+        Returns:
+            GazetteerMatch: Canonical values; experience is "N years" or a level name
+        """
+        text = " ".join(str(text or "").lower().split())
+        if text.strip(".!? ") in self.standalone:
+            field, canonical = self.standalone[text.strip(".!? ")]
+            return GazetteerMatch(**{"role": None, "location": None, "experience": None, field: canonical})
+
+        found = {}
+        years = None
+        # Collapse whitespace so multi-word synonyms match however they were typed
+        for match in self._pattern.finditer(text):
+            if match.group("years") is not None:
+                years = years or f"{match.group('years')} years"
+                continue
+            field, canonical = self.lookup[match.group("term")]
+            found.setdefault(field, canonical)
+
+        # A number of years is more specific than a level word, wherever it appears
+        return GazetteerMatch(found.get("role"), found.get("location"), years or found.get("experience"))
+
+    def explicit_role(self, text):
+        """
+        Return the role if text names it with a multi-word synonym, else None.
+
+        "data scientist" or "product manager" in a message is clear enough to
+        replace a role the user already gave; "developer" or "design" is not.
+        """
+        for match in self._pattern.finditer(" ".join(str(text or "").lower().split())):
+            term = match.group("term")
+            if term is not None and " " in term and self.lookup[term][0] == "role":
+                return self.lookup[term][1]
+        return None
+
+    def canonical(self, field, value):
+        """Return the canonical value if value mentions a synonym of that kind, else None."""
+        value = " ".join(str(value or "").lower().split())
+        if self.standalone.get(value.strip(".!? "), (None,))[0] == field:
+            return self.standalone[value.strip(".!? ")][1]
+        for match in self._pattern.finditer(value):
+            term = match.group("term")
+            if term is not None and self.lookup[term][0] == field:
+                return self.lookup[term][1]
+        return None
@@ -1,24 +1,120 @@
 import os
-import requests
 import json
+import time
 import random
+import asyncio
+from collections import Counter
+
+import aiohttp
+
+from .job_cache import JobSearchCache, normalize_job_query
+from .single_flight import SingleFlight
+from .json_stream import JSONArrayStreamParser
+from .job_schema import GENERATED_JOB_FIELDS, JOB_RESPONSE_SCHEMA, parse_jobs, validate_job
+from .rate_limiter import GeminiRateLimiter, RateLimitExceeded
+
+# Model endpoint; point it at a local stub (see benchmarks/gemini_stub.py) for load tests.
+# Schema-constrained output (responseMimeType/responseSchema) is only accepted by v1beta.
+GEMINI_API_BASE = os.getenv(
+    "GEMINI_API_BASE", "https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash"
+).rstrip("/")
+
+# Deadlines (in seconds) applied to every Gemini request
+GEMINI_CONNECT_TIMEOUT = float(os.getenv("GEMINI_CONNECT_TIMEOUT", "3"))
+GEMINI_READ_TIMEOUT = float(os.getenv("GEMINI_READ_TIMEOUT", "10"))
+GEMINI_TOTAL_TIMEOUT = float(os.getenv("GEMINI_TOTAL_TIMEOUT", "15"))
+
+# Upper bound on concurrent connections held by the shared pool
+GEMINI_MAX_CONNECTIONS = int(os.getenv("GEMINI_MAX_CONNECTIONS", "64"))
+
+# Cap on generated tokens; five compact jobs fit well within it
+GEMINI_MAX_OUTPUT_TOKENS = int(os.getenv("GEMINI_MAX_OUTPUT_TOKENS", "768"))
+
+# Distinct queries whose popularity is tracked for pre-warming; the rarest are dropped beyond it
+JOB_QUERY_LOG_SIZE = int(os.getenv("JOB_QUERY_LOG_SIZE", "1000"))
+
+# Use streamGenerateContent and parse jobs as they arrive
+GEMINI_STREAMING = os.getenv("GEMINI_STREAMING", "true").lower() in ("1", "true", "yes")
+
+_http_session = None
+_http_session_loop = None
+
+
+def supports_response_schema(api_base):
+    """True unless api_base is the stable v1 API, which rejects the structured-output fields."""
+    return "/v1/" not in f"{api_base}/"
+
+
+def get_http_session():
+    """
+    Return the process-wide pooled HTTP session, creating it on first use.
+
+    The session is bound to the running event loop, so a new one is created
+    if the loop changes (e.g. between test runs).
+    """
+    global _http_session, _http_session_loop
+
+    loop = asyncio.get_running_loop()
+    if _http_session is None or _http_session.closed or _http_session_loop is not loop:
+        connector = aiohttp.TCPConnector(
+            limit=GEMINI_MAX_CONNECTIONS,
+            ttl_dns_cache=300,
+            keepalive_timeout=60
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=GEMINI_TOTAL_TIMEOUT,
+            sock_connect=GEMINI_CONNECT_TIMEOUT,
+            sock_read=GEMINI_READ_TIMEOUT
+        )
+        _http_session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        _http_session_loop = loop
+    return _http_session
+
+
+async def close_http_session():
+    """Close the shared HTTP session if one is open."""
+    global _http_session, _http_session_loop
+
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+    _http_session_loop = None
+
 
 class HerkeyJobSearch:
     """Class for simulating job searches using Gemini API."""
 
-    def __init__(self):
-        """Initialize with Gemini API key."""
+    def __init__(self, cache=None, rate_limiter=None):
+        """
+        Initialize with Gemini API key.
+
+        Args:
+            cache (JobSearchCache, optional): Result cache; a default one is created when omitted
+            rate_limiter (GeminiRateLimiter, optional): Limiter every request waits on;
+                a default one is created when omitted
+        """
         self.api_key = os.getenv("GEMINI_API_KEY", "")
         # Update to use gemini-1.5-flash model instead of gemini-pro
-        self.api_url = "https://generativelanguage.googleapis.com/v1/models/gemini-1.5-flash:generateContent"
+        self.api_url = f"{GEMINI_API_BASE}:generateContent"
+        self.stream_url = f"{GEMINI_API_BASE}:streamGenerateContent"
+        self.cache = cache if cache is not None else JobSearchCache()
+        # Identical concurrent searches share one outstanding Gemini request
+        self.in_flight = SingleFlight()
+        # How often each normalized query was asked for, used to pick queries to pre-warm
+        self.query_counts = Counter()
+        self.rate_limiter = rate_limiter if rate_limiter is not None else GeminiRateLimiter()
 
         if not self.api_key:
             print("Warning: GEMINI_API_KEY environment variable not set.")
 
-    def search_jobs(self, job_role, location=None, experience=None):
+    async def search_jobs(self, job_role, location=None, experience=None):
         """
         Search for jobs using Gemini API simulation.
 
+        Results are served from the cache when the normalized query was seen
+        recently; only genuine Gemini results are cached, never mock data.
+        Concurrent callers with the same normalized query share one request.
+
         Args:
             job_role (str): The job role to search for
             location (str, optional): The job location
@@ -31,21 +127,133 @@ class HerkeyJobSearch:
             print("No API key found - falling back to mock data")
             return self._get_mock_jobs(job_role, location, experience)
 
+        try:
+            jobs = await self.fetch_jobs(job_role, location, experience)
+        except RateLimitExceeded:
+            print("Gemini API rate limit reached - falling back to mock data")
+            jobs = None
+        if jobs is None:
+            return self._get_mock_jobs(job_role, location, experience)
+        return jobs
+
+    async def fetch_jobs(self, job_role, location=None, experience=None):
+        """
+        Return Gemini results for the query from the cache or a (shared) request.
+
+        Unlike search_jobs, this never substitutes mock data, so callers can
+        tell a failed request apart from a real result.
+
+        Returns:
+            list: Job dictionaries, or None if no API key is set or the request failed
+
+        Raises:
+            RateLimitExceeded: If the request was turned away by the local rate limiter
+        """
+        if not self.api_key:
+            return None
+
+        self._count_query(normalize_job_query(job_role, location, experience))
+
+        cached_jobs, fresh_for = await self.cache.lookup_async(job_role, location, experience)
+        if cached_jobs is not None:
+            if fresh_for <= 0:
+                # Stale-while-revalidate: answer now, refresh for the next caller
+                print(f"Serving stale cached jobs for: {job_role}, location: {location} - refreshing in background")
+                self._revalidate(job_role, location, experience)
+            else:
+                print(f"Serving {len(cached_jobs)} jobs from cache for: {job_role}, location: {location}")
+            return cached_jobs
+
+        return await self.refresh_jobs(job_role, location, experience)
+
+    def _count_query(self, key):
+        """Log one request for a query, keeping only the JOB_QUERY_LOG_SIZE most popular."""
+        self.query_counts[key] += 1
+        if len(self.query_counts) > 2 * JOB_QUERY_LOG_SIZE:
+            self.query_counts = Counter(dict(self.query_counts.most_common(JOB_QUERY_LOG_SIZE)))
+
+    def decay_query_counts(self):
+        """Halve every query count so popularity follows recent traffic; queries reaching zero are forgotten."""
+        self.query_counts = Counter({
+            key: count // 2 for key, count in self.query_counts.items() if count > 1
+        })
+
+    async def refresh_jobs(self, job_role, location=None, experience=None, background=False):
+        """
+        Request fresh results for the query regardless of the cache and store them.
+
+        Shares the request with any concurrent search for the same normalized query.
+
+        Args:
+            background (bool): Request at low priority (see GeminiRateLimiter.acquire)
+
+        Returns:
+            list: Job dictionaries, or None if the request failed
+
+        Raises:
+            RateLimitExceeded: If the local rate limiter turned the request away
+        """
+        return await self.in_flight.do(
+            normalize_job_query(job_role, location, experience),
+            self._fetch_and_cache_jobs, job_role, location, experience, background
+        )
+
+    def _revalidate(self, job_role, location=None, experience=None):
+        """Refresh the query in the background; concurrent refreshes share one request."""
+        task = asyncio.ensure_future(self.refresh_jobs(job_role, location, experience))
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    async def _fetch_and_cache_jobs(self, job_role, location=None, experience=None, background=False):
+        """Request jobs from Gemini and cache them if the request succeeded."""
+        jobs = await self._request_jobs(job_role, location, experience, background)
+        if jobs is not None:
+            await self.cache.set_async(job_role, location, experience, jobs)
+        return jobs
+
+    def _build_request(self, job_role, location=None, experience=None):
+        """Build the Gemini request body for a job search."""
         # Create the prompt for Gemini
         location_text = f" in {location}" if location else ""
         experience_text = f" with {experience} years experience" if experience else ""
 
-        prompt = f"""Generate 5 realistic job listings for '{job_role}' positions{location_text}{experience_text}. 
+        prompt = (f"Generate 5 realistic, varied job listings for '{job_role}' positions"
+                  f"{location_text}{experience_text}. type is the employment type "
+                  f"(Full-time, Part-time, Contract, etc.); posted_date is relative, e.g. \"2 days ago\".")
 
-        Format the response as a JSON array of job objects with these fields:
-        - title: job title
-        - company: company name
-        - location: job location
-        - type: employment type (Full-time, Part-time, Contract, etc.)
-        - posted_date: when it was posted (e.g., "2 days ago")
-        - url: application URL (format as: "https://herkey.com/jobs/apply/[job-title-slug]")
+        generation_config = {
+            "temperature": 0.2,
+            "topP": 0.8,
+            "topK": 40,
+            "maxOutputTokens": GEMINI_MAX_OUTPUT_TOKENS,
+        }
+        if supports_response_schema(GEMINI_API_BASE):
+            generation_config["responseMimeType"] = "application/json"
+            generation_config["responseSchema"] = JOB_RESPONSE_SCHEMA
+        else:
+            # Without a schema the format has to be spelled out in the prompt
+            prompt += (" Reply with only a JSON array of objects with the string fields "
+                       f"{', '.join(GENERATED_JOB_FIELDS)}.")
 
-        Make the listings realistic and varied. Only return the JSON with no additional text."""
+        return {
+            "contents": [{"parts":[{"text": prompt}]}],
+            "generationConfig": generation_config
+        }
+
+    async def _request_jobs(self, job_role, location=None, experience=None, background=False):
+        """
+        Ask Gemini for job listings.
+
+        Returns:
+            list: Parsed job dictionaries, or None if the request or parsing failed
+
+        Raises:
+            RateLimitExceeded: If the local rate limiter turned the request away
+        """
+        if GEMINI_STREAMING:
+            return await self._collect_streamed_jobs(job_role, location, experience, background)
+
+        if not await self.rate_limiter.acquire(background=background):
+            raise RateLimitExceeded("Gemini API rate limit reached")
 
         try:
             print(f"Making Gemini API request for job: {job_role}, location: {location}, experience: {experience}")
@@ -53,51 +261,134 @@ class HerkeyJobSearch:
                 "Content-Type": "application/json"
             }
 
-            data = {
-                "contents": [{"parts":[{"text": prompt}]}],
-                "generationConfig": {
-                    "temperature": 0.2,
-                    "topP": 0.8,
-                    "topK": 40
-                }
-            }
+            data = self._build_request(job_role, location, experience)
 
             url = f"{self.api_url}?key={self.api_key}"
             print(f"Sending request to Gemini API...")
-            response = requests.post(url, headers=headers, json=data)
+            session = get_http_session()
+            async with session.post(url, headers=headers, json=data) as response:
+                status_code = response.status
+                if status_code == 200:
+                    response_json = await response.json()
+                else:
+                    error_text = await response.text()
 
-            if response.status_code == 200:
+            if status_code == 200:
                 print("Received successful response from Gemini API")
-                response_json = response.json()
                 text_response = response_json.get('candidates', [{}])[0].get('content', {}).get('parts', [{}])[0].get('text', '')
 
                 print(f"Response content length: {len(text_response)}")
 
-                # Extract JSON from text response
-                try:
-                    # Look for JSON content in the response
-                    start_idx = text_response.find('[')
-                    end_idx = text_response.rfind(']') + 1
-
-                    if start_idx >= 0 and end_idx > start_idx:
-                        json_str = text_response[start_idx:end_idx]
-                        jobs = json.loads(json_str)
-                        print(f"Successfully extracted {len(jobs)} jobs from Gemini API response")
-                        return jobs
-                    else:
-                        print("Could not find JSON array in response - falling back to mock data")
-                        return self._get_mock_jobs(job_role, location, experience)
-                except json.JSONDecodeError as e:
-                    print(f"JSON decode error: {e} - falling back to mock data")
-                    return self._get_mock_jobs(job_role, location, experience)
+                jobs, rejected = parse_jobs(text_response)
+                if rejected:
+                    print(f"Discarded {rejected} invalid jobs from Gemini API response")
+                if not jobs:
+                    print("No valid jobs in Gemini API response - falling back to mock data")
+                    return None
+                print(f"Successfully extracted {len(jobs)} jobs from Gemini API response")
+                return jobs
             else:
-                print(f"API error - status code: {response.status_code} - falling back to mock data")
-                print(f"Error response: {response.text[:200]}")
-                return self._get_mock_jobs(job_role, location, experience)
+                if status_code == 429:
+                    self.rate_limiter.record_throttled()
+                print(f"API error - status code: {status_code} - falling back to mock data")
+                print(f"Error response: {error_text[:200]}")
+                return None
 
+        except asyncio.TimeoutError:
+            print("Gemini API request timed out - falling back to mock data")
+            return None
         except Exception as e:
             print(f"Error using Gemini API for job search: {str(e)}")
-            return self._get_mock_jobs(job_role, location, experience)
+            return None
+
+    async def _collect_streamed_jobs(self, job_role, location=None, experience=None, background=False):
+        """
+        Gather the jobs yielded by stream_jobs into a list.
+
+        Jobs that completed before a mid-stream failure are kept.
+
+        Returns:
+            list: Job dictionaries, or None if no job could be parsed
+        """
+        jobs = []
+        started = time.monotonic()
+        try:
+            async for job in self.stream_jobs(job_role, location, experience, background):
+                if not jobs:
+                    print(f"First streamed job arrived after {time.monotonic() - started:.2f}s")
+                jobs.append(job)
+        except RateLimitExceeded:
+            raise
+        except asyncio.TimeoutError:
+            print("Gemini API stream timed out")
+        except Exception as e:
+            print(f"Error streaming from Gemini API: {str(e)}")
+
+        if not jobs:
+            print("No jobs parsed from Gemini API stream - falling back to mock data")
+            return None
+        print(f"Successfully streamed {len(jobs)} jobs in {time.monotonic() - started:.2f}s")
+        return jobs
+
+    async def stream_jobs(self, job_role, location=None, experience=None, background=False):
+        """
+        Stream job listings from Gemini as they are generated.
+
+        Uses streamGenerateContent with server-sent events and yields each job
+        object as soon as its closing brace arrives, instead of waiting for the
+        whole response. Results are not cached; use fetch_jobs for that.
+
+        Yields:
+            dict: One job at a time
+
+        Raises:
+            aiohttp.ClientError, asyncio.TimeoutError: If the request fails
+            RateLimitExceeded: If the local rate limiter turned the request away
+        """
+        if not self.api_key:
+            return
+
+        print(f"Streaming Gemini API request for job: {job_role}, location: {location}, experience: {experience}")
+        url = f"{self.stream_url}?alt=sse&key={self.api_key}"
+        if not await self.rate_limiter.acquire(background=background):
+            raise RateLimitExceeded("Gemini API rate limit reached")
+
+        data = self._build_request(job_role, location, experience)
+        parser = JSONArrayStreamParser()
+        rejected = 0
+
+        session = get_http_session()
+        async with session.post(url, headers={"Content-Type": "application/json"}, json=data) as response:
+            if response.status != 200:
+                if response.status == 429:
+                    self.rate_limiter.record_throttled()
+                error_text = await response.text()
+                print(f"API error - status code: {response.status}")
+                print(f"Error response: {error_text[:200]}")
+                return
+
+            # Each SSE "data:" line carries one partial GenerateContentResponse
+            async for line in response.content:
+                line = line.strip()
+                if not line.startswith(b"data:"):
+                    continue
+                try:
+                    chunk = json.loads(line[5:])
+                except json.JSONDecodeError:
+                    continue
+                for candidate in chunk.get('candidates', [])[:1]:
+                    for part in candidate.get('content', {}).get('parts', []):
+                        for job in parser.feed(part.get('text', '')):
+                            job = validate_job(job)
+                            if job is None:
+                                rejected += 1
+                            else:
+                                yield job
+                if parser.done:
+                    break
+
+        if parser.errors or rejected:
+            print(f"Skipped {parser.errors + rejected} malformed or invalid jobs in Gemini API stream")
 
     def _get_mock_jobs(self, job_role, location=None, experience=None):
         """Generate mock job data for demonstration purposes."""
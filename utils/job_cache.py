@@ -0,0 +1,362 @@
+import os
+import re
+import json
+import time
+import asyncio
+import sqlite3
+import threading
+from collections import OrderedDict
+
+from .metrics import CACHE_LOOKUPS, CACHE_DURATION
+
+# Default sizing for the job-search result cache
+JOB_CACHE_MAX_SIZE = int(os.getenv("JOB_CACHE_MAX_SIZE", "1024"))
+JOB_CACHE_TTL = float(os.getenv("JOB_CACHE_TTL", "3600"))
+
+# Seconds past the TTL during which a stale result may still be served while it is refreshed
+JOB_CACHE_STALE_TTL = float(os.getenv("JOB_CACHE_STALE_TTL", "86400"))
+
+# Path of the optional on-disk tier; leave unset to keep the cache in memory only
+JOB_CACHE_DB = os.getenv("JOB_CACHE_DB", "")
+
+
+class TTLCache:
+    """Bounded in-memory LRU cache with an optional per-entry time-to-live."""
+
+    def __init__(self, max_size=1024, ttl=None):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size (int): Maximum number of entries kept before the least
+                recently used one is evicted
+            ttl (float, optional): Seconds an entry stays valid; None keeps
+                entries until they are evicted
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key, default=None):
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def peek(self, key, default=None):
+        """Return the value for key like get, without counting a hit or miss or refreshing its recency."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or (entry[1] is not None and entry[1] <= time.time()):
+            return default
+        return entry[0]
+
+    def set(self, key, value, ttl=None):
+        """Store value under key, evicting the least recently used entries if full."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.time() + ttl if ttl is not None else None
+
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key):
+        """Remove key from the cache if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Drop every entry, keeping the counters."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Return hit/miss/eviction counters and the current size."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+
+def experience_bucket(experience):
+    """
+    Map a free-text experience value onto a coarse bucket.
+
+    Args:
+        experience (str): Experience as given by the user, e.g. "3 years" or "entry level"
+
+    Returns:
+        str: One of "any", "entry", "mid", "senior" or "lead"
+    """
+    if not experience:
+        return "any"
+
+    text = str(experience).lower()
+    match = re.search(r'\d+', text)
+    if match:
+        years = int(match.group())
+        if years <= 1:
+            return "entry"
+        if years <= 4:
+            return "mid"
+        if years <= 9:
+            return "senior"
+        return "lead"
+
+    if 'entry' in text or 'junior' in text or 'fresher' in text:
+        return "entry"
+    if 'mid' in text:
+        return "mid"
+    if 'senior' in text or 'experienced' in text:
+        return "senior"
+    if 'lead' in text or 'principal' in text:
+        return "lead"
+    return "any"
+
+
+def normalize_job_query(job_role, location=None, experience=None):
+    """
+    Build the normalized cache key for a job search.
+
+    Returns:
+        tuple: (role, location, experience bucket) with whitespace collapsed and lowercased
+    """
+    def _clean(value):
+        return " ".join(str(value).lower().split()) if value else ""
+
+    return (_clean(job_role), _clean(location), experience_bucket(experience))
+
+
+class JobSearchCache:
+    """
+    Two-tier cache of job-search results: in-memory LRU/TTL backed by optional SQLite.
+
+    A result is fresh for `ttl` seconds and then stale for another
+    `stale_ttl` seconds, during which lookup() still returns it (flagged as
+    stale) so the caller can serve it while refreshing in the background.
+
+    lookup() and set() touch SQLite on the calling thread; async code uses
+    lookup_async() and set_async(), which keep the in-memory path inline but
+    run disk reads and writes in the default executor, so a slow disk or a
+    lock held by another worker does not stall the event loop.
+    """
+
+    def __init__(self, max_size=JOB_CACHE_MAX_SIZE, ttl=JOB_CACHE_TTL, db_path=JOB_CACHE_DB,
+                 stale_ttl=JOB_CACHE_STALE_TTL):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size (int): Maximum number of queries held in memory
+            ttl (float): Seconds a result stays fresh in either tier
+            db_path (str, optional): SQLite file for the persistent tier; falsy disables it
+            stale_ttl (float): Seconds a result may be served stale after it expires
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        # Entries are (jobs, fresh_until) and live until the end of their stale window
+        self.memory = TTLCache(max_size=max_size, ttl=ttl + stale_ttl)
+        self.disk_hits = 0
+        self.stale_hits = 0
+        self._db = None
+        self._db_lock = threading.Lock()
+
+        if db_path:
+            try:
+                self._db = sqlite3.connect(db_path, check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS job_search_cache ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                print(f"Could not open job cache database at {db_path}: {e}")
+                self._db = None
+
+    @staticmethod
+    def _db_key(key):
+        return json.dumps(key)
+
+    def get(self, job_role, location=None, experience=None):
+        """Return cached jobs for the query (fresh or stale), or None on a miss."""
+        return self.lookup(job_role, location, experience)[0]
+
+    def lookup(self, job_role, location=None, experience=None):
+        """
+        Look up the query and report how fresh the result is.
+
+        Returns:
+            tuple: (jobs, seconds until the result goes stale); jobs is None on
+            a miss and the remaining time is negative for a stale result
+        """
+        key = normalize_job_query(job_role, location, experience)
+        with CACHE_DURATION.time(cache="jobs"):
+            entry = self.memory.get(key)
+            if entry is None and self._db is not None:
+                entry = self._load_from_disk(key)
+        return self._freshness(entry)
+
+    async def lookup_async(self, job_role, location=None, experience=None):
+        """Like lookup, but reads the persistent tier in the default executor."""
+        key = normalize_job_query(job_role, location, experience)
+        with CACHE_DURATION.time(cache="jobs"):
+            entry = self.memory.get(key)
+            if entry is None and self._db is not None:
+                loop = asyncio.get_running_loop()
+                entry = await loop.run_in_executor(None, self._load_from_disk, key)
+        return self._freshness(entry)
+
+    async def peek(self, job_role, location=None, experience=None):
+        """
+        Report how fresh the cached result for the query is, for background work.
+
+        Unlike lookup_async, nothing is counted in the hit/miss statistics or
+        metrics and a result found on disk is not promoted to memory.
+
+        Returns:
+            tuple: (jobs, seconds until the result goes stale), as lookup
+        """
+        key = normalize_job_query(job_role, location, experience)
+        entry = self.memory.peek(key)
+        if entry is None and self._db is not None:
+            loop = asyncio.get_running_loop()
+            row = await loop.run_in_executor(None, self._read_from_disk, key)
+            entry = row[0] if row else None
+        if entry is None:
+            return None, 0.0
+        jobs, fresh_until = entry
+        return jobs, fresh_until - time.time()
+
+    def _freshness(self, entry):
+        """Count a lookup's outcome and return (jobs, seconds until stale)."""
+        if entry is None:
+            CACHE_LOOKUPS.inc(cache="jobs", result="miss")
+            return None, 0.0
+
+        jobs, fresh_until = entry
+        remaining = fresh_until - time.time()
+        if remaining <= 0:
+            self.stale_hits += 1
+            CACHE_LOOKUPS.inc(cache="jobs", result="stale")
+        else:
+            CACHE_LOOKUPS.inc(cache="jobs", result="hit")
+        return jobs, remaining
+
+    def _read_from_disk(self, key):
+        """Read a live key from the persistent tier; returns (entry, seconds left) or None."""
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT value, expires_at FROM job_search_cache WHERE key = ?",
+                (self._db_key(key),)
+            ).fetchone()
+        if row is None:
+            return None
+
+        value, expires_at = row
+        remaining = expires_at - time.time()
+        if remaining <= 0:
+            return None
+
+        # expires_at marks the end of the stale window, so freshness is derived from it
+        return (json.loads(value), expires_at - self.stale_ttl), remaining
+
+    def _load_from_disk(self, key):
+        """Read a key from the persistent tier and promote it to memory."""
+        row = self._read_from_disk(key)
+        if row is None:
+            return None
+
+        entry, remaining = row
+        self.disk_hits += 1
+        CACHE_LOOKUPS.inc(cache="jobs", result="disk_hit")
+        # Promote to memory for the rest of its lifetime
+        self.memory.set(key, entry, ttl=remaining)
+        return entry
+
+    def set(self, job_role, location, experience, jobs):
+        """Store jobs for the query in every enabled tier."""
+        key = normalize_job_query(job_role, location, experience)
+        fresh_until = time.time() + self.ttl
+        self.memory.set(key, (jobs, fresh_until))
+        if self._db is not None:
+            self._save_to_disk(key, jobs, fresh_until)
+
+    async def set_async(self, job_role, location, experience, jobs):
+        """Like set, but writes the persistent tier in the default executor."""
+        key = normalize_job_query(job_role, location, experience)
+        fresh_until = time.time() + self.ttl
+        self.memory.set(key, (jobs, fresh_until))
+        if self._db is not None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._save_to_disk, key, jobs, fresh_until)
+
+    def _save_to_disk(self, key, jobs, fresh_until):
+        """Write a result to the persistent tier; failures are logged, not raised."""
+        try:
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO job_search_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (self._db_key(key), json.dumps(jobs), fresh_until + self.stale_ttl)
+                )
+                self._db.commit()
+        except sqlite3.Error as e:
+            print(f"Could not persist job cache entry: {e}")
+
+    def purge_expired(self):
+        """Delete expired rows from the persistent tier."""
+        if self._db is None:
+            return
+        with self._db_lock:
+            self._db.execute("DELETE FROM job_search_cache WHERE expires_at <= ?", (time.time(),))
+            self._db.commit()
+
+    def clear(self):
+        """Drop every cached result from both tiers."""
+        self.memory.clear()
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute("DELETE FROM job_search_cache")
+                self._db.commit()
+
+    def stats(self):
+        """Return combined counters for both tiers."""
+        stats = self.memory.stats()
+        stats["disk_enabled"] = self._db is not None
+        stats["disk_hits"] = self.disk_hits
+        stats["stale_hits"] = self.stale_hits
+        # Disk hits were counted as memory misses; report them as overall hits instead
+        stats["hits"] += self.disk_hits
+        stats["misses"] -= self.disk_hits
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
@@ -0,0 +1,113 @@
+import os
+import threading
+from collections import namedtuple
+
+from .job_cache import TTLCache
+
+# Conversations whose search results are kept for paging, and for how long (seconds)
+JOB_CURSOR_MAX_SENDERS = int(os.getenv("JOB_CURSOR_MAX_SENDERS", "10000"))
+JOB_CURSOR_TTL = float(os.getenv("JOB_CURSOR_TTL", "1800"))
+
+# Ranked ids kept per sender (twenty pages of five); pages past them re-run the stored query
+JOB_CURSOR_MAX_IDS = int(os.getenv("JOB_CURSOR_MAX_IDS", "100"))
+
+# Where a sender is in their last search: the tier that answered, either a
+# window of the ranked index ids (local tier) or the job dicts themselves
+# (Gemini, mock), the total number of results, the offset of the next page,
+# the search criteria and the rank of the first id kept
+JobCursor = namedtuple("JobCursor", ["tier", "ranked", "jobs", "total", "offset", "query", "first"])
+
+# One page taken from a cursor: results [start, stop) of total
+JobPage = namedtuple("JobPage", ["cursor", "start", "stop", "total"])
+
+
+class JobCursorStore:
+    """
+    Per-sender cursors over the last job search, for "show more" requests.
+
+    Only a window of at most max_ids row ids (or the handful of jobs a
+    remote tier returned) is kept, so the next pages are sliced from it
+    instead of running the search again, and a sender costs a few hundred
+    bytes however large the listing. Pages past the window re-run the
+    stored query and refill it. The store is bounded and entries expire,
+    so abandoned conversations do not hold on to their results.
+    """
+
+    def __init__(self, max_size=JOB_CURSOR_MAX_SENDERS, ttl=JOB_CURSOR_TTL, max_ids=JOB_CURSOR_MAX_IDS):
+        """
+        Args:
+            max_size (int): Senders kept before the least recently active is evicted
+            ttl (float): Seconds a cursor stays usable after its last page
+            max_ids (int): Ranked ids kept per sender
+        """
+        self._cursors = TTLCache(max_size=max_size, ttl=ttl)
+        self._lock = threading.Lock()
+        self.max_ids = max_ids
+
+    def _window(self, ranked, first):
+        # Copy so the full ranking can be freed
+        return ranked._replace(ids=ranked.ids[first:first + self.max_ids].copy())
+
+    def start(self, sender_id, tier, total, ranked=None, jobs=None, shown=0, query=None):
+        """
+        Record a new search for sender_id, replacing any previous cursor.
+
+        Args:
+            ranked (RankedJobs, optional): Local-tier ranking; only its first max_ids ids are kept
+            jobs (list, optional): Jobs a remote tier returned, kept when there is no ranking
+            shown (int): Results already shown
+            query (tuple, optional): Search criteria, to rank again past the kept ids
+        """
+        if ranked is not None:
+            ranked = self._window(ranked, 0)
+        cursor = JobCursor(tier, ranked, list(jobs) if ranked is None and jobs else None, total, shown, query, 0)
+        self._cursors.set(sender_id, cursor)
+        return cursor
+
+    def refill(self, sender_id, ranked, first):
+        """
+        Replace sender_id's kept ids with the window of ranked starting at rank first.
+
+        Returns:
+            JobCursor: The updated cursor, or None if the sender has none
+        """
+        with self._lock:
+            cursor = self._cursors.get(sender_id)
+            if cursor is None:
+                return None
+            cursor = cursor._replace(ranked=self._window(ranked, first), first=first)
+            self._cursors.set(sender_id, cursor)
+        return cursor
+
+    def next_page(self, sender_id, page_size):
+        """
+        Advance sender_id's cursor by one page.
+
+        Returns:
+            JobPage: The cursor the page comes from and its bounds (start ==
+                stop once everything was shown), or None if the sender has no
+                cursor or it expired
+        """
+        with self._lock:
+            cursor = self._cursors.get(sender_id)
+            if cursor is None:
+                return None
+            start = min(cursor.offset, cursor.total)
+            stop = min(start + page_size, cursor.total)
+            self._cursors.set(sender_id, cursor._replace(offset=stop))
+        return JobPage(cursor, start, stop, cursor.total)
+
+    @staticmethod
+    def page_ids(cursor, start, stop):
+        """Return the ranked ids for results [start, stop), or None if they are not all in the kept window."""
+        if start < cursor.first or stop > cursor.first + len(cursor.ranked.ids):
+            return None
+        return cursor.ranked.ids[start - cursor.first:stop - cursor.first]
+
+    def clear(self, sender_id):
+        """Forget sender_id's cursor."""
+        self._cursors.delete(sender_id)
+
+    def stats(self):
+        """Return the store's cache counters."""
+        return self._cursors.stats()
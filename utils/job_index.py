@@ -0,0 +1,252 @@
+import os
+import time
+import asyncio
+import logging
+import threading
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from .job_ranker import JobRanker
+from .experience_index import ExperienceIndex, experience_ranges
+from .job_store import file_digest, load_job_frame
+from .location_service import UNKNOWN_LOCATION_ID
+from .single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Columns matched case-insensitively by the job search
+SEARCH_COLUMNS = ["title", "company", "role", "location", "job_type", "skills", "industry"]
+
+# Version of the columns build_job_frame adds; bump it when they change so stored frames are rebuilt
+JOB_FRAME_VERSION = "2"
+
+# Seconds between checks of the listing file for changes
+JOB_INDEX_CHECK_INTERVAL = float(os.getenv("JOB_INDEX_CHECK_INTERVAL", "5"))
+
+# Immutable view of one loaded version of the listing file
+JobSnapshot = namedtuple(
+    "JobSnapshot", ["frame", "ranker", "location_ids", "experience_index", "mtime", "digest", "loaded_at"]
+)
+
+# Row ids of one search, best first, and the digest of the snapshot they index into
+RankedJobs = namedtuple("RankedJobs", ["digest", "ids"])
+
+
+def build_job_frame(job_data):
+    """
+    Prepare a raw listing frame for searching.
+
+    Display columns are kept as-is; a lowercased `<column>_lc` copy is added
+    for every searchable column and experience is parsed into numeric
+    `experience_min`/`experience_max` years. Columns that are already present
+    (e.g. loaded from the columnar store) are left untouched.
+    """
+    if not isinstance(job_data.index, pd.RangeIndex) or job_data.index.start != 0:
+        job_data = job_data.reset_index(drop=True)
+    for col in SEARCH_COLUMNS:
+        if col in job_data.columns and f"{col}_lc" not in job_data.columns:
+            job_data[f"{col}_lc"] = job_data[col].astype(object).fillna("").astype(str).str.lower()
+    if "experience" in job_data.columns and "experience_min" not in job_data.columns:
+        job_data["experience_min"], job_data["experience_max"] = experience_ranges(job_data["experience"])
+    return job_data
+
+
+def build_job_ranker(job_frame):
+    """Build the BM25 inverted index over a frame prepared by build_job_frame."""
+    fields = [col for col in ("title", "role", "skills", "location", "job_type") if f"{col}_lc" in job_frame.columns]
+    columns = [job_frame[f"{col}_lc"] for col in fields]
+    return JobRanker(dict(zip(fields, values)) for values in zip(*columns))
+
+
+def build_location_ids(job_frame, location_service):
+    """
+    Resolve every job's location to a canonical id (0 when unknown).
+
+    Only the distinct location strings are resolved, so this costs one
+    lookup per city rather than per job. The ids are rebuilt on every load
+    instead of being stored with the frame, so gazetteer updates apply on
+    the next reload.
+
+    Returns:
+        numpy.ndarray: int32 id per row, or None without a service or location column
+    """
+    if location_service is None or "location" not in job_frame.columns:
+        return None
+    codes, uniques = pd.factorize(job_frame["location"])
+    ids = np.array([location_service.location_id(value) for value in uniques] + [UNKNOWN_LOCATION_ID],
+                   dtype=np.int32)
+    # factorize marks missing values with -1, which picks the trailing unknown id
+    return ids[codes]
+
+
+def build_experience_index(job_frame):
+    """Build the range index over the experience columns added by build_job_frame, if any."""
+    if "experience_min" not in job_frame.columns:
+        return None
+    return ExperienceIndex(job_frame["experience_min"].to_numpy(), job_frame["experience_max"].to_numpy())
+
+
+class JobIndex:
+    """Process-wide, load-once index over the job listing CSV with reload-on-change."""
+
+    def __init__(self, data_path, check_interval=JOB_INDEX_CHECK_INTERVAL, location_service=None):
+        """
+        Initialize an empty index.
+
+        Args:
+            data_path (str): Path of the job listing CSV
+            check_interval (float): Minimum seconds between file change checks
+            location_service (LocationService, optional): Resolves locations to
+                ids so the location filter compares integers; without it the
+                location is matched as words
+        """
+        self.data_path = data_path
+        self.check_interval = check_interval
+        self.location_service = location_service
+        self._snapshot = None
+        # (mtime, digest) of the last file version that failed to load, so it is not parsed again
+        self._failed = None
+        self._last_check = 0.0
+        self._reload_lock = threading.Lock()
+        self._reloads = SingleFlight()
+
+    @property
+    def snapshot(self):
+        """The current immutable snapshot, or None if nothing has been loaded."""
+        return self._snapshot
+
+    def load(self):
+        """
+        Synchronously (re)build the index if the file changed since the last load.
+
+        The new snapshot is fully built before it replaces the old one, so
+        concurrent readers always see a complete index. A file that cannot be
+        parsed (e.g. half-written) leaves the previous snapshot in place and
+        is not retried until it changes again.
+
+        Returns:
+            JobSnapshot: The current snapshot, or None if nothing valid was loaded.
+        """
+        with self._reload_lock:
+            self._last_check = time.monotonic()
+            if not os.path.exists(self.data_path):
+                logger.warning(f"Job listing CSV file not found at {self.data_path}")
+                return self._snapshot
+
+            mtime = os.path.getmtime(self.data_path)
+            current = self._snapshot
+            if current is not None and current.mtime == mtime:
+                return current
+            if self._failed is not None and self._failed[0] == mtime:
+                return current
+
+            digest = file_digest(self.data_path)
+            if current is not None and current.digest == digest:
+                # Touched but unchanged; keep the built frame
+                self._snapshot = current._replace(mtime=mtime)
+                self._failed = None
+                return self._snapshot
+            if self._failed is not None and self._failed[1] == digest:
+                # Touched but still the version that failed
+                self._failed = (mtime, digest)
+                return current
+
+            try:
+                # Served from the memory-mapped columnar store, regenerated when the CSV changes
+                stored = load_job_frame(self.data_path, digest, prepare=build_job_frame, version=JOB_FRAME_VERSION)
+                frame = build_job_frame(stored)
+                ranker = build_job_ranker(frame)
+                location_ids = build_location_ids(frame, self.location_service)
+                experience_index = build_experience_index(frame)
+            except Exception as e:
+                self._failed = (mtime, digest)
+                logger.error(f"Could not load job listings from {self.data_path}: {str(e)} - "
+                             f"keeping the previous index until the file changes")
+                return current
+
+            self._failed = None
+            self._snapshot = JobSnapshot(frame, ranker, location_ids, experience_index, mtime, digest, time.time())
+            logger.info(f"Job index loaded from {self.data_path}: {len(frame)} jobs")
+            return self._snapshot
+
+    def _needs_check(self):
+        return self._snapshot is None or time.monotonic() - self._last_check >= self.check_interval
+
+    async def refresh(self):
+        """
+        Reload the index off the event loop if the file may have changed.
+
+        Concurrent callers share one reload; readers keep using the previous
+        snapshot until the new one is swapped in.
+        """
+        if not self._needs_check():
+            return self._snapshot
+
+        loop = asyncio.get_running_loop()
+        return await self._reloads.do(self.data_path, loop.run_in_executor, None, self.load)
+
+    def search_ids(self, job_role=None, location=None, experience=None, job_type=None, skill=None):
+        """
+        Rank the current snapshot against the given criteria.
+
+        The role is matched as free text with BM25 over title, role and skills;
+        job type and skill restrict the candidates via the inverted index
+        before scoring. A location the location service recognizes restricts
+        them by id (a state includes its cities); any other location is
+        matched as words like the other filters. Experience ("3 years",
+        "2-4 years", "senior level") keeps the jobs whose required years
+        overlap the stated range.
+
+        Returns:
+            RankedJobs: Matching row ids, most relevant first (digest None if nothing is loaded)
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return RankedJobs(None, np.empty(0, dtype=np.int32))
+
+        allowed = None
+        resolved = self.location_service.resolve(location) if location and snapshot.location_ids is not None else None
+        if resolved is not None:
+            allowed = np.flatnonzero(np.isin(snapshot.location_ids, resolved.ids))
+            location = None
+
+        if experience and snapshot.experience_index is not None:
+            experienced = snapshot.experience_index.lookup(experience)
+            if experienced is not None:
+                allowed = experienced if allowed is None else np.intersect1d(allowed, experienced, assume_unique=True)
+
+        if allowed is not None and len(allowed) == 0:
+            return RankedJobs(snapshot.digest, np.empty(0, dtype=np.int32))
+
+        ranked = snapshot.ranker.search(
+            job_role, location=location, job_type=job_type, skill=skill,
+            allowed=None if allowed is None else allowed.tolist(),
+        )
+        ids = np.fromiter((doc_id for doc_id, _ in ranked), dtype=np.int32, count=len(ranked))
+        return RankedJobs(snapshot.digest, ids)
+
+    def rows(self, ranked, start=0, stop=None):
+        """
+        Return the rows for a slice of a search result.
+
+        Returns:
+            pandas.DataFrame: The rows in ranked order, or None if the index was
+                reloaded since the search and the ids no longer apply
+        """
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.digest != ranked.digest:
+            return None
+        return snapshot.frame.iloc[ranked.ids[start:stop]]
+
+    def search(self, job_role=None, location=None, experience=None, job_type=None, skill=None):
+        """
+        Rank the current snapshot against the given criteria; see search_ids.
+
+        Returns:
+            pandas.DataFrame: Matching rows, most relevant first (empty if nothing is loaded)
+        """
+        ranked = self.search_ids(job_role, location, experience, job_type, skill)
+        rows = self.rows(ranked) if ranked.digest is not None else None
+        return pd.DataFrame() if rows is None else rows
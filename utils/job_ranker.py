@@ -0,0 +1,172 @@
+import re
+import math
+from array import array
+from collections import defaultdict
+
+# Fields scored by BM25, with the weight a term occurrence carries in each
+SCORED_FIELDS = {"title": 3.0, "role": 2.0, "skills": 1.0}
+
+# Fields used only to restrict the candidate set
+FILTER_FIELDS = ("location", "job_type", "skills")
+
+STOP_WORDS = {
+    "a", "an", "and", "at", "for", "in", "of", "on", "or", "the", "to", "with",
+    "job", "jobs", "role", "roles", "position", "positions", "opening", "openings"
+}
+
+# Common abbreviations expanded so "ml engineer" finds "machine learning engineer"
+QUERY_EXPANSIONS = {
+    "ml": ["machine", "learning"],
+    "ai": ["artificial", "intelligence", "ai"],
+    "dev": ["developer"],
+    "pm": ["product", "manager"],
+    "ux": ["ux", "designer"],
+    "ui": ["ui", "designer"],
+    "hr": ["hr", "human", "resource"]
+}
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+
+def tokenize(text):
+    """
+    Split text into normalized search tokens.
+
+    Lowercases, drops stop words and strips a plural "s" so that
+    "Developers" and "developer" match.
+    """
+    tokens = []
+    for token in _TOKEN_RE.findall(str(text).lower()):
+        if token in STOP_WORDS:
+            continue
+        if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+class JobRanker:
+    """Inverted index over job listings with BM25 ranking."""
+
+    def __init__(self, records, k1=1.2, b=0.75):
+        """
+        Build the index.
+
+        Args:
+            records (iterable): One mapping per job with (lowercased) field values,
+                in the same order as the rows they describe
+            k1 (float): BM25 term-frequency saturation
+            b (float): BM25 length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self._doc_ids = defaultdict(lambda: array('I'))
+        self._term_freqs = defaultdict(lambda: array('f'))
+        self._filters = {field: defaultdict(lambda: array('I')) for field in FILTER_FIELDS}
+        self._doc_lengths = array('f')
+
+        for doc_id, record in enumerate(records):
+            weights = defaultdict(float)
+            for field, weight in SCORED_FIELDS.items():
+                for token in tokenize(record.get(field) or ""):
+                    weights[token] += weight
+            for token, weight in weights.items():
+                self._doc_ids[token].append(doc_id)
+                self._term_freqs[token].append(weight)
+            self._doc_lengths.append(sum(weights.values()))
+
+            for field in FILTER_FIELDS:
+                for token in set(tokenize(record.get(field) or "")):
+                    self._filters[field][token].append(doc_id)
+
+        self.size = len(self._doc_lengths)
+        self._avg_length = (sum(self._doc_lengths) / self.size) if self.size else 0.0
+
+    def __len__(self):
+        return self.size
+
+    def _filter_docs(self, field, value):
+        """Return the set of docs whose field contains every token of value."""
+        tokens = tokenize(value)
+        if not tokens:
+            return None
+
+        postings = [self._filters[field].get(token) for token in tokens]
+        if any(p is None for p in postings):
+            return set()
+
+        postings.sort(key=len)
+        docs = set(postings[0])
+        for p in postings[1:]:
+            docs.intersection_update(p)
+        return docs
+
+    def _allowed_docs(self, **filters):
+        """Intersect the candidate sets of all given filters; None means unrestricted."""
+        allowed = None
+        for field, value in filters.items():
+            if not value:
+                continue
+            docs = self._filter_docs(field, value)
+            if docs is None:
+                continue
+            allowed = docs if allowed is None else allowed & docs
+            if not allowed:
+                return set()
+        return allowed
+
+    def search(self, query=None, location=None, job_type=None, skill=None, allowed=None):
+        """
+        Rank jobs against a free-text query.
+
+        Every query word (or its expansion) counts once; a job must match at
+        least half of them to be returned.
+
+        Args:
+            query (str, optional): Free-text role query, e.g. "ml engineer python"
+            location (str, optional): Restrict to jobs whose location has these words
+            job_type (str, optional): Restrict to jobs whose type has these words
+            skill (str, optional): Restrict to jobs listing this skill
+            allowed (iterable, optional): Restrict to these doc ids, e.g. from a
+                location id lookup done by the caller
+
+        Returns:
+            list: (doc_id, score) pairs, best first
+        """
+        filtered = self._allowed_docs(location=location, job_type=job_type, skills=skill)
+        if allowed is None:
+            allowed = filtered
+        else:
+            allowed = set(allowed) if filtered is None else filtered & set(allowed)
+        if allowed is not None and not allowed:
+            return []
+
+        groups = [QUERY_EXPANSIONS.get(token, [token]) for token in tokenize(query or "")]
+        if not groups:
+            docs = range(self.size) if allowed is None else sorted(allowed)
+            return [(doc_id, 0.0) for doc_id in docs]
+
+        scores = defaultdict(float)
+        matched_groups = defaultdict(int)
+        for group in groups:
+            group_docs = set()
+            for term in set(group):
+                doc_ids = self._doc_ids.get(term)
+                if not doc_ids:
+                    continue
+                df = len(doc_ids)
+                idf = math.log(1 + (self.size - df + 0.5) / (df + 0.5))
+                term_freqs = self._term_freqs[term]
+                for doc_id, tf in zip(doc_ids, term_freqs):
+                    if allowed is not None and doc_id not in allowed:
+                        continue
+                    norm = self.k1 * (1 - self.b + self.b * self._doc_lengths[doc_id] / self._avg_length)
+                    scores[doc_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+                    group_docs.add(doc_id)
+            for doc_id in group_docs:
+                matched_groups[doc_id] += 1
+
+        required = math.ceil(len(groups) / 2)
+        ranked = [(doc_id, score) for doc_id, score in scores.items() if matched_groups[doc_id] >= required]
+        ranked.sort(key=lambda item: (-item[1], item[0]))
+        return ranked
@@ -0,0 +1,88 @@
+import re
+import json
+
+from .json_stream import JSONArrayStreamParser
+
+# Fields Gemini generates for each job; the application URL is derived from
+# the title instead of being generated, which saves output tokens
+GENERATED_JOB_FIELDS = ["title", "company", "location", "type", "posted_date"]
+REQUIRED_JOB_FIELDS = ["title", "company"]
+
+JOB_URL_PREFIX = "https://herkey.com/jobs/apply/"
+
+# Longest value kept for any field; longer values are truncated
+MAX_FIELD_LENGTH = 200
+
+# Gemini responseSchema (OpenAPI subset) for a list of jobs
+JOB_RESPONSE_SCHEMA = {
+    "type": "ARRAY",
+    "items": {
+        "type": "OBJECT",
+        "properties": {field: {"type": "STRING"} for field in GENERATED_JOB_FIELDS},
+        "required": GENERATED_JOB_FIELDS
+    }
+}
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+def job_url(title):
+    """Return the Herkey application URL for a job title."""
+    slug = _SLUG_RE.sub("-", str(title).lower()).strip("-")
+    return f"{JOB_URL_PREFIX}{slug or 'job'}"
+
+
+def validate_job(job):
+    """
+    Check one generated job against the schema.
+
+    Missing optional fields are filled with defaults and values are coerced
+    to trimmed strings.
+
+    Returns:
+        dict: The cleaned job, or None if it is not an object or lacks a required field
+    """
+    if not isinstance(job, dict):
+        return None
+
+    cleaned = {}
+    for field in GENERATED_JOB_FIELDS:
+        value = job.get(field)
+        if isinstance(value, (dict, list)):
+            value = None
+        value = str(value).strip()[:MAX_FIELD_LENGTH] if value is not None else ""
+        if not value and field in REQUIRED_JOB_FIELDS:
+            return None
+        cleaned[field] = value
+
+    cleaned["type"] = cleaned["type"] or "Full-time"
+    cleaned["posted_date"] = cleaned["posted_date"] or "Recently"
+    url = job.get("url")
+    cleaned["url"] = url if isinstance(url, str) and url.startswith(JOB_URL_PREFIX) else job_url(cleaned["title"])
+    return cleaned
+
+
+def parse_jobs(text):
+    """
+    Parse a generated job list, keeping every valid job.
+
+    The text is decoded as a whole first; if that fails (e.g. the output was
+    cut off at maxOutputTokens) the complete objects are recovered one by one.
+
+    Returns:
+        tuple: (valid jobs, number of rejected entries)
+    """
+    try:
+        entries = json.loads(text)
+        if isinstance(entries, dict):
+            entries = [entries]
+        elif not isinstance(entries, list):
+            entries = []
+        errors = 0
+    except (TypeError, ValueError):
+        parser = JSONArrayStreamParser()
+        entries = parser.feed(text or "")
+        errors = parser.errors
+
+    jobs = [job for job in map(validate_job, entries) if job is not None]
+    return jobs, errors + len(entries) - len(jobs)
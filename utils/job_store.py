@@ -0,0 +1,208 @@
+"""
+Columnar binary store for the job listings.
+
+The CSV stays the source of truth. It is converted into one NumPy array per
+column (strings dictionary-encoded as integer codes) so action-server workers
+can memory-map the data and share pages through the OS cache instead of each
+parsing the CSV text.
+
+Usage:
+    python -m utils.job_store [path/to/job_listing_data.csv]
+"""
+import os
+import sys
+import json
+import shutil
+import hashlib
+import logging
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+META_FILE = "meta.json"
+
+# Layout of the store itself; bump when the way columns are written changes
+STORE_FORMAT = 1
+
+
+def default_store_dir(csv_path):
+    """Return the store directory used for csv_path (overridable with JOB_STORE_DIR)."""
+    return os.getenv("JOB_STORE_DIR") or os.path.splitext(csv_path)[0] + ".columns"
+
+
+def file_digest(path):
+    """Return the MD5 hex digest of the file at path."""
+    digest = hashlib.md5()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _code_dtype(n_categories):
+    """Match the code width pandas uses so categoricals wrap the mapped array without copying."""
+    if n_categories < np.iinfo(np.int8).max:
+        return np.int8
+    if n_categories < np.iinfo(np.int16).max:
+        return np.int16
+    if n_categories < np.iinfo(np.int32).max:
+        return np.int32
+    return np.int64
+
+
+def _build_name(source_digest, version):
+    """Directory name of one build: the source digest plus the format and caller version."""
+    return f"{source_digest}.f{STORE_FORMAT}" + (f".{version}" if version else "")
+
+
+def _is_current(meta, digest, version):
+    """True if meta describes a store built from digest by this code."""
+    return (
+        meta is not None
+        and meta.get("source_digest") == digest
+        and meta.get("format") == STORE_FORMAT
+        and meta.get("version") == version
+    )
+
+
+def _read_meta(store_dir):
+    try:
+        with open(os.path.join(store_dir, META_FILE), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_store(job_data, store_dir, source_digest, version=None):
+    """
+    Write job_data to store_dir as memory-mappable columns.
+
+    Each build goes into its own subdirectory and meta.json is swapped in
+    last, so readers never observe a partially written store.
+
+    Args:
+        version (str, optional): Version of the derived columns in job_data
+            (see load_job_frame); recorded in meta.json
+    """
+    build_name = _build_name(source_digest, version)
+    version_dir = os.path.join(store_dir, build_name)
+    tmp_dir = f"{version_dir}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    try:
+        columns = []
+        for name in job_data.columns:
+            series = job_data[name]
+            file_name = f"{len(columns)}.npy"
+            if pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype):
+                np.save(os.path.join(tmp_dir, file_name), series.to_numpy())
+                columns.append({"name": name, "kind": "numeric", "file": file_name})
+            else:
+                codes, categories = pd.factorize(series.astype(object))
+                codes = codes.astype(_code_dtype(len(categories)))
+                np.save(os.path.join(tmp_dir, file_name), codes)
+                columns.append({"name": name, "kind": "dictionary", "file": file_name,
+                                "categories": [str(c) for c in categories]})
+
+        if not os.path.isdir(version_dir):
+            try:
+                os.replace(tmp_dir, version_dir)
+            except OSError:
+                # A concurrent builder swapped in the same build first; use theirs
+                if not os.path.isdir(version_dir):
+                    raise
+    finally:
+        # Left behind only if the swap did not happen
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    meta = {"format": STORE_FORMAT, "version": version, "source_digest": source_digest,
+            "build": build_name, "rows": len(job_data), "columns": columns}
+    meta_tmp = os.path.join(store_dir, f"{META_FILE}.tmp-{os.getpid()}")
+    with open(meta_tmp, 'w') as f:
+        json.dump(meta, f)
+    os.replace(meta_tmp, os.path.join(store_dir, META_FILE))
+
+    # Drop older builds; workers that still map them keep their pages until they reload
+    for entry in os.listdir(store_dir):
+        path = os.path.join(store_dir, entry)
+        if entry != build_name and os.path.isdir(path) and '.tmp-' not in entry:
+            shutil.rmtree(path, ignore_errors=True)
+
+    logger.info(f"Wrote columnar job store for {len(job_data)} jobs to {version_dir}")
+    return meta
+
+
+def read_store(store_dir, meta=None):
+    """Load the store as a DataFrame whose columns are memory-mapped arrays."""
+    meta = meta or _read_meta(store_dir)
+    if meta is None:
+        raise FileNotFoundError(f"No job store found at {store_dir}")
+
+    version_dir = os.path.join(store_dir, meta["build"])
+    data = {}
+    for column in meta["columns"]:
+        values = np.load(os.path.join(version_dir, column["file"]), mmap_mode='r')
+        if column["kind"] == "dictionary":
+            data[column["name"]] = pd.Categorical.from_codes(values, categories=column["categories"])
+        else:
+            data[column["name"]] = values
+    return pd.DataFrame(data, copy=False)
+
+
+def convert_csv(csv_path, store_dir=None, prepare=None, version=None):
+    """
+    Convert the listing CSV into the columnar store.
+
+    Args:
+        csv_path (str): Path of the source CSV
+        store_dir (str, optional): Output directory; defaults to default_store_dir(csv_path)
+        prepare (callable, optional): Applied to the parsed frame before writing,
+            e.g. to add pre-normalized search columns
+        version (str, optional): Version of the columns prepare adds
+
+    Returns:
+        dict: The metadata of the written store
+    """
+    store_dir = store_dir or default_store_dir(csv_path)
+    os.makedirs(store_dir, exist_ok=True)
+    job_data = pd.read_csv(csv_path)
+    if prepare is not None:
+        job_data = prepare(job_data)
+    return write_store(job_data, store_dir, file_digest(csv_path), version)
+
+
+def load_job_frame(csv_path, digest=None, store_dir=None, prepare=None, version=None):
+    """
+    Load the job listings, (re)generating the columnar store when the CSV changed.
+
+    The store is also rebuilt when it was written by a different store format
+    or with a different version of the columns prepare adds, so derived
+    columns from older code are never reused. Bump version whenever prepare
+    changes what it writes.
+
+    Falls back to parsing the CSV directly if the store cannot be written or read.
+    """
+    store_dir = store_dir or default_store_dir(csv_path)
+    digest = digest or file_digest(csv_path)
+
+    try:
+        meta = _read_meta(store_dir)
+        if not _is_current(meta, digest, version):
+            meta = convert_csv(csv_path, store_dir, prepare, version)
+        return read_store(store_dir, meta)
+    except Exception as e:
+        logger.error(f"Could not use columnar job store at {store_dir}: {str(e)} - reading CSV instead")
+        job_data = pd.read_csv(csv_path)
+        return prepare(job_data) if prepare is not None else job_data
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    source = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.getcwd(), "data", "job_listing_data.csv")
+
+    from .job_index import JOB_FRAME_VERSION, build_job_frame
+    result = convert_csv(source, prepare=build_job_frame, version=JOB_FRAME_VERSION)
+    print(f"Converted {result['rows']} jobs into {default_store_dir(source)}")
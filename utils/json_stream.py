@@ -0,0 +1,74 @@
+import json
+
+
+class JSONArrayStreamParser:
+    """
+    Incrementally extract the objects of a JSON array from streamed text.
+
+    Text can arrive in arbitrary chunks (e.g. streamed model output, possibly
+    wrapped in a markdown code fence). Each top-level object inside the first
+    array is decoded and returned as soon as its closing brace has been seen,
+    without waiting for the rest of the array.
+    """
+
+    def __init__(self):
+        self._buffer = []
+        self._in_array = False
+        self._done = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self.errors = 0
+
+    @property
+    def done(self):
+        """True once the closing bracket of the array has been seen."""
+        return self._done
+
+    def feed(self, text):
+        """
+        Consume the next chunk of text.
+
+        Returns:
+            list: Objects completed by this chunk, in order. Objects that are
+            not valid JSON are skipped and counted in `errors`.
+        """
+        completed = []
+        for char in text:
+            if self._done:
+                break
+
+            if not self._in_array:
+                if char == '[':
+                    self._in_array = True
+                continue
+
+            if self._depth == 0:
+                if char == '{':
+                    self._depth = 1
+                    self._buffer = [char]
+                elif char == ']':
+                    self._done = True
+                continue
+
+            self._buffer.append(char)
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == '\\':
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in '{[':
+                self._depth += 1
+            elif char in '}]':
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        completed.append(json.loads(''.join(self._buffer)))
+                    except json.JSONDecodeError:
+                        self.errors += 1
+                    self._buffer = []
+        return completed
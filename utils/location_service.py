@@ -0,0 +1,249 @@
+import os
+import re
+import json
+import logging
+from collections import namedtuple
+
+from .job_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Number of distinct raw inputs whose resolution is remembered
+LOCATION_CACHE_SIZE = int(os.getenv("LOCATION_CACHE_SIZE", "4096"))
+
+# Longest run of words tried as a place name inside a sentence ("navi mumbai", "jammu and kashmir")
+MAX_NAME_WORDS = 4
+
+# Aliases this short ("up", "mp", "blr") are ordinary words inside a sentence, so they
+# only count when they are the whole input
+SHORT_ALIAS_LENGTH = 3
+
+# Id reserved for locations that did not resolve; real ids start at 1
+UNKNOWN_LOCATION_ID = 0
+
+# A resolved location: canonical id and name, every id it covers (a state
+# covers its cities) and how it was found (exact, alias, fuzzy or prefix)
+ResolvedLocation = namedtuple("ResolvedLocation", ["id", "name", "ids", "match"])
+
+_NON_WORD = re.compile(r"[^a-z0-9&]+")
+
+
+def normalize_location(text):
+    """Lowercase text and reduce punctuation and whitespace to single spaces."""
+    return _NON_WORD.sub(" ", str(text or "").lower()).strip()
+
+
+def max_edits(term):
+    """Edit distance tolerated for a term; short names must be typed exactly."""
+    if len(term) <= 4:
+        return 0
+    return 1 if len(term) <= 8 else 2
+
+
+class LocationService:
+    """
+    Map free-text locations onto canonical ids from the bundled gazetteer.
+
+    Names and aliases are held in a character trie, which serves both prefix
+    completion ("hyde" -> Hyderabad) and bounded edit-distance search
+    ("banglore" -> Bangalore) without comparing against every name. Results
+    are memoized per raw input, so repeated slot values and the distinct
+    values of the job listing resolve once.
+
+    Short aliases and those listed as "standalone" ("anywhere", "online")
+    are kept out of the trie and only match when they are the whole input,
+    so "sign me up" is not Uttar Pradesh.
+    """
+
+    def __init__(self, entries=None, cache_size=LOCATION_CACHE_SIZE):
+        """
+        Args:
+            entries (list): Dicts with "id", "name", "kind" (city, state or
+                remote), optional "state", "aliases" and "standalone" (aliases
+                that only count as the whole input)
+            cache_size (int): Raw inputs memoized
+        """
+        self.names = {}
+        self.covers = {}
+        self.terms = {}
+        self.standalone = {}
+        self._trie = {}
+        self._cache = TTLCache(max_size=cache_size)
+
+        entries = list(entries or [])
+        state_ids = {}
+        for entry in entries:
+            self.names[entry["id"]] = entry["name"]
+            self.covers[entry["id"]] = [entry["id"]]
+            if entry.get("kind") == "state":
+                state_ids[entry["name"]] = entry["id"]
+
+        for entry in entries:
+            state_id = state_ids.get(entry.get("state"))
+            if state_id is not None:
+                self.covers[state_id].append(entry["id"])
+
+            for term in entry.get("standalone", []):
+                self.standalone.setdefault(normalize_location(term), (entry["id"], "alias"))
+
+            for n, term in enumerate([entry["name"]] + list(entry.get("aliases", []))):
+                term = normalize_location(term)
+                if not term or term in self.terms or term in self.standalone:
+                    continue
+                if n > 0 and len(term) <= SHORT_ALIAS_LENGTH:
+                    self.standalone[term] = (entry["id"], "alias")
+                    continue
+                self.terms[term] = (entry["id"], "exact" if n == 0 else "alias")
+                node = self._trie
+                for char in term:
+                    node = node.setdefault(char, {})
+                node[""] = entry["id"]
+
+        self.covers = {location_id: tuple(ids) for location_id, ids in self.covers.items()}
+
+    @classmethod
+    def from_file(cls, path, **kwargs):
+        """Load the gazetteer from a JSON file; a missing or broken file gives an empty service."""
+        try:
+            with open(path, "r") as f:
+                return cls(json.load(f).get("locations", []), **kwargs)
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"Could not load locations from {path}: {str(e)}")
+            return cls(**kwargs)
+
+    def __len__(self):
+        return len(self.names)
+
+    def _result(self, location_id, match):
+        return ResolvedLocation(location_id, self.names[location_id], self.covers[location_id], match)
+
+    def complete(self, prefix):
+        """Return the ids of every location with a name or alias starting with prefix."""
+        node = self._trie
+        for char in normalize_location(prefix):
+            node = node.get(char)
+            if node is None:
+                return set()
+
+        ids = set()
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for char, child in node.items():
+                if char:
+                    stack.append(child)
+                else:
+                    ids.add(child)
+        return ids
+
+    def fuzzy(self, term, max_distance=None):
+        """
+        Find the location whose name or alias is within the edit distance of term.
+
+        Insertions, deletions, substitutions and swaps of adjacent letters
+        ("mumbia") each count as one edit. The table is computed one row per
+        trie node, so names sharing a prefix share the work, and a subtree is
+        abandoned once every cell of its row exceeds the bound.
+
+        Returns:
+            int: The closest location id, or None if nothing is close enough
+                or two different locations are equally close
+        """
+        term = normalize_location(term)
+        if max_distance is None:
+            max_distance = max_edits(term)
+        if not term:
+            return None
+
+        best = {}
+        size = len(term)
+        first_row = list(range(size + 1))
+        stack = [(child, char, "", first_row, None) for char, child in self._trie.items() if char]
+        while stack:
+            node, char, previous_char, previous, before = stack.pop()
+            row = [previous[0] + 1]
+            for col in range(1, size + 1):
+                cost = 0 if term[col - 1] == char else 1
+                cell = min(row[col - 1] + 1, previous[col] + 1, previous[col - 1] + cost)
+                if before is not None and col > 1 and term[col - 1] == previous_char and term[col - 2] == char:
+                    cell = min(cell, before[col - 2] + 1)
+                row.append(cell)
+
+            if "" in node and row[-1] <= max_distance:
+                location_id = node[""]
+                best[location_id] = min(row[-1], best.get(location_id, row[-1]))
+            if min(row) <= max_distance:
+                stack.extend((child, next_char, char, row, previous) for next_char, child in node.items() if next_char)
+
+        if not best:
+            return None
+        distance = min(best.values())
+        closest = [location_id for location_id, d in best.items() if d == distance]
+        return closest[0] if len(closest) == 1 else None
+
+    def resolve(self, raw):
+        """
+        Resolve a slot value or message to a canonical location.
+
+        Tried in order: the whole input as a short or standalone alias, each
+        run of up to MAX_NAME_WORDS words as a name or alias (longest first, so "navi mumbai" wins over "mumbai"), runs of
+        one or two words within the edit-distance bound, and finally
+        an unambiguous completion of a prefix of three or more letters.
+
+        Returns:
+            ResolvedLocation: The location, or None if nothing matched
+        """
+        key = str(raw or "")
+        cached = self._cache.get(key)
+        if cached is not None:
+            # Misses are cached as () so they are not resolved again
+            return cached or None
+
+        result = self._resolve(key)
+        self._cache.set(key, result or ())
+        return result
+
+    def _resolve(self, raw):
+        text = normalize_location(raw)
+        if not text:
+            return None
+        if text in self.standalone:
+            return self._result(*self.standalone[text])
+
+        words = text.split()
+        windows = [
+            " ".join(words[start:start + size])
+            for size in range(min(MAX_NAME_WORDS, len(words)), 0, -1)
+            for start in range(len(words) - size + 1)
+        ]
+
+        for window in windows:
+            if window in self.terms:
+                return self._result(*self.terms[window])
+
+        # Typos are looked for in single words and pairs only; short words must match exactly
+        for window in windows:
+            if window.count(" ") > 1 or max_edits(window) == 0:
+                continue
+            location_id = self.fuzzy(window)
+            if location_id is not None:
+                return self._result(location_id, "fuzzy")
+
+        if len(text) >= 3:
+            ids = self.complete(text)
+            if len(ids) == 1:
+                return self._result(ids.pop(), "prefix")
+        return None
+
+    def phrases(self):
+        """Return {term: canonical name} for every name and alias that may match inside a sentence."""
+        return {term: self.names[location_id] for term, (location_id, _) in self.terms.items()}
+
+    def location_id(self, raw):
+        """Return the canonical id of raw, or UNKNOWN_LOCATION_ID."""
+        resolved = self.resolve(raw)
+        return resolved.id if resolved else UNKNOWN_LOCATION_ID
+
+    def stats(self):
+        """Return memoization counters."""
+        return self._cache.stats()
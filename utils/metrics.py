@@ -0,0 +1,279 @@
+"""
+Process-local metrics in the Prometheus text exposition format.
+
+Counters and histograms are kept in memory and served over HTTP by
+start_metrics_server(), on a port separate from the action server. With
+METRICS_ENABLED set, the endpoint starts with the first instrumented action:
+
+    METRICS_ENABLED=true rasa run actions
+    curl http://localhost:9095/metrics
+"""
+import os
+import time
+import bisect
+import asyncio
+import logging
+import functools
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+# Serve the metrics endpoint from the action server process
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "false").lower() in ("1", "true", "yes")
+
+# Address and port of the metrics endpoint; loopback only unless exposed on purpose, port 0 picks a free one
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9095"))
+
+# Histogram bucket upper bounds in seconds, from cache lookups up to slow Gemini calls
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def _format_labels(names, values, extra=None):
+    pairs = list(zip(names, values)) + list(extra or [])
+    if not pairs:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonically increasing count, one series per label combination."""
+
+    kind = "counter"
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(str(labels.get(name, "")) for name in self.label_names)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(tuple(str(labels.get(name, "")) for name in self.label_names), 0)
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+
+
+class Histogram:
+    """Distribution of observed values in cumulative buckets, one series per label combination."""
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labels=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(str(labels.get(name, "")) for name in self.label_names)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                # Per-bucket counts (last slot is +Inf), sum, count
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the wall-clock duration of the with-block."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels):
+        series = self._series.get(tuple(str(labels.get(name, "")) for name in self.label_names))
+        return series[2] if series else 0
+
+    def samples(self):
+        with self._lock:
+            items = sorted((key, (list(counts), total, count)) for key, (counts, total, count) in self._series.items())
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.label_names, key, [("le", _format_value(bound))])
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.label_names, key)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {count}"
+
+
+class Registry:
+    """Set of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name, documentation, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, **kwargs)
+            return metric
+
+    def counter(self, name, documentation, labels=()):
+        """Return the counter called name, creating it on first use."""
+        return self._register(Counter, name, documentation, labels=labels)
+
+    def histogram(self, name, documentation, labels=(), buckets=DEFAULT_BUCKETS):
+        """Return the histogram called name, creating it on first use."""
+        return self._register(Histogram, name, documentation, labels=labels, buckets=buckets)
+
+    def render(self):
+        """Return every metric in the Prometheus text format."""
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+ACTION_DURATION = REGISTRY.histogram(
+    "asha_action_duration_seconds", "Time spent running custom actions and form validators",
+    labels=("action", "step"))
+ACTION_ERRORS = REGISTRY.counter(
+    "asha_action_errors_total", "Custom action runs that raised an exception",
+    labels=("action", "step"))
+TIER_DURATION = REGISTRY.histogram(
+    "asha_job_search_tier_duration_seconds", "Time spent in each job-search tier",
+    labels=("tier",))
+TIER_SERVED = REGISTRY.counter(
+    "asha_job_search_served_total", "Job searches answered by each tier",
+    labels=("tier",))
+CACHE_LOOKUPS = REGISTRY.counter(
+    "asha_cache_lookups_total", "Cache lookups by cache and outcome",
+    labels=("cache", "result"))
+CACHE_DURATION = REGISTRY.histogram(
+    "asha_cache_lookup_duration_seconds", "Time spent looking up each cache",
+    labels=("cache",))
+RATE_LIMIT_OUTCOMES = REGISTRY.counter(
+    "asha_gemini_rate_limit_total", "Gemini calls by rate-limiter outcome",
+    labels=("outcome",))
+
+
+def instrument_action(method):
+    """
+    Record the latency and failures of an action's run method or a form validator.
+
+    Works for both plain and async methods; the step label is the method name.
+    The first call starts the metrics endpoint if it is enabled.
+    """
+    step = method.__name__
+
+    def action_name(self):
+        try:
+            return self.name()
+        except Exception:
+            return type(self).__name__
+
+    if asyncio.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            ensure_metrics_server()
+            name = action_name(self)
+            started = time.perf_counter()
+            try:
+                return await method(self, *args, **kwargs)
+            except Exception:
+                ACTION_ERRORS.inc(action=name, step=step)
+                raise
+            finally:
+                ACTION_DURATION.observe(time.perf_counter() - started, action=name, step=step)
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        ensure_metrics_server()
+        name = action_name(self)
+        started = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        except Exception:
+            ACTION_ERRORS.inc(action=name, step=step)
+            raise
+        finally:
+            ACTION_DURATION.observe(time.perf_counter() - started, action=name, step=step)
+    return wrapper
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scrapes every few seconds would drown out the action server's own log
+        pass
+
+
+_metrics_server = None
+_metrics_requested = False
+
+
+def ensure_metrics_server():
+    """Start the metrics endpoint once if METRICS_ENABLED is set; later calls do nothing."""
+    global _metrics_requested
+    if METRICS_ENABLED and not _metrics_requested:
+        _metrics_requested = True
+        start_metrics_server()
+
+
+def start_metrics_server(port=METRICS_PORT, host=METRICS_HOST):
+    """
+    Serve /metrics from a daemon thread (once per process).
+
+    Returns:
+        ThreadingHTTPServer: The running server, or None if the port is taken
+    """
+    global _metrics_server
+    if _metrics_server is not None:
+        return _metrics_server
+    try:
+        _metrics_server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    except OSError as e:
+        # e.g. a second worker on the same host; that worker's metrics are simply not exposed
+        logger.warning(f"Could not start metrics endpoint on port {port}: {str(e)}")
+        return None
+    thread = threading.Thread(target=_metrics_server.serve_forever, name="metrics-server", daemon=True)
+    thread.start()
+    logger.info(f"Metrics available at http://{host}:{_metrics_server.server_address[1]}/metrics")
+    return _metrics_server
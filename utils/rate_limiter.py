@@ -0,0 +1,226 @@
+import os
+import time
+import asyncio
+import sqlite3
+import logging
+import threading
+
+from .metrics import RATE_LIMIT_OUTCOMES
+
+logger = logging.getLogger(__name__)
+
+# Gemini requests allowed per minute across all worker processes, and the burst size
+GEMINI_RATE_LIMIT = float(os.getenv("GEMINI_RATE_LIMIT", "15"))
+GEMINI_RATE_BURST = float(os.getenv("GEMINI_RATE_BURST", "5"))
+
+# Longest a call may queue for a token before it falls back instead, in seconds
+GEMINI_RATE_MAX_WAIT = float(os.getenv("GEMINI_RATE_MAX_WAIT", "2"))
+
+# Tokens background work such as cache warming must leave in the bucket for user searches
+GEMINI_RATE_BACKGROUND_RESERVE = float(os.getenv("GEMINI_RATE_BACKGROUND_RESERVE", "2"))
+
+# SQLite file holding the shared bucket; leave unset to limit each process separately
+GEMINI_RATE_LIMIT_DB = os.getenv("GEMINI_RATE_LIMIT_DB", "")
+
+
+class RateLimitExceeded(Exception):
+    """A Gemini call was turned away by the local rate limiter; Gemini itself was not asked."""
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter, optionally shared between processes through SQLite.
+
+    Tokens refill continuously at `rate` per second up to `capacity`. A call
+    that finds the bucket empty reserves the next token ahead of time (the
+    balance goes negative), so concurrent waiters are served in order.
+    """
+
+    def __init__(self, rate, capacity, db_path="", name="gemini"):
+        """
+        Args:
+            rate (float): Tokens added per second
+            capacity (float): Maximum tokens held, i.e. the burst size
+            db_path (str, optional): SQLite file shared by all processes; falsy keeps the bucket in memory
+            name (str): Bucket name, so several limiters can share one database
+        """
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self.name = name
+        self.db_path = db_path
+        self._tokens = self.capacity
+        self._updated_at = time.time()
+        self._lock = threading.Lock()
+
+        if db_path:
+            with self._connect() as db:
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS rate_limit ("
+                    "name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+                )
+                db.execute(
+                    "INSERT OR IGNORE INTO rate_limit (name, tokens, updated_at) VALUES (?, ?, ?)",
+                    (name, self.capacity, time.time())
+                )
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=5)
+
+    def _take(self, tokens, updated_at, now, max_wait, keep):
+        """Apply one reservation to a bucket state; returns (wait, tokens)."""
+        tokens = min(self.capacity, tokens + (now - updated_at) * self.rate)
+        wait = max(0.0, (1.0 + keep - tokens) / self.rate)
+        if wait > max_wait:
+            return None, tokens
+        return wait, tokens - 1.0
+
+    def reserve(self, max_wait=0.0, keep=0.0):
+        """
+        Reserve one token.
+
+        Args:
+            max_wait (float): Longest wait accepted, in seconds
+            keep (float): Tokens that must remain after this one is taken, so
+                low-priority callers cannot use up the burst left for others
+
+        Returns:
+            float: Seconds to wait before using the token, or None if the wait
+            would exceed max_wait (nothing is reserved then)
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.time()
+            if not self.db_path:
+                wait, self._tokens = self._take(self._tokens, self._updated_at, now, max_wait, keep)
+                self._updated_at = now
+                return wait
+
+            db = self._connect()
+            try:
+                db.isolation_level = None
+                # Serializes the read-modify-write across processes
+                db.execute("BEGIN IMMEDIATE")
+                tokens, updated_at = db.execute(
+                    "SELECT tokens, updated_at FROM rate_limit WHERE name = ?", (self.name,)
+                ).fetchone()
+                wait, tokens = self._take(tokens, updated_at, now, max_wait, keep)
+                db.execute(
+                    "UPDATE rate_limit SET tokens = ?, updated_at = ? WHERE name = ?",
+                    (tokens, now, self.name)
+                )
+                db.execute("COMMIT")
+                return wait
+            finally:
+                db.close()
+
+    def drain(self):
+        """Empty the bucket, e.g. after the upstream reported its quota exhausted."""
+        with self._lock:
+            now = time.time()
+            if not self.db_path:
+                self._tokens = min(self._tokens, 0.0)
+                self._updated_at = now
+                return
+            with self._connect() as db:
+                db.execute(
+                    "UPDATE rate_limit SET tokens = MIN(tokens, 0), updated_at = ? WHERE name = ?",
+                    (now, self.name)
+                )
+
+
+class GeminiRateLimiter:
+    """Queue Gemini calls on a token bucket up to a deadline and count the outcomes."""
+
+    def __init__(self, bucket=None, max_wait=GEMINI_RATE_MAX_WAIT,
+                 background_reserve=GEMINI_RATE_BACKGROUND_RESERVE):
+        """
+        Args:
+            bucket (TokenBucket, optional): Bucket to draw from; defaults to one
+                built from the GEMINI_RATE_* settings
+            max_wait (float): Longest a call may queue before it is rejected
+            background_reserve (float): Tokens background calls leave for users
+        """
+        if bucket is None:
+            bucket = TokenBucket(GEMINI_RATE_LIMIT / 60.0, GEMINI_RATE_BURST, GEMINI_RATE_LIMIT_DB)
+        self.bucket = bucket
+        self.max_wait = max_wait
+        self.background_reserve = background_reserve
+        self.allowed = 0
+        self.queued = 0
+        self.rejected = 0
+        self.deferred = 0
+        self.throttled = 0
+
+    async def acquire(self, max_wait=None, background=False):
+        """
+        Wait for permission to call Gemini.
+
+        Background calls never queue and only go ahead while more than
+        background_reserve tokens are left, so they cannot delay a user.
+
+        Returns:
+            bool: True once the call may go ahead, False if the wait would
+            exceed max_wait and the caller should fall back right away
+        """
+        max_wait = self.max_wait if max_wait is None else max_wait
+        keep = 0.0
+        if background:
+            max_wait, keep = 0.0, self.background_reserve
+        try:
+            if self.bucket.db_path:
+                # SQLite may block for seconds on the shared lock; keep it off the event loop
+                loop = asyncio.get_running_loop()
+                wait = await loop.run_in_executor(None, self.bucket.reserve, max_wait, keep)
+            else:
+                wait = self.bucket.reserve(max_wait, keep)
+        except sqlite3.Error as e:
+            # A broken shared store must not take job search down with it
+            logger.error(f"Rate limiter store unavailable: {str(e)}")
+            wait = 0.0
+
+        if wait is None and background:
+            self.deferred += 1
+            RATE_LIMIT_OUTCOMES.inc(outcome="deferred")
+            return False
+        if wait is None:
+            self.rejected += 1
+            RATE_LIMIT_OUTCOMES.inc(outcome="rejected")
+            return False
+        if wait > 0:
+            self.queued += 1
+            RATE_LIMIT_OUTCOMES.inc(outcome="queued")
+            await asyncio.sleep(wait)
+        self.allowed += 1
+        RATE_LIMIT_OUTCOMES.inc(outcome="allowed")
+        return True
+
+    def record_throttled(self):
+        """Count a quota error from Gemini and stop sending until the bucket refills."""
+        self.throttled += 1
+        RATE_LIMIT_OUTCOMES.inc(outcome="throttled")
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None and self.bucket.db_path:
+            loop.run_in_executor(None, self._drain)
+        else:
+            self._drain()
+
+    def _drain(self):
+        try:
+            self.bucket.drain()
+        except sqlite3.Error as e:
+            logger.error(f"Rate limiter store unavailable: {str(e)}")
+
+    def stats(self):
+        """Return outcome counters."""
+        return {
+            "allowed": self.allowed,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "deferred": self.deferred,
+            "throttled": self.throttled
+        }
@@ -0,0 +1,59 @@
+import asyncio
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent async calls that share a key into a single in-flight call.
+
+    The first caller for a key starts the work; callers arriving while it is
+    still running await the same task and receive its result or its error.
+    Once the task finishes the key is released, so later calls start fresh.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key, func, *args, **kwargs):
+        """
+        Run func(*args, **kwargs) unless a call with the same key is already running.
+
+        Args:
+            key: Hashable identifier of the work, e.g. a normalized query tuple
+            func: Async callable (or callable returning an awaitable)
+
+        Returns:
+            The result of the shared call.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            self._calls[key] = task
+            task.add_done_callback(lambda done, key=key: self._release(key, done))
+        else:
+            self.coalesced += 1
+
+        # Shield so one cancelled caller does not cancel the work for everyone else
+        return await asyncio.shield(task)
+
+    def _release(self, key, task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved; every waiter re-raises it anyway
+        if not task.cancelled():
+            task.exception()
+
+    def in_flight(self):
+        """Return the number of distinct calls currently running."""
+        return len(self._calls)
+
+    def stats(self):
+        """Return call and coalescing counters."""
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._calls)
+        }
@@ -0,0 +1,183 @@
+import os
+import time
+import asyncio
+import logging
+from collections import namedtuple
+
+from .metrics import TIER_DURATION, TIER_SERVED
+from .rate_limiter import RateLimitExceeded
+
+logger = logging.getLogger(__name__)
+
+# Per-turn latency budget and the share of it Gemini may use, in seconds
+JOB_SEARCH_BUDGET = float(os.getenv("JOB_SEARCH_BUDGET", "4"))
+GEMINI_DEADLINE = float(os.getenv("GEMINI_DEADLINE", "2.5"))
+
+# Consecutive Gemini failures before it is skipped, and seconds before it is probed again
+GEMINI_BREAKER_THRESHOLD = int(os.getenv("GEMINI_BREAKER_THRESHOLD", "3"))
+GEMINI_BREAKER_RESET = float(os.getenv("GEMINI_BREAKER_RESET", "30"))
+
+# Outcome of one tiered search: which tier answered, its jobs, how many
+# matched in total, how long the search took (seconds) and, for the local
+# tier, the full ranking it returned for paging
+TieredResult = namedtuple("TieredResult", ["tier", "jobs", "total", "elapsed", "ranked"], defaults=(None,))
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    Closed: calls go through. After `failure_threshold` consecutive failures
+    it opens and calls are skipped. Once `reset_timeout` seconds have passed a
+    single probe call is let through (half-open); its outcome closes or
+    re-opens the breaker.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=GEMINI_BREAKER_THRESHOLD, reset_timeout=GEMINI_BREAKER_RESET):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+
+    def allow(self):
+        """Return True if a call may be made now."""
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self):
+        """Close the breaker after a successful call."""
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probe_in_flight = False
+
+    def release(self):
+        """Hand back a probe that never reached the upstream, leaving the state as it was."""
+        self._probe_in_flight = False
+
+    def record_failure(self):
+        """Count a failed call, opening the breaker once the threshold is reached."""
+        self.failures += 1
+        self._probe_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(f"Gemini circuit breaker opened after {self.failures} consecutive failures")
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+
+class TieredJobSearch:
+    """
+    Run the job-search tiers against a per-turn latency budget.
+
+    The local index query starts in parallel with Gemini. Gemini's result is
+    preferred if it arrives within its deadline; otherwise the local result
+    is used, and mock data only if neither produced jobs. A timed-out Gemini
+    request keeps running in the background so its result still lands in
+    the cache for the next turn.
+    """
+
+    def __init__(self, remote, local, fallback, budget=JOB_SEARCH_BUDGET,
+                 remote_deadline=GEMINI_DEADLINE, breaker=None):
+        """
+        Args:
+            remote: Async callable (role, location, experience) returning a list
+                of jobs, or None on failure; it raises RateLimitExceeded when
+                throttled locally. None disables the remote tier
+            local: Async callable (role, location, experience, job_type, skill)
+                returning (jobs, total) or (jobs, total, ranked), where ranked
+                lets later pages be fetched without searching again
+            fallback: Callable (role, location) returning a list of mock jobs
+            budget (float): Seconds the whole search may take
+            remote_deadline (float): Seconds Gemini may take within the budget
+            breaker (CircuitBreaker, optional): Breaker guarding the remote tier
+        """
+        self.remote = remote
+        self.local = local
+        self.fallback = fallback
+        self.budget = budget
+        self.remote_deadline = remote_deadline
+        self.breaker = breaker or CircuitBreaker()
+
+    async def _run_remote(self, task, timeout):
+        """Wait for the remote task up to timeout and update the breaker."""
+        try:
+            with TIER_DURATION.time(tier="gemini"):
+                jobs = await asyncio.wait_for(asyncio.shield(task), timeout)
+        except RateLimitExceeded:
+            # Turned away locally; Gemini is not unhealthy, so the breaker is left alone
+            logger.info("Gemini rate limit reached - skipping to the local tier")
+            self.breaker.release()
+            return None
+        except asyncio.CancelledError:
+            # The caller went away, which says nothing about Gemini; free the probe so the breaker can recover
+            self.breaker.release()
+            raise
+        except asyncio.TimeoutError:
+            logger.warning(f"Gemini job search exceeded its {timeout:.1f}s deadline")
+            self.breaker.record_failure()
+            return None
+        except Exception as e:
+            logger.error(f"Error with Gemini API job search: {str(e)}")
+            self.breaker.record_failure()
+            return None
+
+        if jobs is None:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        return jobs
+
+    async def _run_local(self, *args):
+        """Query the local tier, timing it even when its result goes unused."""
+        with TIER_DURATION.time(tier="csv"):
+            return await self.local(*args)
+
+    async def search(self, job_role=None, location=None, experience=None, job_type=None, skill=None):
+        """
+        Search all tiers and return the best result available within the budget.
+
+        Returns:
+            TieredResult: tier is "gemini", "csv" or "mock"
+        """
+        started = time.monotonic()
+        local_task = asyncio.ensure_future(self._run_local(job_role, location, experience, job_type, skill))
+        local_task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+        if self.remote is not None and self.breaker.allow():
+            remote_task = asyncio.ensure_future(self.remote(job_role, location, experience))
+            # Retrieve late errors so an abandoned request does not log "exception never retrieved"
+            remote_task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            jobs = await self._run_remote(remote_task, min(self.remote_deadline, self.budget))
+            if jobs:
+                TIER_SERVED.inc(tier="gemini")
+                return TieredResult("gemini", jobs, len(jobs), time.monotonic() - started)
+        elif self.remote is not None:
+            logger.info("Gemini circuit breaker is open - skipping Gemini tier")
+
+        remaining = max(self.budget - (time.monotonic() - started), 0.0)
+        try:
+            jobs, total, *ranked = await asyncio.wait_for(asyncio.shield(local_task), remaining)
+            if jobs:
+                TIER_SERVED.inc(tier="csv")
+                return TieredResult("csv", jobs, total, time.monotonic() - started, *ranked)
+        except asyncio.TimeoutError:
+            logger.warning("Local job index search exceeded the latency budget")
+        except Exception as e:
+            logger.error(f"Error in CSV job search: {str(e)}")
+
+        with TIER_DURATION.time(tier="mock"):
+            jobs = self.fallback(job_role, location)
+        TIER_SERVED.inc(tier="mock")
+        return TieredResult("mock", jobs, len(jobs), time.monotonic() - started)